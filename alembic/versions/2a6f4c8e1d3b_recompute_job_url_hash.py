@@ -0,0 +1,117 @@
+"""recompute url_hash with route fragments and ref kept
+
+c7d2e8f1a9b0 hashed URLs with ``ref`` and every fragment stripped; the
+canonicalizer now keeps both ``ref`` and client-side route fragments
+(``#/...``, ``#!...``). Hashes stored under the old rules no longer match
+the ones ``save()`` computes, so ``ON CONFLICT (url_hash)`` would let repeat
+postings through. Every hash is recomputed here, oldest row first; rows
+whose canonical URL collides with an older row are left with a NULL
+url_hash and drop out of dedupe.
+
+Revision ID: 2a6f4c8e1d3b
+Revises: 5b8d0e2f4a6c
+Create Date: 2026-10-17 20:00:00.000000
+
+"""
+import hashlib
+import logging
+from typing import Sequence, Union
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = '2a6f4c8e1d3b'
+down_revision: Union[str, Sequence[str], None] = '5b8d0e2f4a6c'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+BACKFILL_BATCH = 1000
+
+logger = logging.getLogger('alembic.runtime.migration')
+
+# Frozen copy of app.utils.urls as of this revision.
+TRACKING_PARAMS = {
+    'fbclid', 'gclid', 'msclkid', 'dclid', 'yclid', 'mc_cid', 'mc_eid',
+    '_hsenc', '_hsmi', 'referrer', 'ref_src',
+}
+DEFAULT_PORTS = {'http': 80, 'https': 443}
+ROUTE_FRAGMENT_PREFIXES = ('/', '!')
+
+
+def _canonicalize_url(url: str) -> str:
+    url = url.strip()
+    try:
+        parts = urlsplit(url)
+        port = parts.port
+    except ValueError:
+        return url
+    if parts.scheme.lower() not in DEFAULT_PORTS or not parts.hostname:
+        return url
+
+    host = parts.hostname.lower()
+    if port and port != DEFAULT_PORTS[parts.scheme.lower()]:
+        host = f'{host}:{port}'
+
+    query = sorted(
+        (key, value)
+        for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if not key.lower().startswith('utm_') and key.lower() not in TRACKING_PARAMS
+    )
+    fragment = parts.fragment if parts.fragment.startswith(ROUTE_FRAGMENT_PREFIXES) else ''
+    return urlunsplit(('https', host, parts.path.rstrip('/'), urlencode(query), fragment))
+
+
+def url_hash(url: str) -> bytes:
+    return hashlib.blake2b(_canonicalize_url(url).encode('utf-8'), digest_size=16).digest()
+
+
+def upgrade() -> None:
+    conn = op.get_bind()
+    jobs = sa.table(
+        'jobs',
+        sa.column('id', postgresql.UUID(as_uuid=True)),
+        sa.column('url', sa.String()),
+        sa.column('created_at', sa.DateTime(timezone=True)),
+        sa.column('url_hash', sa.LargeBinary()),
+    )
+    # Clear first so the unique index never sees a new hash that an
+    # unprocessed row still holds under the old rules.
+    conn.execute(jobs.update().values(url_hash=None))
+
+    update = (
+        jobs.update()
+        .where(jobs.c.id == sa.bindparam('b_id'))
+        .values(url_hash=sa.bindparam('b_hash'))
+    )
+    rows = conn.execute(
+        sa.select(jobs.c.id, jobs.c.url)
+        .order_by(jobs.c.created_at, jobs.c.id)
+        .execution_options(yield_per=BACKFILL_BATCH)
+    )
+    seen: set[bytes] = set()
+    collisions = 0
+    for batch in rows.partitions():
+        params = []
+        for row in batch:
+            digest = url_hash(row.url)
+            if digest in seen:
+                collisions += 1
+                continue
+            seen.add(digest)
+            params.append({'b_id': row.id, 'b_hash': digest})
+        if params:
+            conn.execute(update, params)
+    if collisions:
+        logger.warning(
+            'url_hash recompute: %d rows share a canonical URL with an older row and were '
+            'left NULL (no longer deduplicated)',
+            collisions,
+        )
+
+
+def downgrade() -> None:
+    # The old hashes cannot be told apart from the new ones; they are kept.
+    pass
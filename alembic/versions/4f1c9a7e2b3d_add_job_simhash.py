@@ -0,0 +1,120 @@
+"""add simhash fingerprint and canonical_job_id to jobs
+
+Revision ID: 4f1c9a7e2b3d
+Revises: 8359ce75492f
+Create Date: 2026-10-17 12:00:00.000000
+
+"""
+import hashlib
+import re
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = '4f1c9a7e2b3d'
+down_revision: Union[str, Sequence[str], None] = '8359ce75492f'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+BACKFILL_BATCH = 1000
+
+# Frozen copy of app.utils.simhash as of this revision, so later changes to
+# the live fingerprint never change what this migration computes.
+BITS = 64
+BANDS = 4
+BAND_BITS = BITS // BANDS
+MAX_TEXT = 5000
+SHINGLE = 2
+_WORD_RE = re.compile(r'\w+')
+
+
+def _feature_hash(feature: str) -> str:
+    digest = hashlib.blake2b(feature.encode('utf-8'), digest_size=8).digest()
+    return f'{int.from_bytes(digest, "big"):064b}'
+
+
+def _simhash(text: str) -> int:
+    words = _WORD_RE.findall(text.lower())
+    if len(words) >= SHINGLE:
+        features = {' '.join(words[i : i + SHINGLE]) for i in range(len(words) - SHINGLE + 1)}
+    else:
+        features = set(words)
+    if not features:
+        return 0
+    counts = [column.count('1') for column in zip(*map(_feature_hash, features))]
+    half = len(features) / 2
+    return int(''.join('1' if c > half else '0' for c in counts), 2)
+
+
+def _job_simhash(title: str, company: str, description: str) -> int:
+    value = _simhash(f'{title} {company} {description[:MAX_TEXT]}')
+    return value - (1 << BITS) if value >= 1 << (BITS - 1) else value  # signed BIGINT
+
+
+def _bands(value: int) -> list[int]:
+    value &= (1 << BITS) - 1
+    mask = (1 << BAND_BITS) - 1
+    return [(i << BAND_BITS) | ((value >> (i * BAND_BITS)) & mask) for i in range(BANDS)]
+
+
+def upgrade() -> None:
+    op.add_column('jobs', sa.Column('simhash', sa.BigInteger(), nullable=True))
+    op.add_column(
+        'jobs', sa.Column('simhash_bands', postgresql.ARRAY(sa.Integer()), nullable=True)
+    )
+    op.add_column(
+        'jobs', sa.Column('canonical_job_id', postgresql.UUID(as_uuid=True), nullable=True)
+    )
+    op.create_foreign_key(
+        'fk_jobs_canonical_job_id', 'jobs', 'jobs', ['canonical_job_id'], ['id'],
+        ondelete='SET NULL',
+    )
+    op.create_index('ix_jobs_canonical_job_id', 'jobs', ['canonical_job_id'])
+
+    # Fingerprint existing jobs so new postings can be matched against history
+    # (existing rows are not linked to each other). Rows are read in keyset
+    # pages by id, with only the part of the description that is hashed.
+    conn = op.get_bind()
+    jobs = sa.table(
+        'jobs',
+        sa.column('id', postgresql.UUID(as_uuid=True)),
+        sa.column('title', sa.String()),
+        sa.column('company', sa.String()),
+        sa.column('description', sa.Text()),
+        sa.column('simhash', sa.BigInteger()),
+        sa.column('simhash_bands', postgresql.ARRAY(sa.Integer())),
+    )
+    description = sa.func.substr(jobs.c.description, 1, MAX_TEXT).label('description')
+    last_id = None
+    while True:
+        query = sa.select(jobs.c.id, jobs.c.title, jobs.c.company, description)
+        if last_id is not None:
+            query = query.where(jobs.c.id > last_id)
+        rows = conn.execute(query.order_by(jobs.c.id).limit(BACKFILL_BATCH)).all()
+        if not rows:
+            break
+        last_id = rows[-1].id
+        params = []
+        for row in rows:
+            fingerprint = _job_simhash(row.title, row.company, row.description or '')
+            params.append({'b_id': row.id, 'b_hash': fingerprint, 'b_bands': _bands(fingerprint)})
+        conn.execute(
+            jobs.update()
+            .where(jobs.c.id == sa.bindparam('b_id'))
+            .values(simhash=sa.bindparam('b_hash'), simhash_bands=sa.bindparam('b_bands')),
+            params,
+        )
+
+    op.create_index('ix_jobs_simhash_bands', 'jobs', ['simhash_bands'], postgresql_using='gin')
+
+
+def downgrade() -> None:
+    op.drop_index('ix_jobs_simhash_bands', table_name='jobs')
+    op.drop_index('ix_jobs_canonical_job_id', table_name='jobs')
+    op.drop_constraint('fk_jobs_canonical_job_id', 'jobs', type_='foreignkey')
+    op.drop_column('jobs', 'canonical_job_id')
+    op.drop_column('jobs', 'simhash_bands')
+    op.drop_column('jobs', 'simhash')
@@ -0,0 +1,29 @@
+"""add clean_html memo counters to collection_runs
+
+Revision ID: 5b8d0e2f4a6c
+Revises: e3a5b7c9d1f2
+Create Date: 2026-10-17 18:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '5b8d0e2f4a6c'
+down_revision: Union[str, Sequence[str], None] = 'e3a5b7c9d1f2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('collection_runs', sa.Column('html_memo_hits', sa.Integer(), server_default=sa.text('0'), nullable=False))
+    op.add_column('collection_runs', sa.Column('html_memo_misses', sa.Integer(), server_default=sa.text('0'), nullable=False))
+    op.add_column('collection_runs', sa.Column('html_memo_bytes_saved', sa.BigInteger(), server_default=sa.text('0'), nullable=False))
+
+
+def downgrade() -> None:
+    op.drop_column('collection_runs', 'html_memo_bytes_saved')
+    op.drop_column('collection_runs', 'html_memo_misses')
+    op.drop_column('collection_runs', 'html_memo_hits')
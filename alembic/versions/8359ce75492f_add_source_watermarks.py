@@ -0,0 +1,33 @@
+"""add source_watermarks table
+
+Revision ID: 8359ce75492f
+Revises: a1b2c3d4e5f6
+Create Date: 2026-10-17 09:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = '8359ce75492f'
+down_revision: Union[str, Sequence[str], None] = 'a1b2c3d4e5f6'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'source_watermarks',
+        sa.Column('source', sa.String(50), nullable=False),
+        sa.Column('newest_posted_at', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('seen_urls', postgresql.ARRAY(sa.String()), nullable=True),
+        sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+        sa.PrimaryKeyConstraint('source'),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('source_watermarks')
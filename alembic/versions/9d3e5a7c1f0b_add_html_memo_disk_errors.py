@@ -0,0 +1,30 @@
+"""add clean_html memo disk error counter to collection_runs
+
+Revision ID: 9d3e5a7c1f0b
+Revises: 2a6f4c8e1d3b
+Create Date: 2026-10-17 21:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '9d3e5a7c1f0b'
+down_revision: Union[str, Sequence[str], None] = '2a6f4c8e1d3b'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        'collection_runs',
+        sa.Column(
+            'html_memo_disk_errors', sa.Integer(), server_default=sa.text('0'), nullable=False
+        ),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column('collection_runs', 'html_memo_disk_errors')
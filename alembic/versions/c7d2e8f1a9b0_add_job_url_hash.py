@@ -0,0 +1,114 @@
+"""add url_hash dedupe key to jobs
+
+Rows whose canonical URL collides with an older row are left with a NULL
+url_hash: they stay readable but drop out of dedupe (``ON CONFLICT``).
+
+Revision ID: c7d2e8f1a9b0
+Revises: 4f1c9a7e2b3d
+Create Date: 2026-10-17 14:00:00.000000
+
+"""
+import hashlib
+import logging
+from typing import Sequence, Union
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = 'c7d2e8f1a9b0'
+down_revision: Union[str, Sequence[str], None] = '4f1c9a7e2b3d'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+BACKFILL_BATCH = 1000
+
+logger = logging.getLogger('alembic.runtime.migration')
+
+# Frozen copy of app.utils.urls as of this revision (it dropped ``ref`` and
+# every fragment); 2a6f4c8e1d3b recomputes hashes with the later rules.
+TRACKING_PARAMS = {
+    'fbclid', 'gclid', 'msclkid', 'dclid', 'yclid', 'mc_cid', 'mc_eid',
+    '_hsenc', '_hsmi', 'ref', 'referrer', 'ref_src',
+}
+DEFAULT_PORTS = {'http': 80, 'https': 443}
+
+
+def _canonicalize_url(url: str) -> str:
+    url = url.strip()
+    try:
+        parts = urlsplit(url)
+        port = parts.port
+    except ValueError:
+        return url
+    if parts.scheme.lower() not in DEFAULT_PORTS or not parts.hostname:
+        return url
+
+    host = parts.hostname.lower()
+    if port and port != DEFAULT_PORTS[parts.scheme.lower()]:
+        host = f'{host}:{port}'
+
+    query = sorted(
+        (key, value)
+        for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if not key.lower().startswith('utm_') and key.lower() not in TRACKING_PARAMS
+    )
+    return urlunsplit(('https', host, parts.path.rstrip('/'), urlencode(query), ''))
+
+
+def url_hash(url: str) -> bytes:
+    return hashlib.blake2b(_canonicalize_url(url).encode('utf-8'), digest_size=16).digest()
+
+
+def upgrade() -> None:
+    op.add_column('jobs', sa.Column('url_hash', sa.LargeBinary(16), nullable=True))
+
+    # Hash the canonical form of every stored URL. When several rows collapse
+    # to the same canonical URL the oldest keeps the hash; the others stay
+    # NULL (they remain readable but no longer take part in dedupe).
+    conn = op.get_bind()
+    jobs = sa.table(
+        'jobs',
+        sa.column('id', postgresql.UUID(as_uuid=True)),
+        sa.column('url', sa.String()),
+        sa.column('created_at', sa.DateTime(timezone=True)),
+        sa.column('url_hash', sa.LargeBinary()),
+    )
+    rows = conn.execute(
+        sa.select(jobs.c.id, jobs.c.url).order_by(jobs.c.created_at, jobs.c.id)
+    ).all()
+    seen: set[bytes] = set()
+    params = []
+    collisions = 0
+    for row in rows:
+        digest = url_hash(row.url)
+        if digest in seen:
+            collisions += 1
+            continue
+        seen.add(digest)
+        params.append({'b_id': row.id, 'b_hash': digest})
+
+    update = (
+        jobs.update()
+        .where(jobs.c.id == sa.bindparam('b_id'))
+        .values(url_hash=sa.bindparam('b_hash'))
+    )
+    for start in range(0, len(params), BACKFILL_BATCH):
+        conn.execute(update, params[start : start + BACKFILL_BATCH])
+    if collisions:
+        logger.warning(
+            'url_hash backfill: %d rows share a canonical URL with an older row and were '
+            'left NULL (no longer deduplicated)',
+            collisions,
+        )
+
+    op.create_index('ix_jobs_url_hash', 'jobs', ['url_hash'], unique=True)
+    op.drop_constraint('jobs_url_key', 'jobs', type_='unique')
+
+
+def downgrade() -> None:
+    op.create_unique_constraint('jobs_url_key', 'jobs', ['url'])
+    op.drop_index('ix_jobs_url_hash', table_name='jobs')
+    op.drop_column('jobs', 'url_hash')
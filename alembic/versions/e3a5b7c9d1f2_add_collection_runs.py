@@ -0,0 +1,53 @@
+"""add collection_runs telemetry table
+
+Revision ID: e3a5b7c9d1f2
+Revises: c7d2e8f1a9b0
+Create Date: 2026-10-17 16:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = 'e3a5b7c9d1f2'
+down_revision: Union[str, Sequence[str], None] = 'c7d2e8f1a9b0'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'collection_runs',
+        sa.Column('id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('run_id', sa.String(40), nullable=False),
+        sa.Column('source', sa.String(50), nullable=False),
+        sa.Column('status', sa.String(20), nullable=False),
+        sa.Column('replayed', sa.Boolean(), server_default=sa.text('false'), nullable=False),
+        sa.Column('started_at', sa.DateTime(timezone=True), nullable=False),
+        sa.Column('finished_at', sa.DateTime(timezone=True), nullable=False),
+        sa.Column('duration_seconds', sa.Float(), nullable=False),
+        sa.Column('fetch_seconds', sa.Float(), server_default=sa.text('0'), nullable=False),
+        sa.Column('normalize_seconds', sa.Float(), server_default=sa.text('0'), nullable=False),
+        sa.Column('save_seconds', sa.Float(), server_default=sa.text('0'), nullable=False),
+        sa.Column('requests', sa.Integer(), server_default=sa.text('0'), nullable=False),
+        sa.Column('bytes_downloaded', sa.BigInteger(), server_default=sa.text('0'), nullable=False),
+        sa.Column('raw_count', sa.Integer(), server_default=sa.text('0'), nullable=False),
+        sa.Column('normalized_count', sa.Integer(), server_default=sa.text('0'), nullable=False),
+        sa.Column('inserted_count', sa.Integer(), server_default=sa.text('0'), nullable=False),
+        sa.Column('error_count', sa.Integer(), server_default=sa.text('0'), nullable=False),
+        sa.Column('error', sa.Text(), nullable=True),
+        sa.PrimaryKeyConstraint('id'),
+    )
+    op.create_index('ix_collection_runs_run_id', 'collection_runs', ['run_id'])
+    op.create_index('ix_collection_runs_source', 'collection_runs', ['source'])
+    op.create_index('ix_collection_runs_started_at', 'collection_runs', ['started_at'])
+
+
+def downgrade() -> None:
+    op.drop_index('ix_collection_runs_started_at', table_name='collection_runs')
+    op.drop_index('ix_collection_runs_source', table_name='collection_runs')
+    op.drop_index('ix_collection_runs_run_id', table_name='collection_runs')
+    op.drop_table('collection_runs')
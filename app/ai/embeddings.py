@@ -43,12 +43,14 @@ def embed_batch(texts: list[str]) -> list[list[float]]:
 def embed_new_jobs(db: Session, limit: int = 200) -> int:
     """Generate embeddings for jobs that don't have them yet.
 
+    Near-duplicates of another job (``canonical_job_id`` set) are skipped.
+
     Returns:
         Number of jobs embedded.
     """
     jobs = (
         db.query(Job)
-        .filter(Job.embedding.is_(None))
+        .filter(Job.embedding.is_(None), Job.canonical_job_id.is_(None))
         .order_by(Job.scraped_at.desc())
         .limit(limit)
         .all()
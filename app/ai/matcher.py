@@ -8,25 +8,10 @@ from sqlalchemy.orm import Session
 
 from app.ai.embeddings import embed_text
 from app.models import Job, UserProfile
+from app.utils.skills import get_skill_taxonomy
 
 logger = structlog.get_logger(__name__)
 
-# Skill aliases for fuzzy matching
-SKILL_ALIASES = {
-    "ruby on rails": ["rails", "ruby", "ror"],
-    "golang": ["go"],
-    "go": ["golang"],
-    "react": ["reactjs", "react.js"],
-    "node.js": ["nodejs", "node"],
-    "next.js": ["nextjs", "next"],
-    "postgresql": ["postgres", "psql"],
-    "typescript": ["ts"],
-    "javascript": ["js"],
-    "python": ["py"],
-    "kubernetes": ["k8s"],
-    "c#": ["csharp", "dotnet", ".net"],
-}
-
 SENIOR_KEYWORDS = {"senior", "lead", "principal", "staff", "architect", "sr.", "sr "}
 JUNIOR_KEYWORDS = {"junior", "entry", "intern", "jr.", "jr ", "trainee", "graduate"}
 
@@ -70,12 +55,20 @@ class JobMatcher:
         return max(0.0, min(40.0, similarity * 40.0))
 
     def _skills_score(self, job: Job) -> float:
-        """Compute skills match (0-30 points)."""
+        """Compute skills match (0-30 points).
+
+        A profile skill named in the job (text or tags) scores 1; the same
+        canonical skill under another name (e.g. "golang" vs "Go") or a
+        related skill (".NET" for "C#") scores 0.7. Skills outside the
+        taxonomy fall back to a substring check.
+        """
         if not self._profile or not self._profile.primary_skills:
             return 15.0
 
+        taxonomy = get_skill_taxonomy()
         job_text = f"{job.title} {job.description or ''} {job.requirements or ''}".lower()
-        job_tags = set(t.lower() for t in (job.tags or []))
+        job_terms = taxonomy.find_terms(job_text) | {t.lower() for t in (job.tags or [])}
+        job_skills = {taxonomy.canonical(t) or t for t in job_terms}
 
         profile_skills = [s.lower() for s in self._profile.primary_skills]
         matched = 0
@@ -83,16 +76,20 @@ class JobMatcher:
 
         for skill in profile_skills:
             # Exact match in text or tags
-            if skill in job_text or skill in job_tags:
+            if skill in job_terms:
                 matched += 1
                 continue
 
-            # Check aliases
-            aliases = SKILL_ALIASES.get(skill, [])
-            if any(a in job_text or a in job_tags for a in aliases):
-                matched += 0.7
+            skill_id = taxonomy.canonical(skill)
+            if skill_id is None:
+                if skill in job_text:
+                    matched += 1
                 continue
 
+            # Same skill under an alias, or a related skill
+            if skill_id in job_skills or taxonomy.related(skill_id) & job_skills:
+                matched += 0.7
+
         if total == 0:
             return 15.0
 
@@ -183,7 +180,7 @@ class JobMatcher:
 
 
 def score_new_jobs(db: Session, limit: int = 500) -> int:
-    """Score all unscored jobs in the database.
+    """Score all unscored jobs in the database, skipping near-duplicates.
 
     Returns:
         Number of jobs scored.
@@ -195,7 +192,7 @@ def score_new_jobs(db: Session, limit: int = 500) -> int:
 
     jobs = (
         db.query(Job)
-        .filter(Job.match_score.is_(None))
+        .filter(Job.match_score.is_(None), Job.canonical_job_id.is_(None))
         .order_by(Job.scraped_at.desc())
         .limit(limit)
         .all()
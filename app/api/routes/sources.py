@@ -1,13 +1,13 @@
 """Data source trigger routes."""
 
-import asyncio
-
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Query
 from sqlalchemy.orm import Session
 
-from app.api.schemas import CollectResult
+from app.api.schemas import CollectionRunOut, CollectResult
 from app.database import get_db
+from app.models import CollectionRun
 from app.sources import SOURCE_REGISTRY, get_all_sources, get_source
+from app.sources.orchestrator import run_collection
 
 router = APIRouter(prefix="/sources", tags=["sources"])
 
@@ -18,33 +18,34 @@ def list_sources() -> list[str]:
     return list(SOURCE_REGISTRY.keys())
 
 
+@router.get("/runs", response_model=list[CollectionRunOut])
+def list_runs(
+    source: str | None = None,
+    status: str | None = None,
+    limit: int = Query(default=100, ge=1, le=1000),
+    db: Session = Depends(get_db),
+) -> list[CollectionRun]:
+    """Recent per-source collection run telemetry, newest first."""
+    query = db.query(CollectionRun)
+    if source:
+        query = query.filter(CollectionRun.source == source)
+    if status:
+        query = query.filter(CollectionRun.status == status)
+    return query.order_by(CollectionRun.started_at.desc()).limit(limit).all()
+
+
 @router.post("/collect/{source_name}", response_model=CollectResult)
-def collect_source(source_name: str, db: Session = Depends(get_db)) -> dict:
+def collect_source(source_name: str) -> dict:
     """Trigger collection from a specific source."""
-    source = get_source(source_name)
-    jobs = asyncio.run(source.collect())
-    inserted = source.save(jobs, db) if jobs else 0
-
-    return {"source": source_name, "fetched": len(jobs), "inserted": inserted}
+    result = run_collection([get_source(source_name)])[source_name]
+    return {"source": source_name, "fetched": result["fetched"], "inserted": result["inserted"]}
 
 
 @router.post("/collect-all", response_model=list[CollectResult])
-def collect_all(db: Session = Depends(get_db)) -> list[dict]:
-    """Trigger collection from all sources."""
-    results = []
-    for source in get_all_sources():
-        try:
-            jobs = asyncio.run(source.collect())
-            inserted = source.save(jobs, db) if jobs else 0
-            results.append({
-                "source": source.source_name,
-                "fetched": len(jobs),
-                "inserted": inserted,
-            })
-        except Exception:
-            results.append({
-                "source": source.source_name,
-                "fetched": 0,
-                "inserted": 0,
-            })
-    return results
+def collect_all() -> list[dict]:
+    """Trigger concurrent collection from all sources."""
+    results = run_collection(get_all_sources())
+    return [
+        {"source": name, "fetched": r["fetched"], "inserted": r["inserted"]}
+        for name, r in results.items()
+    ]
@@ -87,6 +87,35 @@ class CollectResult(BaseModel):
     inserted: int
 
 
+class CollectionRunOut(BaseModel):
+    """Per-source performance record of a collection run."""
+
+    id: UUID
+    run_id: str
+    source: str
+    status: str
+    replayed: bool
+    started_at: datetime
+    finished_at: datetime
+    duration_seconds: float
+    fetch_seconds: float
+    normalize_seconds: float
+    save_seconds: float
+    requests: int
+    bytes_downloaded: int
+    raw_count: int
+    normalized_count: int
+    inserted_count: int
+    error_count: int
+    html_memo_hits: int
+    html_memo_misses: int
+    html_memo_bytes_saved: int
+    html_memo_disk_errors: int
+    error: str | None
+
+    model_config = {"from_attributes": True}
+
+
 class ApplicationCreate(BaseModel):
     """Create a new application."""
 
@@ -26,6 +26,63 @@ class Settings(BaseSettings):
     adzuna_api_key: str = ""
     serpapi_key: str = ""
 
+    # Collection
+    collection_deadline_seconds: float = 900.0
+    collection_max_sources: int = 0  # 0 = run every source at once
+    # time for cancelled sources to save what they have
+    collection_cancel_grace_seconds: float = 60.0
+    # consecutive failed runs before a source is skipped; 0 disables
+    circuit_failure_threshold: int = 3
+    circuit_cooldown_seconds: float = 21600.0  # skip time before a failing source is probed again
+    save_chunk_size: int = 500
+    copy_ingest_threshold: int = 5000  # rows; larger batches go through COPY
+    watermark_max_urls: int = 2000  # seen URLs kept per incremental source
+    pipeline_batch_size: int = 500  # jobs per DB flush in the streaming writer
+    pipeline_queue_pages: int = 4  # normalized pages buffered before fetching waits
+    query_concurrency: int = 4  # concurrent searches for Adzuna/Jooble/SerpAPI
+    normalize_pool_workers: int = 4  # 0 disables the process pool
+    normalize_pool_threshold: int = 200  # raw jobs per page before using the pool
+    normalize_pool_chunk_size: int = 100
+    known_url_filter_enabled: bool = True  # skip stored postings before normalizing
+    known_url_filter_error_rate: float = 0.001
+    known_url_filter_redis: bool = True  # keep the filter in Redis between runs
+    near_duplicate_enabled: bool = True  # link cross-source duplicates at save time
+    near_duplicate_distance: int = 3  # max differing SimHash bits (at most 3 with 4 bands)
+    deep_pagination_max_pages: int = 5  # pages per query for Adzuna/Jooble/SerpAPI
+    adzuna_request_budget: int = 100  # requests per run; 0 = unlimited
+    jooble_request_budget: int = 50
+    serpapi_request_budget: int = 25
+
+    # Shared HTTP client
+    http2_enabled: bool = True
+    http_max_connections: int = 100
+    http_max_connections_per_host: int = 6
+    http_keepalive_expiry: float = 30.0
+    http_max_retries: int = 3  # retries after 429/503, honoring Retry-After
+
+    # Conditional-GET validator cache (ETag / Last-Modified)
+    http_cache_path: str = "data/cache/http_validators.json"
+    http_cache_max_entries: int = 1000
+
+    # Redis response cache for paid/quota-limited sources
+    response_cache_enabled: bool = True
+    response_cache_ttl_seconds: int = 3600
+    response_cache_ttls: dict[str, int] = {}  # per-source overrides, e.g. {"serpapi_google": 21600}
+
+    # Raw response archive (offline replay)
+    archive_enabled: bool = True
+    archive_path: str = "data/archive"
+    # runs (and the blobs only they use) older than this are pruned; 0 keeps all
+    archive_retention_days: int = 14
+
+    # clean_html memo (content-hash LRU, optional on-disk store shared between runs)
+    html_memo_size: int = 2000  # cleaned descriptions kept per process; 0 disables
+    html_memo_path: str = "data/cache/html_memo.sqlite"  # empty keeps the memo in memory only
+    html_memo_max_age_days: int = 30  # disk entries older than this are re-cleaned
+
+    # Skill taxonomy (canonical skills, aliases, categories)
+    skill_taxonomy_path: str = ""  # empty uses the bundled app/data/skills.json
+
     # AI
     anthropic_api_key: str = ""
 
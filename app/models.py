@@ -6,12 +6,15 @@ from datetime import datetime
 
 from pgvector.sqlalchemy import Vector
 from sqlalchemy import (
+    BigInteger,
     Boolean,
     DateTime,
     Enum,
     Float,
     ForeignKey,
+    Index,
     Integer,
+    LargeBinary,
     String,
     Text,
     func,
@@ -61,6 +64,9 @@ class Job(Base):
     """A job listing collected from any data source."""
 
     __tablename__ = "jobs"
+    __table_args__ = (
+        Index("ix_jobs_simhash_bands", "simhash_bands", postgresql_using="gin"),
+    )
 
     id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
@@ -73,7 +79,8 @@ class Job(Base):
     salary_currency: Mapped[str] = mapped_column(String(10), default="USD")
     description: Mapped[str] = mapped_column(Text, nullable=False)
     requirements: Mapped[str | None] = mapped_column(Text)
-    url: Mapped[str] = mapped_column(String(500), unique=True, nullable=False)
+    url: Mapped[str] = mapped_column(String(500), nullable=False)
+    url_hash: Mapped[bytes | None] = mapped_column(LargeBinary(16), unique=True, index=True)
     source: Mapped[str | None] = mapped_column(String(50), index=True)
     posted_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True))
     scraped_at: Mapped[datetime] = mapped_column(
@@ -89,6 +96,11 @@ class Job(Base):
         index=True,
     )
     notes: Mapped[str | None] = mapped_column(Text)
+    simhash: Mapped[int | None] = mapped_column(BigInteger)
+    simhash_bands: Mapped[list[int] | None] = mapped_column(ARRAY(Integer))
+    canonical_job_id: Mapped[uuid.UUID | None] = mapped_column(
+        UUID(as_uuid=True), ForeignKey("jobs.id", ondelete="SET NULL"), index=True
+    )
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), server_default=func.now()
     )
@@ -228,3 +240,55 @@ class LearningItem(Base):
 
     def __repr__(self) -> str:
         return f"<LearningItem {self.skill!r}: {self.detail!r}>"
+
+
+class SourceWatermark(Base):
+    """High-water mark of what a source has already delivered, for incremental runs."""
+
+    __tablename__ = "source_watermarks"
+
+    source: Mapped[str] = mapped_column(String(50), primary_key=True)
+    newest_posted_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True))
+    seen_urls: Mapped[list[str] | None] = mapped_column(ARRAY(String))
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), onupdate=func.now()
+    )
+
+    def __repr__(self) -> str:
+        return f"<SourceWatermark {self.source!r} newest={self.newest_posted_at}>"
+
+
+class CollectionRun(Base):
+    """Performance record of one source in one collection run."""
+
+    __tablename__ = "collection_runs"
+
+    id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
+    )
+    run_id: Mapped[str] = mapped_column(String(40), nullable=False, index=True)
+    source: Mapped[str] = mapped_column(String(50), nullable=False, index=True)
+    status: Mapped[str] = mapped_column(String(20), nullable=False)  # ok / error / timeout
+    replayed: Mapped[bool] = mapped_column(Boolean, default=False)
+    started_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False, index=True
+    )
+    finished_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    duration_seconds: Mapped[float] = mapped_column(Float, nullable=False)
+    fetch_seconds: Mapped[float] = mapped_column(Float, default=0.0)
+    normalize_seconds: Mapped[float] = mapped_column(Float, default=0.0)
+    save_seconds: Mapped[float] = mapped_column(Float, default=0.0)
+    requests: Mapped[int] = mapped_column(Integer, default=0)
+    bytes_downloaded: Mapped[int] = mapped_column(BigInteger, default=0)
+    raw_count: Mapped[int] = mapped_column(Integer, default=0)
+    normalized_count: Mapped[int] = mapped_column(Integer, default=0)
+    inserted_count: Mapped[int] = mapped_column(Integer, default=0)
+    error_count: Mapped[int] = mapped_column(Integer, default=0)
+    html_memo_hits: Mapped[int] = mapped_column(Integer, default=0)
+    html_memo_misses: Mapped[int] = mapped_column(Integer, default=0)
+    html_memo_bytes_saved: Mapped[int] = mapped_column(BigInteger, default=0)
+    html_memo_disk_errors: Mapped[int] = mapped_column(Integer, default=0)
+    error: Mapped[str | None] = mapped_column(Text)
+
+    def __repr__(self) -> str:
+        return f"<CollectionRun {self.run_id} {self.source!r} {self.status}>"
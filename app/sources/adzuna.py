@@ -1,12 +1,12 @@
 """Adzuna data source — Tier 2 REST API (key required)."""
 
-import asyncio
+from collections.abc import AsyncIterator
 from datetime import datetime
 
 import structlog
 
 from app.config import get_settings
-from app.sources.base import BaseSource
+from app.sources.base import BaseSource, BudgetExhaustedError
 from app.utils.parsers import clean_html, extract_tags
 
 logger = structlog.get_logger(__name__)
@@ -14,31 +14,48 @@ logger = structlog.get_logger(__name__)
 API_BASE = "https://api.adzuna.com/v1/api/jobs"
 COUNTRIES = ["us", "gb", "ca", "de"]
 SEARCH_TERMS = ["python developer", "ruby rails developer", "golang developer", "react developer"]
+RESULTS_PER_PAGE = 50
 
 
 class AdzunaSource(BaseSource):
     """Fetch jobs from Adzuna's multi-country API."""
 
+    rate_limit = (2.0, 2)
+
     @property
     def source_name(self) -> str:
         return "adzuna"
 
-    async def fetch(self) -> list[dict]:
-        """Search across multiple countries and keywords."""
+    @property
+    def request_budget(self) -> int | None:
+        return get_settings().adzuna_request_budget or None
+
+    def raw_url(self, raw_job: dict) -> str | None:
+        return raw_job.get("redirect_url") or None
+
+    async def fetch_pages(self) -> AsyncIterator[list[dict]]:
+        """Search every country x keyword concurrently, yielding each search as it completes.
+
+        Each search pages through ``/search/{n}`` until a short page, a page
+        already stored in the database or ``deep_pagination_max_pages``.
+        """
         settings = get_settings()
         if not settings.adzuna_app_id or not settings.adzuna_api_key:
             logger.warning("adzuna.no_api_key", msg="ADZUNA_APP_ID/KEY not set, skipping")
-            return []
-
-        all_jobs = []
-        seen_ids = set()
+            return
 
         async with self._get_client() as client:
-            for country in COUNTRIES:
-                for term in SEARCH_TERMS:
+
+            async def search(query: tuple[str, str]) -> list[dict]:
+                country, term = query
+
+                async def fetch_page(number: int) -> tuple[list[dict], bool]:
                     try:
-                        resp = await client.get(
-                            f"{API_BASE}/{country}/search/1",
+                        resp = await self._request(
+                            client,
+                            "GET",
+                            f"{API_BASE}/{country}/search/{number + 1}",
+                            cached=True,
                             params={
                                 "app_id": settings.adzuna_app_id,
                                 "app_key": settings.adzuna_api_key,
@@ -46,27 +63,35 @@ class AdzunaSource(BaseSource):
                                 "where": "remote",
                                 "salary_min": 50000,
                                 "full_time": 1,
-                                "results_per_page": 50,
+                                "results_per_page": RESULTS_PER_PAGE,
                             },
                         )
                         resp.raise_for_status()
                         data = resp.json()
-
-                        for job in data.get("results", []):
-                            job_id = job.get("id")
-                            if job_id and job_id not in seen_ids:
-                                seen_ids.add(job_id)
-                                job["_country"] = country
-                                all_jobs.append(job)
-
+                    except BudgetExhaustedError:
+                        return [], False
                     except Exception:
                         logger.exception(
-                            "adzuna.search.error", country=country, term=term
+                            "adzuna.search.error", country=country, term=term, page=number + 1
                         )
-
-                    await asyncio.sleep(0.5)
-
-        return all_jobs
+                        return [], False
+
+                    jobs = data.get("results", [])
+                    for job in jobs:
+                        job["_country"] = country
+                    return jobs, len(jobs) >= RESULTS_PER_PAGE
+
+                return [
+                    job
+                    async for page in self._paginate_window(
+                        fetch_page, settings.deep_pagination_max_pages, stop_when_stored=True
+                    )
+                    for job in page
+                ]
+
+            queries = [(country, term) for country in COUNTRIES for term in SEARCH_TERMS]
+            async for jobs in self._fan_out(queries, search, key=lambda job: job.get("id")):
+                yield jobs
 
     def normalize(self, raw_job: dict) -> dict | None:
         """Normalize an Adzuna job entry."""
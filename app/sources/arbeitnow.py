@@ -1,6 +1,6 @@
 """Arbeitnow data source — Tier 1 public JSON API."""
 
-import asyncio
+from collections.abc import AsyncIterator
 from datetime import datetime, timezone
 
 import structlog
@@ -17,36 +17,40 @@ MAX_PAGES = 5
 class ArbeitnowSource(BaseSource):
     """Fetch jobs from Arbeitnow's public API with pagination."""
 
+    incremental = True
+    rate_limit = (1.0, 4)
+
     @property
     def source_name(self) -> str:
         return "arbeitnow"
 
-    async def fetch(self) -> list[dict]:
-        """Paginate through Arbeitnow API results."""
-        all_jobs = []
-        page = 1
+    def raw_url(self, raw_job: dict) -> str | None:
+        return raw_job.get("url") or None
 
-        async with self._get_client() as client:
-            while page <= MAX_PAGES:
-                resp = await client.get(API_URL, params={"page": page})
-                resp.raise_for_status()
-                data = resp.json()
+    def raw_posted_at(self, raw_job: dict) -> datetime | None:
+        try:
+            return datetime.fromtimestamp(int(raw_job["created_at"]), tz=timezone.utc)
+        except (KeyError, ValueError, TypeError, OSError):
+            return None
 
-                jobs = data.get("data", [])
-                if not jobs:
-                    break
+    async def fetch_pages(self) -> AsyncIterator[list[dict]]:
+        """Paginate through Arbeitnow API results, a window of pages at a time.
 
-                all_jobs.extend(jobs)
+        Stops at the last page or the first page made entirely of postings already stored.
+        """
+        async with self._get_client() as client:
 
+            async def fetch_page(number: int) -> tuple[list[dict], bool]:
+                resp = await self._request(
+                    client, "GET", API_URL, params={"page": number + 1}
+                )
+                resp.raise_for_status()
+                data = resp.json()
                 # Check if there are more pages
-                links = data.get("links", {})
-                if not links.get("next"):
-                    break
-
-                page += 1
-                await asyncio.sleep(1)  # Be polite
+                return data.get("data", []), bool(data.get("links", {}).get("next"))
 
-        return all_jobs
+            async for jobs in self._paginate_window(fetch_page, MAX_PAGES):
+                yield jobs
 
     def normalize(self, raw_job: dict) -> dict | None:
         """Normalize an Arbeitnow job entry."""
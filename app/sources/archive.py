@@ -0,0 +1,239 @@
+"""On-disk archive of raw API responses, and offline replay of a run.
+
+Every response a source receives is gzip-compressed into a
+content-addressed blob (``blobs/ab/<sha256>.gz``, so identical payloads are
+stored once) and listed in the run's manifest (``runs/<run_id>.jsonl``).
+Replaying a run answers each request from the archive instead of the
+network, which makes normalization benchmarks repeatable and lets tags or
+salaries be re-derived from history. Runs older than
+``ARCHIVE_RETENTION_DAYS`` are pruned after each collection, together with
+the blobs no remaining run refers to. A writer marks its run as in progress
+(``runs/<run_id>.running``) until it is closed, and blobs are never swept
+while any run is writing, since it may be reusing an old blob whose
+manifest entry is not on disk yet.
+
+Requests are matched by the same credential-free key as the Redis
+response cache; repeated identical requests are answered in recorded order.
+"""
+
+import gzip
+import hashlib
+import json
+import threading
+import uuid
+from collections import defaultdict, deque
+from datetime import datetime, timezone
+from pathlib import Path
+
+import httpx
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+
+class ReplayMissError(Exception):
+    """Raised during replay for a request that was not recorded in the run."""
+
+    def __init__(self, source: str, url: str):
+        super().__init__(f"{source}: {url}")
+        self.source = source
+        self.url = url
+
+
+def new_run_id() -> str:
+    """Sortable, unique id for a collection run (e.g. ``20260301T060000Z-1a2b3c``)."""
+    return f"{datetime.now(timezone.utc):%Y%m%dT%H%M%SZ}-{uuid.uuid4().hex[:6]}"
+
+
+class ArchiveWriter:
+    """Appends responses of one run to the archive."""
+
+    def __init__(self, root: str | Path, run_id: str):
+        self.root = Path(root)
+        self.run_id = run_id
+        self.manifest = self.root / "runs" / f"{run_id}.jsonl"
+        self._lock = threading.Lock()
+        self._running = self.root / "runs" / f"{run_id}.running"
+        self._running.parent.mkdir(parents=True, exist_ok=True)
+        self._running.touch()
+
+    def close(self) -> None:
+        """Mark the run as finished, so ``prune_archive`` may sweep blobs again."""
+        self._running.unlink(missing_ok=True)
+
+    def record(self, source: str, key: str, url: str, resp: httpx.Response) -> None:
+        """Store the body (if new) and add a manifest entry. Runs on a worker thread."""
+        content = resp.content
+        digest = hashlib.sha256(content).hexdigest()
+        blob = self._blob(digest)
+        if not blob.exists():
+            blob.parent.mkdir(parents=True, exist_ok=True)
+            tmp = blob.with_suffix(f".{uuid.uuid4().hex}.tmp")
+            tmp.write_bytes(gzip.compress(content, compresslevel=6))
+            tmp.replace(blob)
+        self._add_entry(source, key, url, resp, digest, len(content))
+
+    def open_stream(self, source: str, key: str, url: str, resp: httpx.Response) -> "ArchiveStream":
+        """Start archiving a streamed body chunk by chunk (see ``ArchiveStream``)."""
+        return ArchiveStream(self, source, key, url, resp)
+
+    def _blob(self, digest: str) -> Path:
+        return self.root / "blobs" / digest[:2] / f"{digest}.gz"
+
+    def _add_entry(
+        self, source: str, key: str, url: str, resp: httpx.Response, digest: str, size: int
+    ) -> None:
+        entry = {
+            "source": source,
+            "key": key,
+            "url": url,
+            "status": resp.status_code,
+            "content_type": resp.headers.get("Content-Type"),
+            "sha256": digest,
+            "size": size,
+            "recorded_at": datetime.now(timezone.utc).isoformat(),
+        }
+        with self._lock:
+            self.manifest.parent.mkdir(parents=True, exist_ok=True)
+            with self.manifest.open("a", encoding="utf-8") as f:
+                f.write(json.dumps(entry) + "\n")
+
+
+class ArchiveStream:
+    """A response body compressed to a temporary blob while it downloads.
+
+    The body is never held in memory: each chunk is hashed and gzip-written
+    as it arrives. ``commit()`` moves the file to its content address (or
+    drops it if that blob already exists) and adds the manifest entry;
+    ``abort()`` discards it.
+    """
+
+    def __init__(
+        self, writer: ArchiveWriter, source: str, key: str, url: str, resp: httpx.Response
+    ):
+        self._writer = writer
+        self._args = (source, key, url, resp)
+        self._sha256 = hashlib.sha256()
+        self._size = 0
+        self._tmp = writer.root / "blobs" / f"{uuid.uuid4().hex}.tmp"
+        self._tmp.parent.mkdir(parents=True, exist_ok=True)
+        self._file = gzip.open(self._tmp, "wb", compresslevel=6)
+
+    def write(self, chunk: bytes) -> None:
+        self._sha256.update(chunk)
+        self._size += len(chunk)
+        self._file.write(chunk)
+
+    def commit(self) -> None:
+        """Finish the blob and record the response. Runs on a worker thread."""
+        self._file.close()
+        digest = self._sha256.hexdigest()
+        blob = self._writer._blob(digest)
+        if blob.exists():
+            self._tmp.unlink(missing_ok=True)
+        else:
+            blob.parent.mkdir(parents=True, exist_ok=True)
+            self._tmp.replace(blob)
+        self._writer._add_entry(*self._args, digest, self._size)
+
+    def abort(self) -> None:
+        """Discard the partial blob."""
+        try:
+            self._file.close()
+        finally:
+            self._tmp.unlink(missing_ok=True)
+
+
+class ArchiveReplay:
+    """Serves the recorded responses of one run."""
+
+    def __init__(self, root: str | Path, run_id: str):
+        self.root = Path(root)
+        self.run_id = run_id
+        manifest = self.root / "runs" / f"{run_id}.jsonl"
+        if not manifest.exists():
+            raise FileNotFoundError(f"No archived run {run_id!r} in {self.root}")
+
+        self._entries: dict[tuple[str, str], deque[dict]] = defaultdict(deque)
+        with manifest.open(encoding="utf-8") as f:
+            for line in f:
+                entry = json.loads(line)
+                self._entries[entry["source"], entry["key"]].append(entry)
+
+    def sources(self) -> set[str]:
+        """Names of the sources recorded in this run."""
+        return {source for source, _ in self._entries}
+
+    def response(self, source: str, key: str, request: httpx.Request) -> httpx.Response:
+        """Rebuild the recorded response for a request.
+
+        Identical requests get their recordings in order; once exhausted the
+        last one is repeated.
+        """
+        entries = self._entries.get((source, key))
+        if not entries:
+            raise ReplayMissError(source, str(request.url))
+        entry = entries.popleft() if len(entries) > 1 else entries[0]
+
+        blob = self.root / "blobs" / entry["sha256"][:2] / f"{entry['sha256']}.gz"
+        return httpx.Response(
+            entry["status"],
+            headers={"Content-Type": entry["content_type"]} if entry["content_type"] else None,
+            content=gzip.decompress(blob.read_bytes()),
+            request=request,
+        )
+
+
+def list_runs(root: str | Path) -> list[str]:
+    """Archived run ids, oldest first."""
+    runs = Path(root) / "runs"
+    return sorted(p.stem for p in runs.glob("*.jsonl")) if runs.exists() else []
+
+
+def prune_archive(root: str | Path, max_age_days: int) -> tuple[int, int]:
+    """Delete runs older than ``max_age_days`` and blobs no remaining run uses.
+
+    Blobs and leftover ``.tmp`` files are only removed once they are older
+    than the cutoff too, and not at all while another run is still writing
+    (its ``.running`` marker exists): that run may be reusing an old blob
+    before its manifest lists it. Markers older than the cutoff are left by
+    crashed runs and are removed.
+
+    Returns:
+        ``(runs, blobs)`` deleted.
+    """
+    root = Path(root)
+    runs_dir = root / "runs"
+    blobs_dir = root / "blobs"
+    cutoff = datetime.now(timezone.utc).timestamp() - max_age_days * 86400
+
+    running = 0
+    for marker in runs_dir.glob("*.running") if runs_dir.exists() else []:
+        if marker.stat().st_mtime < cutoff:
+            marker.unlink(missing_ok=True)
+        else:
+            running += 1
+
+    pruned_runs = 0
+    referenced: set[str] = set()
+    for manifest in sorted(runs_dir.glob("*.jsonl")) if runs_dir.exists() else []:
+        if manifest.stat().st_mtime < cutoff:
+            manifest.unlink(missing_ok=True)
+            pruned_runs += 1
+            continue
+        with manifest.open(encoding="utf-8") as f:
+            referenced.update(json.loads(line)["sha256"] for line in f if line.strip())
+
+    pruned_blobs = 0
+    if running:
+        logger.info("source.archive.prune_deferred", runs=pruned_runs, running=running)
+        return pruned_runs, pruned_blobs
+    for blob in blobs_dir.rglob("*") if blobs_dir.exists() else []:
+        if not blob.is_file() or blob.stat().st_mtime >= cutoff:
+            continue
+        if blob.suffix == ".tmp" or blob.name.removesuffix(".gz") not in referenced:
+            blob.unlink(missing_ok=True)
+            pruned_blobs += 1
+
+    logger.info("source.archive.pruned", runs=pruned_runs, blobs=pruned_blobs)
+    return pruned_runs, pruned_blobs
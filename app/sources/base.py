@@ -1,19 +1,51 @@
 """Base class for all job data sources."""
 
 import abc
+import asyncio
+import time
+from collections.abc import AsyncIterator, Awaitable, Callable, Hashable, Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from datetime import datetime, timezone
+from typing import TypeVar
 
 import httpx
 import structlog
+from sqlalchemy import func, select
 from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.orm import Session
 
-from app.models import Job
+from app.config import get_settings
+from app.models import Job, SourceWatermark
+from app.sources.archive import ArchiveReplay, ArchiveStream, ArchiveWriter
+from app.sources.dedupe import link_near_duplicates
+from app.sources.http import SharedClient, get_client_registry
+from app.sources.http_cache import NotModifiedError, get_validator_cache
+from app.sources.known_urls import KnownUrlFilter
+from app.sources.ratelimit import get_bucket, parse_retry_after
+from app.sources.response_cache import cache_key, get_response_cache
+from app.sources.streaming import JsonItemParser
+from app.sources.telemetry import SourceRunStats
+from app.utils.html_memo import get_html_memo
+from app.utils.simhash import bands, job_simhash, to_signed
+from app.utils.urls import canonicalize_url, url_hash
 
 logger = structlog.get_logger(__name__)
 
+Q = TypeVar("Q")
+
 USER_AGENT = "JobHunterPro/0.1 (personal job search automation; contact: tomas@example.com)"
 DEFAULT_TIMEOUT = 30.0
+DEFAULT_CONCURRENCY = 4
+DEFAULT_RATE_LIMIT = (5.0, 5)
+DEFAULT_PAGE_WINDOW = 4
+DEFAULT_STREAM_PAGE_SIZE = 100
+RETRY_STATUSES = {429, 503}
+STAGING_TABLE = "jobs_staging"
+
+
+class BudgetExhaustedError(Exception):
+    """Raised by ``_request`` once a source has spent its per-run request budget."""
 
 
 class BaseSource(abc.ABC):
@@ -21,24 +53,75 @@ class BaseSource(abc.ABC):
 
     Subclasses must implement:
         - source_name: str property identifying this source
-        - fetch(): collect raw job data from the API/feed
+        - fetch() or fetch_pages(): collect raw job data from the API/feed
         - normalize(raw): convert a raw job dict to Job-compatible fields
+
+    Paginated sources implement ``fetch_pages`` so ``collect_stream`` can
+    normalize and save each page while later pages are still downloading.
+
+    Requests should go through ``_request`` so that no source has more than
+    ``max_concurrency`` calls in flight against its provider at once, and
+    the host's token bucket paces them at ``rate_limit``. Feeds
+    that always return the full catalogue pass ``conditional=True``; a 304
+    then raises ``NotModifiedError`` and ``collect()`` returns no jobs.
     """
 
+    max_concurrency: int = DEFAULT_CONCURRENCY
+    rate_limit: tuple[float, int] = DEFAULT_RATE_LIMIT
+    """(requests per second, burst) allowed against this source's host."""
+    _slots: asyncio.Semaphore | None = None
+    _pending_validators: dict[str, dict] | None = None
+
+    incremental: bool = False
+    """Paginated sources that stop once a whole page is already known."""
+    page_window: int = DEFAULT_PAGE_WINDOW
+    """Pages requested concurrently by ``_paginate_window``."""
+    stream_page_size: int = DEFAULT_STREAM_PAGE_SIZE
+    """Items per page yielded by ``_stream_items`` while a body downloads."""
+    _watermark: dict | None = None
+    _budget_left: int | None = None
+    use_response_cache: bool = True
+    """Set False to bypass the Redis response cache for ``cached=True`` requests."""
+    archive: ArchiveWriter | None = None
+    """When set, every response is saved to the raw response archive."""
+    replay: ArchiveReplay | None = None
+    """When set, responses come from an archived run instead of the network."""
+    known_urls: KnownUrlFilter | None = None
+    """When set, postings already in ``jobs`` are dropped before normalizing."""
+    stats: SourceRunStats | None = None
+    """Timings and counters of the latest collect, reset when it starts."""
+    _session_factory: Callable[[], Session] | None = None
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        """Require ``fetch`` or ``fetch_pages``; their defaults call each other."""
+        super().__init_subclass__(**kwargs)
+        if abc.ABC in cls.__bases__:
+            return  # an intermediate abstract base
+        if cls.fetch is BaseSource.fetch and cls.fetch_pages is BaseSource.fetch_pages:
+            raise TypeError(f"{cls.__name__} must implement fetch() or fetch_pages()")
+
     @property
     @abc.abstractmethod
     def source_name(self) -> str:
         """Unique identifier for this source (e.g. 'remoteok', 'himalayas')."""
         ...
 
-    @abc.abstractmethod
     async def fetch(self) -> list[dict]:
         """Fetch raw job listings from the source.
 
+        The default gathers every page from ``fetch_pages``.
+
         Returns:
             List of raw job dicts as returned by the API/feed.
         """
-        ...
+        return [raw async for page in self.fetch_pages() for raw in page]
+
+    async def fetch_pages(self) -> AsyncIterator[list[dict]]:
+        """Yield raw job listings one page at a time.
+
+        The default yields everything from ``fetch`` as a single page.
+        """
+        yield await self.fetch()
 
     @abc.abstractmethod
     def normalize(self, raw_job: dict) -> dict | None:
@@ -49,43 +132,462 @@ class BaseSource(abc.ABC):
         """
         ...
 
-    def _get_client(self, **kwargs) -> httpx.AsyncClient:
-        """Create an httpx async client with standard headers."""
+    @property
+    def request_budget(self) -> int | None:
+        """Maximum requests per run (None = unlimited); paid APIs override this."""
+        return None
+
+    def _get_client(self, **kwargs) -> SharedClient:
+        """Borrow the process-wide pooled client with standard headers."""
         headers = kwargs.pop("headers", {})
         headers.setdefault("User-Agent", USER_AGENT)
         headers.setdefault("Accept", "application/json")
-        return httpx.AsyncClient(
+        return get_client_registry().borrow(
             headers=headers,
             timeout=kwargs.pop("timeout", DEFAULT_TIMEOUT),
-            follow_redirects=True,
-            **kwargs,
         )
 
-    async def collect(self) -> list[dict]:
-        """Fetch and normalize all jobs from this source.
+    async def _request(
+        self,
+        client: SharedClient,
+        method: str,
+        url: str,
+        conditional: bool = False,
+        cached: bool = False,
+        cache_endpoint: str | None = None,
+        stream: bool = False,
+        **kwargs,
+    ) -> httpx.Response:
+        """Send a request, waiting for a free slot under ``max_concurrency``.
 
-        Returns:
-            List of normalized job dicts ready for DB insertion.
+        The host's token bucket paces requests; a 429/503 pauses the bucket
+        for ``Retry-After`` (or an exponential backoff) and the request is
+        retried up to ``settings.http_max_retries`` times. Each call (not each
+        retry) spends one unit of ``request_budget``; once it is spent
+        ``BudgetExhaustedError`` is raised instead of sending. With
+        ``conditional=True`` the stored ETag/Last-Modified for the URL is
+        sent, and a 304 response raises ``NotModifiedError``. New validators are
+        held until ``commit_http_cache()`` so an unsaved run is never skipped.
+
+        With ``cached=True`` a response stored in Redis within the source's
+        TTL is returned without spending budget or touching the network.
+        Pass ``cache_endpoint`` when the URL itself contains a credential.
+
+        Responses are recorded to ``archive`` when one is attached; with
+        ``replay`` attached they are served from that archived run and
+        nothing is sent.
+
+        With ``stream=True`` the body is left unread for the caller to
+        consume (see ``_stream_items``), which then also owns archiving and
+        byte counting; streamed responses are never response-cached.
         """
-        logger.info("source.fetch.start", source=self.source_name)
+        key_url = cache_endpoint or url
+        response_key = self._response_key(method, key_url, kwargs)
+        if self.replay is not None:
+            resp = self.replay.response(self.source_name, response_key, httpx.Request(method, url))
+            if conditional and resp.status_code == 304:
+                raise NotModifiedError(key_url)
+            return resp
+
+        use_cache = (
+            cached
+            and not stream
+            and self.use_response_cache
+            and get_settings().response_cache_enabled
+        )
+        if use_cache:
+            hit = await get_response_cache().get(
+                self.source_name, response_key, httpx.Request(method, url)
+            )
+            if hit is not None:
+                await self._archive_response(response_key, key_url, hit)
+                return hit
+
+        if self._budget_left is not None:
+            if self._budget_left <= 0:
+                raise BudgetExhaustedError(self.source_name)
+            self._budget_left -= 1
+            if self._budget_left == 0:
+                logger.warning(
+                    "source.budget_exhausted", source=self.source_name, budget=self.request_budget
+                )
+
+        if self._slots is None:
+            self._slots = asyncio.Semaphore(self.max_concurrency)
+
+        if conditional:
+            cache = get_validator_cache()
+            key = str(httpx.URL(url, params=kwargs.get("params")))
+            kwargs["headers"] = {
+                **(kwargs.get("headers") or {}),
+                **cache.request_headers(key),
+            }
+
+        bucket = get_bucket(httpx.URL(url).host, *self.rate_limit)
+        retries = get_settings().http_max_retries
+        async with self._slots:
+            for attempt in range(retries + 1):
+                await bucket.acquire()
+                try:
+                    resp = await client.request(method, url, stream=stream, **kwargs)
+                except Exception:
+                    self._count_request(None)
+                    raise
+                self._count_request(resp, count_bytes=not stream)
+                if resp.status_code not in RETRY_STATUSES or attempt == retries:
+                    break
+                if stream:
+                    await resp.aclose()
+                delay = parse_retry_after(resp.headers.get("Retry-After"))
+                if delay is None:
+                    delay = 2.0**attempt
+                logger.warning(
+                    "source.rate_limited",
+                    source=self.source_name,
+                    status=resp.status_code,
+                    retry_in=delay,
+                    attempt=attempt + 1,
+                )
+                bucket.penalize(delay)
+            if resp.status_code not in RETRY_STATUSES:
+                bucket.reward()
+
+        if not stream:
+            await self._archive_response(response_key, key_url, resp)
+        if conditional:
+            validators = cache.record(key, resp)
+            if resp.status_code == 304:
+                if stream:
+                    await resp.aclose()
+                raise NotModifiedError(key)
+            if validators:
+                if self._pending_validators is None:
+                    self._pending_validators = {}
+                self._pending_validators[key] = validators
+        if use_cache:
+            await get_response_cache().set(self.source_name, response_key, resp)
+        return resp
+
+    def _response_key(self, method: str, key_url: str, kwargs: dict) -> str:
+        return cache_key(
+            self.source_name, method, key_url, kwargs.get("params"), kwargs.get("json")
+        )
+
+    def _count_request(self, resp: httpx.Response | None, count_bytes: bool = True) -> None:
+        """Add one network request (``None`` if it failed) to the run stats."""
+        if self.stats is None:
+            return
+        self.stats.requests += 1
+        if resp is not None and count_bytes:
+            self.stats.bytes_downloaded += len(resp.content)
+        if resp is None or resp.status_code >= 400:
+            self.stats.error_count += 1
+
+    async def _stream_items(
+        self,
+        client: SharedClient,
+        method: str,
+        url: str,
+        prefix: str,
+        conditional: bool = False,
+        **kwargs,
+    ) -> AsyncIterator[list[dict]]:
+        """Yield the JSON items under ``prefix`` in pages while the body downloads.
+
+        The request goes through ``_request`` (pacing, retries, budget,
+        conditional GET, replay) but the body is parsed incrementally, so
+        normalizing starts before the download finishes and the full
+        document is never decoded at once. Pages hold ``stream_page_size``
+        items. When archiving, chunks are compressed to a temporary blob as
+        they arrive and recorded once the stream completes; a stream that
+        fails part-way discards that blob and drops its new validators so
+        the next run fetches the catalogue again.
+        """
+        resp = await self._request(
+            client, method, url, conditional=conditional, stream=True, **kwargs
+        )
+        archive = None
+        parser = JsonItemParser(prefix)
+        page: list[dict] = []
+        try:
+            resp.raise_for_status()
+            if self.archive is not None and self.replay is None:
+                key = self._response_key(method, url, kwargs)
+                archive = self._open_archive_stream(key, url, resp)
+            async for chunk in resp.aiter_bytes():
+                if archive is not None:
+                    try:
+                        archive.write(chunk)
+                    except OSError:
+                        logger.warning(
+                            "source.archive.error", source=self.source_name, exc_info=True
+                        )
+                        archive.abort()
+                        archive = None
+                if self.stats is not None and self.replay is None:
+                    self.stats.bytes_downloaded += len(chunk)
+                page.extend(parser.feed(chunk))
+                while len(page) >= self.stream_page_size:
+                    yield page[: self.stream_page_size]
+                    page = page[self.stream_page_size :]
+            page.extend(parser.close())
+        except BaseException:
+            if archive is not None:
+                archive.abort()
+            if conditional and self._pending_validators:
+                self._pending_validators.pop(str(httpx.URL(url, params=kwargs.get("params"))), None)
+            raise
+        finally:
+            await resp.aclose()
 
+        if archive is not None:
+            try:
+                await asyncio.to_thread(archive.commit)
+            except OSError:
+                logger.warning("source.archive.error", source=self.source_name, exc_info=True)
+                archive.abort()
+        for start in range(0, len(page), self.stream_page_size):
+            yield page[start : start + self.stream_page_size]
+
+    def _open_archive_stream(
+        self, key: str, url: str, resp: httpx.Response
+    ) -> ArchiveStream | None:
+        """Start archiving a streamed body; ``None`` if the archive cannot be written."""
+        try:
+            return self.archive.open_stream(self.source_name, key, url, resp)
+        except OSError:
+            logger.warning("source.archive.error", source=self.source_name, exc_info=True)
+            return None
+
+    async def _archive_response(self, key: str, url: str, resp: httpx.Response) -> None:
+        """Record a response to the attached archive; failures never fail the fetch."""
+        if self.archive is None:
+            return
         try:
-            raw_jobs = await self.fetch()
+            await asyncio.to_thread(self.archive.record, self.source_name, key, url, resp)
+        except OSError:
+            logger.warning("source.archive.error", source=self.source_name, exc_info=True)
+
+    def commit_http_cache(self) -> None:
+        """Persist validators seen during the last collect (call after saving)."""
+        if self._pending_validators:
+            cache = get_validator_cache()
+            cache.update(self._pending_validators)
+            logger.info("source.http_cache.commit", source=self.source_name, **cache.stats())
+        self._pending_validators = None
+
+    def raw_url(self, raw_job: dict) -> str | None:
+        """URL a raw posting will be stored under, without normalizing it."""
+        return None
+
+    def raw_posted_at(self, raw_job: dict) -> datetime | None:
+        """Posting date of a raw job, without normalizing it."""
+        return None
+
+    def _raw_key(self, raw_job: dict) -> str | None:
+        """Canonical form of ``raw_url``, comparable with watermark URLs and ``url_hash``."""
+        url = self.raw_url(raw_job)
+        return canonicalize_url(url) if url else None
+
+    def load_watermark(self, db: Session) -> None:
+        """Load this source's high-water mark before fetching (incremental sources only)."""
+        if not self.incremental:
+            return
+        row = db.get(SourceWatermark, self.source_name)
+        if row is None:
+            self._watermark = None
+            return
+        self._watermark = {
+            "newest_posted_at": row.newest_posted_at,
+            "seen_urls": set(row.seen_urls or []),
+        }
+
+    def update_watermark(self, jobs: list[dict], db: Session) -> None:
+        """Advance the high-water mark with jobs from a successful run."""
+        if not self.incremental or not jobs:
+            return
+        row = db.get(SourceWatermark, self.source_name)
+        if row is None:
+            row = SourceWatermark(source=self.source_name)
+            db.add(row)
+
+        posted = [j["posted_at"] for j in jobs if j.get("posted_at")]
+        if row.newest_posted_at:
+            posted.append(row.newest_posted_at)
+        row.newest_posted_at = max(posted, default=None)
+
+        # Newest first, so truncation drops the oldest URLs
+        urls = dict.fromkeys(
+            [canonicalize_url(j["url"]) for j in jobs] + list(row.seen_urls or [])
+        )
+        row.seen_urls = list(urls)[: get_settings().watermark_max_urls]
+        db.commit()
+
+    def _page_is_known(self, raw_jobs: list[dict]) -> bool:
+        """True if every posting on a page was already delivered by a previous run.
+
+        A posting counts as known if its URL is in the watermark's seen set or
+        it is older than the newest posting seen so far.
+        """
+        if not raw_jobs or not self._watermark:
+            return False
+        seen = self._watermark["seen_urls"]
+        newest = self._watermark["newest_posted_at"]
+        for raw in raw_jobs:
+            if self._raw_key(raw) in seen:
+                continue
+            posted_at = self.raw_posted_at(raw)
+            if newest and posted_at and posted_at < newest:
+                continue
+            return False
+        return True
+
+    async def _page_has_only_stored(self, raw_jobs: list[dict]) -> bool:
+        """True if every posting on a page is already in the ``jobs`` table.
+
+        Only available while saving (``collect_stream`` provides the session
+        factory); a dry run, a replay or a database error never stops
+        pagination.
+        """
+        urls = {url for raw in raw_jobs if (url := self._raw_key(raw))}
+        if not urls or self._session_factory is None or self.replay is not None:
+            return False
+        if self.known_urls is not None and not self.known_urls.might_contain_all(urls):
+            return False
+
+        def count_stored() -> int:
+            db = self._session_factory()
+            try:
+                hashes = [url_hash(url) for url in urls]
+                return db.scalar(
+                    select(func.count()).select_from(Job).where(Job.url_hash.in_(hashes))
+                )
+            finally:
+                db.close()
+
+        try:
+            return await asyncio.to_thread(count_stored) >= len(urls)
         except Exception:
-            logger.exception("source.fetch.error", source=self.source_name)
-            return []
+            logger.warning("source.known_check.error", source=self.source_name, exc_info=True)
+            return False
+
+    async def _paginate_window(
+        self,
+        fetch_page: Callable[[int], Awaitable[tuple[list[dict], bool]]],
+        max_pages: int,
+        stop_when_stored: bool = False,
+    ) -> AsyncIterator[list[dict]]:
+        """Fetch numbered pages ``page_window`` at a time and yield them in order.
+
+        ``fetch_page(n)`` returns the raw jobs on page ``n`` (0-based) and
+        whether more pages follow. Pages in a window are requested together
+        (still paced by the rate limiter) and yielded in page order;
+        iteration stops at the first empty, last or already-known page, and
+        later pages from the same window are discarded. With
+        ``stop_when_stored`` a page whose postings are all in the database
+        also counts as known, and the window starts at a single page and
+        doubles (up to ``page_window``) only while pages bring new postings:
+        paid searches usually stop at the first page on a quiet day, and
+        must not spend quota on pages they will discard. Postings repeated
+        across pages (same ``raw_url``) are dropped.
+
+        If ``fetch_page`` raises, the pages before the failing one are still
+        yielded, the rest of the window is cancelled and the error is raised.
+        """
+        seen: set[str] = set()
+        first = 0
+        width = 1 if stop_when_stored else self.page_window
+        while first < max_pages:
+            numbers = range(first, min(first + width, max_pages))
+            first = numbers.stop
+            width = min(width * 2, self.page_window)
+            tasks = [asyncio.create_task(fetch_page(n)) for n in numbers]
+            try:
+                for number, task in zip(numbers, tasks):
+                    jobs, more = await task
+                    if not jobs:
+                        return
+                    if self._page_is_known(jobs) or (
+                        stop_when_stored and await self._page_has_only_stored(jobs)
+                    ):
+                        logger.info("source.caught_up", source=self.source_name, page=number)
+                        return
+
+                    fresh = []
+                    for job in jobs:
+                        url = self._raw_key(job)
+                        if url is None or url not in seen:
+                            if url is not None:
+                                seen.add(url)
+                            fresh.append(job)
+                    if fresh:
+                        yield fresh
+                    if not more:
+                        return
+            finally:
+                _cancel_window(tasks)
 
-        logger.info("source.fetch.done", source=self.source_name, raw_count=len(raw_jobs))
+    async def _fan_out(
+        self,
+        queries: Iterable[Q],
+        run_query: Callable[[Q], Awaitable[list[dict]]],
+        key: Callable[[dict], Hashable | None],
+    ) -> AsyncIterator[list[dict]]:
+        """Run every query concurrently and yield results as each one completes.
 
+        At most ``settings.query_concurrency`` queries run at once (requests
+        are still paced by the rate limiter). Jobs whose ``key`` was already
+        yielded by an earlier result, or whose key is empty, are dropped.
+        ``run_query`` should log and return ``[]`` on failure.
+        """
+        gate = asyncio.Semaphore(get_settings().query_concurrency)
+
+        async def bounded(query: Q) -> list[dict]:
+            async with gate:
+                return await run_query(query)
+
+        tasks = [asyncio.create_task(bounded(q)) for q in queries]
+        seen: set = set()
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                fresh = []
+                for job in await next_done:
+                    k = key(job)
+                    if k and k not in seen:
+                        seen.add(k)
+                        fresh.append(job)
+                if fresh:
+                    yield fresh
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    def _normalize_page(self, raw_jobs: list[dict], flush_memo: bool = True) -> list[dict]:
+        """Normalize one page of raw jobs, skipping entries that fail.
+
+        ``clean_html`` memo hits during the page are added to ``stats`` and,
+        with ``flush_memo``, newly cleaned descriptions are written to the
+        memo's disk store (async callers flush on a worker thread instead).
+        """
+        memo = get_html_memo()
+        before = memo.counters() if memo is not None else None
         normalized = []
         for raw in raw_jobs:
             try:
                 job_data = self.normalize(raw)
                 if job_data:
+                    job_data["url_hash"] = url_hash(job_data["url"])
                     job_data["source"] = self.source_name
                     job_data.setdefault("scraped_at", datetime.now(timezone.utc))
                     job_data.setdefault("is_remote", True)
                     job_data.setdefault("status", "new")
+                    fingerprint = to_signed(job_simhash(
+                        job_data.get("title", ""),
+                        job_data.get("company", ""),
+                        job_data.get("description", ""),
+                    ))
+                    job_data["simhash"] = fingerprint
+                    job_data["simhash_bands"] = bands(fingerprint)
                     normalized.append(job_data)
             except Exception:
                 logger.exception(
@@ -93,17 +595,254 @@ class BaseSource(abc.ABC):
                     source=self.source_name,
                     raw_job_keys=list(raw.keys()) if isinstance(raw, dict) else "N/A",
                 )
+        if memo is not None:
+            if flush_memo:
+                memo.flush()
+            if self.stats is not None:
+                hits, misses, saved, disk_errors = (
+                    now - then for now, then in zip(memo.counters(), before)
+                )
+                self.stats.html_memo_hits += hits
+                self.stats.html_memo_misses += misses
+                self.stats.html_memo_bytes_saved += saved
+                self.stats.html_memo_disk_errors += disk_errors
+        return normalized
+
+    async def _drop_known(self, raw_jobs: list[dict]) -> list[dict]:
+        """Remove postings whose URL is already stored, before normalizing them."""
+        urls = [self._raw_key(raw) for raw in raw_jobs]
+        try:
+            known = await asyncio.to_thread(self.known_urls.known, filter(None, urls))
+        except Exception:
+            logger.warning("source.known_urls.error", source=self.source_name, exc_info=True)
+            return raw_jobs
+        if not known:
+            return raw_jobs
+        return [raw for raw, url in zip(raw_jobs, urls) if url not in known]
+
+    async def _normalize_page_pooled(self, raw_jobs: list[dict]) -> list[dict]:
+        """Normalize a page, off the event loop in a process pool when it is large.
+
+        Pages below ``settings.normalize_pool_threshold`` stay in-process,
+        where pickling overhead would outweigh the parallelism. If the pool
+        cannot do the work (a broken pool, a raw job that cannot be pickled,
+        a source class that needs constructor arguments), the page is
+        normalized in-process instead. In-process pages write the memo's
+        disk store on a worker thread, never on the event loop.
+        """
+        settings = get_settings()
+        if (
+            settings.normalize_pool_workers <= 0
+            or len(raw_jobs) < settings.normalize_pool_threshold
+        ):
+            return await self._normalize_in_process(raw_jobs)
+
+        size = settings.normalize_pool_chunk_size
+        loop = asyncio.get_running_loop()
+        try:
+            pool = _get_normalize_pool()
+            chunks = await asyncio.gather(*[
+                loop.run_in_executor(pool, _normalize_in_worker, type(self), raw_jobs[i : i + size])
+                for i in range(0, len(raw_jobs), size)
+            ])
+        except Exception as exc:
+            # _normalize_page catches per-job errors, so this is the pool itself failing
+            logger.warning(
+                "source.normalize.pool_failed", source=self.source_name, error=repr(exc)
+            )
+            if isinstance(exc, BrokenProcessPool):
+                shutdown_normalize_pool()
+            return await self._normalize_in_process(raw_jobs)
+        if self.stats is not None:
+            for _, worker_stats in chunks:
+                self.stats.html_memo_hits += worker_stats.html_memo_hits
+                self.stats.html_memo_misses += worker_stats.html_memo_misses
+                self.stats.html_memo_bytes_saved += worker_stats.html_memo_bytes_saved
+                self.stats.html_memo_disk_errors += worker_stats.html_memo_disk_errors
+        return [job for chunk, _ in chunks for job in chunk]
+
+    async def _normalize_in_process(self, raw_jobs: list[dict]) -> list[dict]:
+        """Normalize on the event loop, then flush the memo's disk store off it."""
+        jobs = self._normalize_page(raw_jobs, flush_memo=False)
+        memo = get_html_memo()
+        if memo is not None:
+            await asyncio.to_thread(memo.flush)
+        return jobs
+
+    async def _iter_normalized(self) -> AsyncIterator[list[dict]]:
+        """Fetch page by page and yield each page normalized.
+
+        A fetch error ends the iteration but keeps the pages already yielded.
+        """
+        logger.info("source.fetch.start", source=self.source_name)
+        self._slots = asyncio.Semaphore(self.max_concurrency)
+        self._pending_validators = None
+        self._budget_left = self.request_budget
+        stats = self.stats = SourceRunStats()
+
+        known_count = 0
+        waiting_since = time.perf_counter()
+        try:
+            async for page in self.fetch_pages():
+                started = time.perf_counter()
+                stats.fetch_seconds += started - waiting_since
+                stats.raw_count += len(page)
+                if self.known_urls is not None:
+                    fresh = await self._drop_known(page)
+                    known_count += len(page) - len(fresh)
+                    page = fresh
+                jobs = await self._normalize_page_pooled(page)
+                stats.normalized_count += len(jobs)
+                stats.normalize_seconds += time.perf_counter() - started
+                yield jobs
+                waiting_since = time.perf_counter()
+            stats.fetch_seconds += time.perf_counter() - waiting_since
+        except NotModifiedError as exc:
+            logger.info("source.fetch.not_modified", source=self.source_name, url=exc.url)
+        except Exception:
+            stats.error_count += 1
+            logger.exception("source.fetch.error", source=self.source_name)
 
+        logger.info(
+            "source.fetch.done",
+            source=self.source_name,
+            raw_count=stats.raw_count,
+            already_stored=known_count,
+            requests=stats.requests,
+            bytes=stats.bytes_downloaded,
+            seconds=round(stats.fetch_seconds, 3),
+        )
         logger.info(
             "source.normalize.done",
             source=self.source_name,
-            normalized_count=len(normalized),
-            skipped=len(raw_jobs) - len(normalized),
+            normalized_count=stats.normalized_count,
+            skipped=stats.raw_count - known_count - stats.normalized_count,
+            html_memo_hits=stats.html_memo_hits,
+            html_memo_disk_errors=stats.html_memo_disk_errors,
+            seconds=round(stats.normalize_seconds, 3),
         )
+
+    async def collect(self) -> list[dict]:
+        """Fetch and normalize all jobs from this source.
+
+        Returns:
+            List of normalized job dicts ready for DB insertion.
+        """
+        normalized = []
+        async for jobs in self._iter_normalized():
+            normalized.extend(jobs)
         return normalized
 
-    def save(self, jobs: list[dict], db: Session) -> int:
-        """Save normalized jobs to the database with upsert (skip duplicates by URL).
+    async def collect_stream(
+        self,
+        session_factory: Callable[[], Session],
+        batch_size: int | None = None,
+        queue_pages: int | None = None,
+    ) -> tuple[int, int]:
+        """Fetch, normalize and save concurrently with bounded memory.
+
+        Normalized pages go through a queue holding at most ``queue_pages``
+        pages; when the writer falls behind, fetching waits. The writer
+        flushes every ``batch_size`` jobs on a worker thread, so the first
+        rows are stored while later pages are still downloading. Batches keep
+        that size however large the run gets; once it has produced
+        ``settings.copy_ingest_threshold`` jobs, each further batch is loaded
+        with COPY instead of multi-VALUES inserts. If the collection is
+        cancelled (e.g. the run deadline passes), the writer finishes the
+        batch in flight and saves everything already queued before the
+        cancellation propagates. A fetch, writer or database error is
+        raised as itself, not wrapped in an ``ExceptionGroup``.
+
+        Returns:
+            Tuple of (normalized jobs, new jobs inserted).
+        """
+        settings = get_settings()
+        batch_size = batch_size or settings.pipeline_batch_size
+        copy_threshold = settings.copy_ingest_threshold
+        queue: asyncio.Queue[list[dict] | None] = asyncio.Queue(
+            maxsize=queue_pages or settings.pipeline_queue_pages
+        )
+        fetched = 0
+        inserted = 0
+
+        async def produce() -> None:
+            nonlocal fetched
+            self._session_factory = session_factory
+            try:
+                async for jobs in self._iter_normalized():
+                    fetched += len(jobs)
+                    if jobs:
+                        await queue.put(jobs)
+            finally:
+                self._session_factory = None
+            await queue.put(None)
+
+        async def write() -> None:
+            nonlocal inserted
+            batch: list[dict] = []
+            saving: asyncio.Future[int] | None = None
+            try:
+                while (jobs := await queue.get()) is not None:
+                    batch.extend(jobs)
+                    while len(batch) >= batch_size:
+                        chunk, batch = batch[:batch_size], batch[batch_size:]
+                        saving = asyncio.ensure_future(asyncio.to_thread(
+                            self._flush, chunk, session_factory, fetched >= copy_threshold
+                        ))
+                        inserted += await asyncio.shield(saving)
+                        saving = None
+            except asyncio.CancelledError:
+                # Deadline or a failed fetch: keep what was already normalized
+                if saving is not None:
+                    inserted += await saving
+                while not queue.empty():
+                    if (jobs := queue.get_nowait()) is not None:
+                        batch.extend(jobs)
+                if batch:
+                    inserted += await asyncio.to_thread(
+                        self._flush, batch, session_factory, fetched >= copy_threshold
+                    )
+                    logger.info("source.save.salvaged", source=self.source_name, count=len(batch))
+                raise
+            if batch:
+                inserted += await asyncio.to_thread(
+                    self._flush, batch, session_factory, fetched >= copy_threshold
+                )
+
+        try:
+            async with asyncio.TaskGroup() as tg:
+                tg.create_task(produce())
+                tg.create_task(write())
+        except* Exception as group:
+            # Callers handle per-source errors with ``except Exception``
+            raise group.exceptions[0]
+
+        return fetched, inserted
+
+    def _flush(
+        self, jobs: list[dict], session_factory: Callable[[], Session], copy: bool = False
+    ) -> int:
+        """Save one batch (with COPY if ``copy``) and advance the watermark in a fresh session."""
+        started = time.perf_counter()
+        db = session_factory()
+        try:
+            inserted = self.save_copy(jobs, db) if copy else self.ingest(jobs, db)
+            self.update_watermark(jobs, db)
+            if self.stats is not None:
+                self.stats.inserted_count += inserted
+            return inserted
+        finally:
+            db.close()
+            if self.stats is not None:
+                self.stats.save_seconds += time.perf_counter() - started
+
+    def save(self, jobs: list[dict], db: Session, chunk_size: int | None = None) -> int:
+        """Save normalized jobs to the database with upsert (skip duplicates by URL hash).
+
+        Rows are sent in chunks as one multi-VALUES
+        ``INSERT ... ON CONFLICT DO NOTHING RETURNING id`` per chunk; the
+        returned ids are the rows that were actually inserted, and are
+        linked to any near-duplicate job already stored.
 
         Returns:
             Number of new jobs inserted.
@@ -111,16 +850,18 @@ class BaseSource(abc.ABC):
         if not jobs:
             return 0
 
-        inserted = 0
-        for job_data in jobs:
+        chunk_size = chunk_size or get_settings().save_chunk_size
+        new_ids = []
+        for chunk in _chunks_by_columns(jobs, chunk_size):
             stmt = (
                 pg_insert(Job)
-                .values(**job_data)
-                .on_conflict_do_nothing(index_elements=["url"])
+                .values(chunk)
+                .on_conflict_do_nothing(index_elements=["url_hash"])
+                .returning(Job.id)
             )
-            result = db.execute(stmt)
-            if result.rowcount > 0:
-                inserted += 1
+            new_ids.extend(db.execute(stmt).scalars())
+        inserted = len(new_ids)
+        link_near_duplicates(db, new_ids)
 
         db.commit()
         logger.info(
@@ -130,3 +871,127 @@ class BaseSource(abc.ABC):
             duplicates=len(jobs) - inserted,
         )
         return inserted
+
+    def save_copy(self, jobs: list[dict], db: Session) -> int:
+        """Bulk-load jobs via PostgreSQL COPY into a staging table, then merge.
+
+        Rows are streamed with the psycopg3 copy protocol into a temporary
+        table (dropped on commit) and merged into ``jobs`` with a single
+        ``INSERT ... SELECT ... ON CONFLICT (url_hash) DO NOTHING``. Intended for
+        backfills and replays far larger than a normal run.
+
+        Returns:
+            Number of new jobs inserted.
+        """
+        if not jobs:
+            return 0
+
+        keys = set().union(*jobs)
+        table = Job.__table__
+        # Scalar Python-side defaults (salary_currency, status, ...) are not
+        # applied by INSERT ... SELECT, so missing values are filled here.
+        defaults = {
+            c.name: c.default.arg
+            for c in table.columns
+            if c.default is not None and c.default.is_scalar
+        }
+        columns = [
+            c.name for c in table.columns
+            if c.name != "id" and (c.name in keys or c.name in defaults)
+        ]
+        dialect = db.get_bind().dialect
+        processors = [table.c[name].type.bind_processor(dialect) for name in columns]
+        column_list = ", ".join(columns)
+
+        conn = db.connection()
+        conn.exec_driver_sql(
+            f"CREATE TEMP TABLE {STAGING_TABLE} ON COMMIT DROP AS "
+            f"SELECT {column_list} FROM jobs WITH NO DATA"
+        )
+        raw_conn = conn.connection.driver_connection
+        with raw_conn.cursor() as cur:
+            with cur.copy(f"COPY {STAGING_TABLE} ({column_list}) FROM STDIN") as copy:
+                for job in jobs:
+                    row = [job.get(name, defaults.get(name)) for name in columns]
+                    copy.write_row([
+                        proc(value) if proc else value
+                        for value, proc in zip(row, processors)
+                    ])
+
+        result = conn.exec_driver_sql(
+            f"INSERT INTO jobs (id, {column_list}) "
+            f"SELECT gen_random_uuid(), {column_list} FROM {STAGING_TABLE} "
+            "ON CONFLICT (url_hash) DO NOTHING RETURNING id"
+        )
+        new_ids = [row.id for row in result]
+        inserted = len(new_ids)
+        link_near_duplicates(db, new_ids)
+
+        db.commit()
+        logger.info(
+            "source.save_copy.done",
+            source=self.source_name,
+            inserted=inserted,
+            duplicates=len(jobs) - inserted,
+        )
+        return inserted
+
+    def ingest(self, jobs: list[dict], db: Session) -> int:
+        """Save jobs, switching to ``save_copy`` above ``settings.copy_ingest_threshold`` rows."""
+        if len(jobs) >= get_settings().copy_ingest_threshold:
+            return self.save_copy(jobs, db)
+        return self.save(jobs, db)
+
+
+_normalize_pool: ProcessPoolExecutor | None = None
+
+
+def _get_normalize_pool() -> ProcessPoolExecutor:
+    """Return the shared normalization pool, starting it on first use."""
+    global _normalize_pool
+    if _normalize_pool is None:
+        _normalize_pool = ProcessPoolExecutor(max_workers=get_settings().normalize_pool_workers)
+    return _normalize_pool
+
+
+def shutdown_normalize_pool() -> None:
+    """Stop the normalization worker processes, if any were started."""
+    global _normalize_pool
+    if _normalize_pool is not None:
+        _normalize_pool.shutdown(cancel_futures=True)
+        _normalize_pool = None
+
+
+def _normalize_in_worker(
+    source_cls: type[BaseSource], raw_jobs: list[dict]
+) -> tuple[list[dict], SourceRunStats]:
+    """Process-pool entry point: normalize a chunk with a fresh source instance.
+
+    Returns the jobs and the worker's counters for the parent's stats.
+    """
+    source = source_cls()
+    source.stats = SourceRunStats()
+    return source._normalize_page(raw_jobs), source.stats
+
+
+def _cancel_window(tasks: list[asyncio.Task]) -> None:
+    """Cancel unfinished page fetches; later failures are dropped, the first one was raised."""
+    for task in tasks:
+        if not task.done():
+            task.cancel()
+        elif not task.cancelled():
+            task.exception()  # mark as retrieved so it is not logged at garbage collection
+
+
+def _chunks_by_columns(jobs: list[dict], size: int) -> Iterator[list[dict]]:
+    """Split jobs into chunks of at most ``size`` rows sharing the same column set.
+
+    A multi-VALUES insert needs identical keys in every row; sources normally
+    produce uniform dicts, so this usually yields plain fixed-size slices.
+    """
+    groups: dict[frozenset, list[dict]] = {}
+    for job in jobs:
+        groups.setdefault(frozenset(job), []).append(job)
+    for rows in groups.values():
+        for i in range(0, len(rows), size):
+            yield rows[i : i + size]
@@ -0,0 +1,74 @@
+"""Per-source circuit breaker driven by ``collection_runs`` history.
+
+A source whose last ``circuit_failure_threshold`` runs all failed (error or
+timeout) is *open*: it is skipped until ``circuit_cooldown_seconds`` have
+passed since the last failure. After that it is *half-open* and the next
+run is a probe; success closes the circuit, another failure re-opens it for
+a fresh cooldown. Skipped runs are recorded but do not count either way.
+"""
+
+from collections.abc import Callable, Iterable
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.config import get_settings
+from app.models import CollectionRun
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+FAILURE_STATUSES = {"error", "timeout"}
+SKIPPED = "skipped"
+
+
+def breaker_state(
+    history: list[tuple[str, datetime]],
+    threshold: int,
+    cooldown: float,
+    now: datetime,
+) -> str:
+    """State for a source given its recent ``(status, started_at)`` runs, newest first."""
+    if threshold <= 0 or len(history) < threshold:
+        return CLOSED
+    recent = history[:threshold]
+    if not all(status in FAILURE_STATUSES for status, _ in recent):
+        return CLOSED
+    last_failure = recent[0][1]
+    if now - last_failure < timedelta(seconds=cooldown):
+        return OPEN
+    return HALF_OPEN
+
+
+def load_breaker_states(
+    session_factory: Callable[[], Session],
+    sources: Iterable[str],
+) -> dict[str, str]:
+    """Circuit state of each source from its run history. Blocking; call via a thread."""
+    settings = get_settings()
+    threshold = settings.circuit_failure_threshold
+    now = datetime.now(timezone.utc)
+    states = {}
+    db = session_factory()
+    try:
+        for source in sources:
+            history = []
+            if threshold > 0:
+                history = db.execute(
+                    select(CollectionRun.status, CollectionRun.started_at)
+                    .where(
+                        CollectionRun.source == source,
+                        CollectionRun.status != SKIPPED,
+                        CollectionRun.replayed.is_(False),
+                    )
+                    .order_by(CollectionRun.started_at.desc())
+                    .limit(threshold)
+                ).all()
+            states[source] = breaker_state(
+                [tuple(row) for row in history], threshold, settings.circuit_cooldown_seconds, now
+            )
+    finally:
+        db.close()
+    return states
@@ -0,0 +1,109 @@
+"""Link newly saved jobs to an earlier near-duplicate posting.
+
+The same job often arrives from several sources under different URLs. Each
+job carries a SimHash fingerprint (``simhash``) and its band keys
+(``simhash_bands``, GIN-indexed); after an insert, new rows sharing a band
+with an existing canonical job from another source are compared bit-wise.
+Those within ``settings.near_duplicate_distance`` that also have the same
+normalized title and company get ``canonical_job_id`` set; embedding and
+scoring then skip them. The title check matters because postings from one
+company share long boilerplate, which keeps their fingerprints close even
+for different roles.
+"""
+
+import re
+import uuid
+from collections.abc import Sequence
+from datetime import datetime
+
+import structlog
+from sqlalchemy import select, update
+from sqlalchemy.orm import Session, aliased
+
+from app.config import get_settings
+from app.models import Job
+from app.utils.simhash import hamming
+
+logger = structlog.get_logger(__name__)
+
+_NON_WORD_RE = re.compile(r"[\W_]+")
+COMPANY_SUFFIXES = {
+    "inc", "llc", "ltd", "limited", "gmbh", "corp", "corporation", "co", "sa", "srl", "bv",
+}
+
+
+def normalize_name(text: str | None) -> str:
+    """Lowercased words of a title or company name, punctuation removed."""
+    return " ".join(_NON_WORD_RE.sub(" ", (text or "").casefold()).split())
+
+
+def normalize_company(text: str | None) -> str:
+    """``normalize_name`` without trailing legal suffixes ("Acme, Inc." -> "acme")."""
+    words = normalize_name(text).split()
+    while len(words) > 1 and words[-1] in COMPANY_SUFFIXES:
+        words.pop()
+    return " ".join(words)
+
+
+def link_near_duplicates(db: Session, job_ids: Sequence[uuid.UUID]) -> int:
+    """Point new jobs at the canonical job they duplicate (does not commit).
+
+    ``job_ids`` are the rows just inserted. A new row is linked to the
+    closest (then oldest) canonical job from another source, saved before
+    this batch, with the same normalized title and company. Rows of the
+    batch are never candidates, so links never form chains or cycles.
+
+    Returns:
+        Number of jobs linked to a canonical job.
+    """
+    settings = get_settings()
+    if not settings.near_duplicate_enabled or not job_ids:
+        return 0
+
+    new = aliased(Job)
+    rows = db.execute(
+        select(
+            new.id, new.simhash, new.title, new.company,
+            Job.id, Job.simhash, Job.title, Job.company, Job.scraped_at,
+        )
+        .join(Job, Job.simhash_bands.overlap(new.simhash_bands))
+        .where(
+            new.id.in_(job_ids),
+            new.simhash.is_not(None),
+            Job.id.not_in(job_ids),
+            Job.source != new.source,
+            Job.canonical_job_id.is_(None),
+        )
+    ).all()
+    if not rows:
+        return 0
+
+    candidates: dict[uuid.UUID, list[tuple[int, datetime | None, uuid.UUID]]] = {}
+    for row in rows:
+        (new_id, new_hash, new_title, new_company,
+         cand_id, cand_hash, cand_title, cand_company, scraped_at) = row
+        distance = hamming(new_hash, cand_hash)
+        if (
+            distance <= settings.near_duplicate_distance
+            and normalize_name(new_title) == normalize_name(cand_title)
+            and normalize_company(new_company) == normalize_company(cand_company)
+        ):
+            candidates.setdefault(new_id, []).append((distance, scraped_at, cand_id))
+
+    links = {
+        new_id: min(
+            matches, key=lambda m: (m[0], m[1].timestamp() if m[1] else float("inf"))
+        )[2]
+        for new_id, matches in candidates.items()
+    }
+
+    if links:
+        db.execute(
+            update(Job),
+            [
+                {"id": job_id, "canonical_job_id": canonical_id}
+                for job_id, canonical_id in links.items()
+            ],
+        )
+        logger.info("source.dedupe.linked", linked=len(links), checked=len(job_ids))
+    return len(links)
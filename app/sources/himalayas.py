@@ -1,6 +1,6 @@
 """Himalayas data source — Tier 1 public REST API."""
 
-import asyncio
+from collections.abc import AsyncIterator
 from datetime import datetime, timezone
 
 import structlog
@@ -18,42 +18,49 @@ MAX_PAGES = 10
 class HimalayasSource(BaseSource):
     """Fetch jobs from Himalayas public API with offset pagination."""
 
+    incremental = True
+    rate_limit = (1.0, 4)
+
     @property
     def source_name(self) -> str:
         return "himalayas"
 
-    async def fetch(self) -> list[dict]:
-        """Paginate through Himalayas API (limit=20, offset)."""
-        all_jobs = []
-        offset = 0
+    def raw_url(self, raw_job: dict) -> str | None:
+        return raw_job.get("guid") or raw_job.get("applicationLink") or None
+
+    def raw_posted_at(self, raw_job: dict) -> datetime | None:
+        try:
+            return datetime.fromtimestamp(int(raw_job["pubDate"]), tz=timezone.utc)
+        except (KeyError, ValueError, TypeError, OSError):
+            return None
 
+    async def fetch_pages(self) -> AsyncIterator[list[dict]]:
+        """Paginate through Himalayas API (limit=20, offset), a window of pages at a time.
+
+        Stops at the first short page or page made entirely of postings already stored.
+        """
         async with self._get_client() as client:
-            for _ in range(MAX_PAGES):
-                resp = await client.get(
+
+            async def fetch_page(number: int) -> tuple[list[dict], bool]:
+                offset = number * PAGE_SIZE
+                resp = await self._request(
+                    client,
+                    "GET",
                     API_URL,
                     params={"limit": PAGE_SIZE, "offset": offset},
                 )
 
                 if resp.status_code == 429:
+                    # Still limited after the retries in _request
                     logger.warning("himalayas.rate_limited", offset=offset)
-                    break
+                    return [], False
 
                 resp.raise_for_status()
-                data = resp.json()
-
-                jobs = data.get("jobs", [])
-                if not jobs:
-                    break
-
-                all_jobs.extend(jobs)
-                offset += PAGE_SIZE
-
-                if len(jobs) < PAGE_SIZE:
-                    break
-
-                await asyncio.sleep(2)  # Respect rate limits
+                jobs = resp.json().get("jobs", [])
+                return jobs, len(jobs) == PAGE_SIZE
 
-        return all_jobs
+            async for jobs in self._paginate_window(fetch_page, MAX_PAGES):
+                yield jobs
 
     def normalize(self, raw_job: dict) -> dict | None:
         """Normalize a Himalayas job entry."""
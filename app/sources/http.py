@@ -0,0 +1,240 @@
+"""Process-wide pooled HTTP client shared by all sources.
+
+Every source used to open (and tear down) its own ``httpx.AsyncClient`` per
+``fetch()``, so nothing was reused across a run. The registry keeps one
+keep-alive client per event loop, caps concurrent requests per host, and
+counts new TCP connections per host so pool reuse can be tuned. Counters
+belong to the loop's pool, so each run (one ``asyncio.run``) reports only
+its own traffic.
+
+Concurrent runs on different loops (e.g. sync API routes, each running
+``run_collection`` in its own threadpool thread) get separate clients and
+per-host limits, and closing one run's pool leaves the others alone.
+"""
+
+import asyncio
+import threading
+import weakref
+from collections import defaultdict
+from collections.abc import AsyncIterator
+
+import httpx
+import structlog
+
+from app.config import get_settings
+
+logger = structlog.get_logger(__name__)
+
+CLOSE_TIMEOUT = 5.0
+
+
+class SharedClient:
+    """A borrowed view of the registry client with per-source default headers.
+
+    Supports ``async with`` like ``httpx.AsyncClient`` but never closes the
+    underlying pool — the registry owns it.
+    """
+
+    def __init__(self, registry: "ClientRegistry", headers: dict, timeout: float):
+        self._registry = registry
+        self._headers = headers
+        self._timeout = timeout
+
+    async def __aenter__(self) -> "SharedClient":
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        return None
+
+    async def request(self, method: str, url: str, **kwargs) -> httpx.Response:
+        headers = {**self._headers, **(kwargs.pop("headers", None) or {})}
+        kwargs.setdefault("timeout", self._timeout)
+        return await self._registry.request(method, url, headers=headers, **kwargs)
+
+    async def get(self, url: str, **kwargs) -> httpx.Response:
+        return await self.request("GET", url, **kwargs)
+
+    async def post(self, url: str, **kwargs) -> httpx.Response:
+        return await self.request("POST", url, **kwargs)
+
+
+class _LoopPool:
+    """The client, per-host slots and traffic counters belonging to one event loop."""
+
+    def __init__(self, client: httpx.AsyncClient):
+        self.client = client
+        self.host_slots: dict[str, asyncio.Semaphore] = {}
+        self.requests: dict[str, int] = defaultdict(int)
+        self.connections: dict[str, int] = defaultdict(int)
+
+
+class _SlotHeldStream(httpx.AsyncByteStream):
+    """A streamed body that keeps its per-host slot until the response is closed."""
+
+    def __init__(self, stream: httpx.AsyncByteStream, slots: asyncio.Semaphore):
+        self._stream = stream
+        self._slots: asyncio.Semaphore | None = slots
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        async for chunk in self._stream:
+            yield chunk
+
+    async def aclose(self) -> None:
+        try:
+            await self._stream.aclose()
+        finally:
+            if self._slots is not None:
+                self._slots.release()
+                self._slots = None
+
+
+class ClientRegistry:
+    """Owns the shared ``httpx.AsyncClient`` of each event loop and per-host limits."""
+
+    def __init__(self) -> None:
+        self._pools: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, _LoopPool] = (
+            weakref.WeakKeyDictionary()
+        )
+
+    def borrow(self, headers: dict, timeout: float) -> SharedClient:
+        """Return a handle sources can use in place of their own client."""
+        return SharedClient(self, headers, timeout)
+
+    def _get_pool(self) -> _LoopPool:
+        """Return the pool for the running loop, creating it on first use.
+
+        Pooled connections are bound to the loop that opened them, so each
+        loop (a fresh ``asyncio.run``, another thread's run) gets its own.
+        """
+        loop = asyncio.get_running_loop()
+        pool = self._pools.get(loop)
+        if pool is not None:
+            return pool
+
+        settings = get_settings()
+        limits = httpx.Limits(
+            max_connections=settings.http_max_connections,
+            max_keepalive_connections=settings.http_max_connections,
+            keepalive_expiry=settings.http_keepalive_expiry,
+        )
+        try:
+            client = httpx.AsyncClient(
+                http2=settings.http2_enabled, limits=limits, follow_redirects=True
+            )
+        except ImportError:
+            logger.warning("http.h2_unavailable", msg="h2 not installed, using HTTP/1.1")
+            client = httpx.AsyncClient(limits=limits, follow_redirects=True)
+
+        pool = self._pools[loop] = _LoopPool(client)
+        return pool
+
+    async def request(
+        self, method: str, url: str, stream: bool = False, **kwargs
+    ) -> httpx.Response:
+        """Send a request on the shared pool, holding a per-host slot.
+
+        With ``stream=True`` the response is returned as soon as its headers
+        arrive; the caller reads and closes it, and the slot stays held until
+        it does, so body downloads count against the per-host limit too.
+        """
+        pool = self._get_pool()
+        client = pool.client
+        host = httpx.URL(url).host
+
+        slots = pool.host_slots.get(host)
+        if slots is None:
+            slots = asyncio.Semaphore(get_settings().http_max_connections_per_host)
+            pool.host_slots[host] = slots
+
+        async def trace(event_name: str, info: dict) -> None:
+            if event_name == "connection.connect_tcp.complete":
+                pool.connections[host] += 1
+
+        extensions = {**(kwargs.pop("extensions", None) or {}), "trace": trace}
+        if not stream:
+            async with slots:
+                pool.requests[host] += 1
+                return await client.request(method, url, extensions=extensions, **kwargs)
+
+        await slots.acquire()
+        try:
+            pool.requests[host] += 1
+            request = client.build_request(method, url, extensions=extensions, **kwargs)
+            resp = await client.send(request, stream=True)
+        except BaseException:
+            slots.release()
+            raise
+        resp.stream = _SlotHeldStream(resp.stream, slots)
+        return resp
+
+    def stats(self) -> dict[str, dict]:
+        """Per-host request count, new connections opened and reuse ratio.
+
+        Covers the running loop's pool only, i.e. the current run.
+        """
+        try:
+            pool = self._pools.get(asyncio.get_running_loop())
+        except RuntimeError:
+            pool = None
+        return _pool_stats(pool) if pool is not None else {}
+
+    async def aclose(self) -> None:
+        """Close the running loop's pooled client and log the pool statistics."""
+        pool = self._pools.pop(asyncio.get_running_loop(), None)
+        if pool is not None:
+            logger.info("http.pool.stats", hosts=_pool_stats(pool))
+            await pool.client.aclose()
+
+    def close(self) -> None:
+        """Close every remaining pool on its own loop, for shutdown hooks.
+
+        Safe to call from inside a running loop: clients of a loop running
+        in another thread are closed there, idle loops are driven on a
+        helper thread, and clients of closed loops are simply dropped.
+        """
+        pools = list(self._pools.items())
+        self._pools.clear()
+        for loop, pool in pools:
+            try:
+                _close_on_loop(loop, pool.client)
+            except Exception:
+                logger.warning("http.pool.close_failed", exc_info=True)
+
+
+def _close_on_loop(loop: asyncio.AbstractEventLoop, client: httpx.AsyncClient) -> None:
+    """Close ``client`` on the loop its connections are bound to."""
+    if loop.is_closed():
+        return  # its connections went away with the loop
+    try:
+        current = asyncio.get_running_loop()
+    except RuntimeError:
+        current = None
+    if current is loop:
+        loop.create_task(client.aclose())
+    elif loop.is_running():
+        asyncio.run_coroutine_threadsafe(client.aclose(), loop).result(timeout=CLOSE_TIMEOUT)
+    else:
+        closer = threading.Thread(target=loop.run_until_complete, args=(client.aclose(),))
+        closer.start()
+        closer.join(CLOSE_TIMEOUT)
+
+
+def _pool_stats(pool: _LoopPool) -> dict[str, dict]:
+    """Per-host request count, new connections opened and reuse ratio of one pool."""
+    result = {}
+    for host, requests in pool.requests.items():
+        connections = pool.connections.get(host, 0)
+        result[host] = {
+            "requests": requests,
+            "connections": connections,
+            "reuse_ratio": round(1 - connections / requests, 3) if requests else 0.0,
+        }
+    return result
+
+
+_registry = ClientRegistry()
+
+
+def get_client_registry() -> ClientRegistry:
+    """Return the process-wide client registry."""
+    return _registry
@@ -0,0 +1,134 @@
+"""Conditional-GET validator cache for feed and bulk-JSON sources.
+
+Stores the ``ETag``/``Last-Modified`` of each URL on disk so the next run can
+send ``If-None-Match``/``If-Modified-Since``. A ``304 Not Modified`` means the
+whole catalogue is unchanged and the source can skip parsing and normalizing.
+
+Several processes may share the file: each write merges with what is on disk
+(newest use wins) and replaces the file atomically from a private temp file.
+"""
+
+import json
+import os
+import tempfile
+import time
+from pathlib import Path
+
+import httpx
+import structlog
+
+from app.config import get_settings
+
+logger = structlog.get_logger(__name__)
+
+
+class NotModifiedError(Exception):
+    """Raised by a conditional request when the server answers 304."""
+
+    def __init__(self, url: str):
+        super().__init__(url)
+        self.url = url
+
+
+class ValidatorCache:
+    """Disk-backed URL -> validators store with LRU eviction by entry count."""
+
+    def __init__(self, path: str | Path, max_entries: int):
+        self.path = Path(path)
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._entries: dict[str, dict] | None = None
+
+    def _load(self) -> dict[str, dict]:
+        if self._entries is None:
+            self._entries = self._read()
+        return self._entries
+
+    def _read(self) -> dict[str, dict]:
+        try:
+            entries = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
+        return entries if isinstance(entries, dict) else {}
+
+    def request_headers(self, url: str) -> dict[str, str]:
+        """Conditional headers to send for ``url`` (empty if never seen)."""
+        entry = self._load().get(url)
+        if not entry:
+            return {}
+        headers = {}
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
+
+    def record(self, url: str, resp: httpx.Response) -> dict | None:
+        """Count a hit or miss for ``resp`` and return its validators, if any."""
+        if resp.status_code == 304:
+            self.hits += 1
+            entry = self._load().get(url)
+            if entry is not None:  # may have been evicted since the request was sent
+                entry["used"] = time.time()
+            return None
+        self.misses += 1
+        etag = resp.headers.get("ETag")
+        last_modified = resp.headers.get("Last-Modified")
+        if not resp.is_success or not (etag or last_modified):
+            return None
+        return {"etag": etag, "last_modified": last_modified}
+
+    def update(self, validators: dict[str, dict]) -> None:
+        """Store validators and persist, evicting the least recently used entries.
+
+        Entries written by other processes since this one loaded the file are
+        kept; for a URL known to both, the more recently used entry wins.
+        """
+        if not validators:
+            return
+        entries = self._read()
+        for url, entry in self._load().items():
+            if entry.get("used", 0) > entries.get(url, {}).get("used", 0):
+                entries[url] = entry
+        now = time.time()
+        for url, entry in validators.items():
+            entries[url] = {**entry, "used": now}
+
+        if len(entries) > self.max_entries:
+            oldest = sorted(entries, key=lambda u: entries[u].get("used", 0))
+            for url in oldest[: len(entries) - self.max_entries]:
+                del entries[url]
+
+        self._entries = entries
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with tempfile.NamedTemporaryFile(
+            "w", encoding="utf-8", dir=self.path.parent, suffix=".tmp", delete=False
+        ) as tmp:
+            json.dump(entries, tmp)
+        try:
+            os.replace(tmp.name, self.path)
+        except OSError:
+            os.unlink(tmp.name)
+            raise
+
+    def stats(self) -> dict:
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / total, 3) if total else 0.0,
+            "entries": len(self._load()),
+        }
+
+
+_cache: ValidatorCache | None = None
+
+
+def get_validator_cache() -> ValidatorCache:
+    """Return the process-wide validator cache."""
+    global _cache
+    if _cache is None:
+        settings = get_settings()
+        _cache = ValidatorCache(settings.http_cache_path, settings.http_cache_max_entries)
+    return _cache
@@ -1,9 +1,11 @@
 """Jooble data source — Tier 2 REST API (key required)."""
 
+from collections.abc import AsyncIterator
+
 import structlog
 
 from app.config import get_settings
-from app.sources.base import BaseSource
+from app.sources.base import BaseSource, BudgetExhaustedError
 from app.utils.parsers import clean_html, extract_tags, parse_salary
 
 logger = structlog.get_logger(__name__)
@@ -25,41 +27,64 @@ class JoobleSource(BaseSource):
     def source_name(self) -> str:
         return "jooble"
 
-    async def fetch(self) -> list[dict]:
-        """POST to Jooble API with multiple keyword searches."""
+    @property
+    def request_budget(self) -> int | None:
+        return get_settings().jooble_request_budget or None
+
+    def raw_url(self, raw_job: dict) -> str | None:
+        return raw_job.get("link") or None
+
+    async def fetch_pages(self) -> AsyncIterator[list[dict]]:
+        """POST all keyword searches concurrently, yielding each as it completes.
+
+        Each search pages on until an empty page, a page already stored in
+        the database or ``deep_pagination_max_pages``.
+        """
         settings = get_settings()
         if not settings.jooble_api_key:
             logger.warning("jooble.no_api_key", msg="JOOBLE_API_KEY not set, skipping")
-            return []
-
-        all_jobs = []
-        seen_links = set()
+            return
 
         async with self._get_client() as client:
-            for keywords in SEARCH_KEYWORDS:
-                try:
-                    resp = await client.post(
-                        f"{API_URL}{settings.jooble_api_key}",
-                        json={
-                            "keywords": keywords,
-                            "location": "remote",
-                            "salary": "50000",
-                            "page": 1,
-                        },
-                    )
-                    resp.raise_for_status()
-                    data = resp.json()
 
-                    for job in data.get("jobs", []):
-                        link = job.get("link", "")
-                        if link and link not in seen_links:
-                            seen_links.add(link)
-                            all_jobs.append(job)
-
-                except Exception:
-                    logger.exception("jooble.search.error", keywords=keywords)
+            async def search(keywords: str) -> list[dict]:
+
+                async def fetch_page(number: int) -> tuple[list[dict], bool]:
+                    try:
+                        resp = await self._request(
+                            client,
+                            "POST",
+                            f"{API_URL}{settings.jooble_api_key}",
+                            cached=True,
+                            cache_endpoint=API_URL,
+                            json={
+                                "keywords": keywords,
+                                "location": "remote",
+                                "salary": "50000",
+                                "page": number + 1,
+                            },
+                        )
+                        resp.raise_for_status()
+                        jobs = resp.json().get("jobs", [])
+                    except BudgetExhaustedError:
+                        return [], False
+                    except Exception:
+                        logger.exception("jooble.search.error", keywords=keywords, page=number + 1)
+                        return [], False
+                    return jobs, bool(jobs)
+
+                return [
+                    job
+                    async for page in self._paginate_window(
+                        fetch_page, settings.deep_pagination_max_pages, stop_when_stored=True
+                    )
+                    for job in page
+                ]
 
-        return all_jobs
+            async for jobs in self._fan_out(
+                SEARCH_KEYWORDS, search, key=lambda job: job.get("link")
+            ):
+                yield jobs
 
     def normalize(self, raw_job: dict) -> dict | None:
         """Normalize a Jooble job entry."""
@@ -0,0 +1,119 @@
+"""Known-URL filter: drop already-stored postings before normalizing them.
+
+On a steady-state run nearly every fetched posting is already in ``jobs``,
+yet each one used to be HTML-cleaned and tag-extracted before ``save()``
+discarded it. The filter is a Bloom filter over ``jobs.url_hash``, built
+once per run. Filter hits are confirmed with one ``url_hash IN (...)`` query
+per page, so a false positive never drops a new posting.
+
+The filter can be kept in Redis between runs; the next run then only adds
+URLs created since it was stored instead of rescanning the table.
+"""
+
+from collections.abc import Callable, Iterable
+from datetime import datetime
+
+import redis
+import structlog
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+
+from app.config import get_settings
+from app.models import Job
+from app.utils.bloom import BloomFilter
+from app.utils.urls import url_hash
+
+logger = structlog.get_logger(__name__)
+
+REDIS_KEY = "jobhunter:known_url_hashes"
+MIN_CAPACITY = 10_000
+LOAD_BATCH = 10_000
+
+
+class KnownUrlFilter:
+    """Bloom filter over stored URL hashes, with database confirmation of hits."""
+
+    def __init__(self, bloom: BloomFilter, session_factory: Callable[[], Session]):
+        self.bloom = bloom
+        self.session_factory = session_factory
+
+    def might_contain_all(self, urls: Iterable[str]) -> bool:
+        """False if any URL is certainly not stored (no database query needed)."""
+        return all(url_hash(url) in self.bloom for url in urls)
+
+    def known(self, urls: Iterable[str]) -> set[str]:
+        """The subset of ``urls`` stored in ``jobs``. Blocking; call via a thread."""
+        candidates = {}
+        for url in set(urls):
+            digest = url_hash(url)
+            if digest in self.bloom:
+                candidates[digest] = url
+        if not candidates:
+            return set()
+        db = self.session_factory()
+        try:
+            stored = db.scalars(select(Job.url_hash).where(Job.url_hash.in_(list(candidates))))
+            return {candidates[digest] for digest in stored}
+        finally:
+            db.close()
+
+
+def _add_hashes(bloom: BloomFilter, db: Session, since: datetime | None) -> None:
+    query = select(Job.url_hash).where(Job.url_hash.is_not(None))
+    if since is not None:
+        query = query.where(Job.created_at >= since)
+    for digest in db.scalars(query.execution_options(yield_per=LOAD_BATCH)):
+        bloom.add(digest)
+
+
+def load_known_urls(session_factory: Callable[[], Session]) -> KnownUrlFilter:
+    """Build (or refresh from Redis) the known-URL filter. Blocking.
+
+    Returns:
+        A filter covering every URL in ``jobs`` at load time.
+    """
+    settings = get_settings()
+    db = session_factory()
+    try:
+        total, newest = db.execute(select(func.count(Job.id), func.max(Job.created_at))).one()
+
+        client = None
+        if settings.known_url_filter_redis:
+            client = redis.from_url(settings.redis_url, socket_connect_timeout=1.0)
+        bloom = None
+        since = None
+        if client is not None:
+            try:
+                raw, raw_since = client.hmget(REDIS_KEY, ["bloom", "since"])
+                if raw and raw_since:
+                    bloom = BloomFilter.from_bytes(raw)
+                    since = datetime.fromisoformat(raw_since.decode())
+            except (redis.RedisError, OSError, ValueError):
+                logger.warning("known_urls.redis_unavailable", exc_info=True)
+                client = None
+
+        if bloom is None or bloom.full or bloom.count > 2 * max(total, 1):
+            # Size for growth so the stored filter stays accurate for a while
+            bloom = BloomFilter(
+                max(MIN_CAPACITY, total * 2), settings.known_url_filter_error_rate
+            )
+            since = None
+        _add_hashes(bloom, db, since)
+
+        if client is not None and newest is not None:
+            try:
+                client.hset(
+                    REDIS_KEY, mapping={"bloom": bloom.to_bytes(), "since": newest.isoformat()}
+                )
+            except (redis.RedisError, OSError):
+                logger.warning("known_urls.redis_store_failed", exc_info=True)
+
+        logger.info(
+            "known_urls.loaded",
+            urls=total,
+            incremental=since is not None,
+            size_bytes=len(bloom.bits),
+        )
+        return KnownUrlFilter(bloom, session_factory)
+    finally:
+        db.close()
@@ -0,0 +1,280 @@
+"""Run many sources concurrently in one event loop under a global deadline.
+
+Sources that keep failing are skipped by a per-source circuit breaker (see
+``app.sources.circuit``) until their cooldown has passed.
+"""
+
+import asyncio
+from datetime import datetime, timezone
+
+import structlog
+
+from app.config import get_settings
+from app.database import SessionLocal
+from app.sources.archive import ArchiveReplay, ArchiveWriter, new_run_id, prune_archive
+from app.sources.base import BaseSource, shutdown_normalize_pool
+from app.sources.circuit import HALF_OPEN, OPEN, SKIPPED, load_breaker_states
+from app.sources.http import get_client_registry
+from app.sources.known_urls import KnownUrlFilter, load_known_urls
+from app.sources.response_cache import get_response_cache
+from app.sources.telemetry import SourceRunStats, record_runs
+from app.utils.html_memo import get_html_memo
+
+logger = structlog.get_logger(__name__)
+
+
+def _load_watermark(source: BaseSource) -> None:
+    """Load a source's watermark; on failure the source simply runs in full."""
+    db = SessionLocal()
+    try:
+        source.load_watermark(db)
+    except Exception:
+        logger.exception("collection.watermark_error", source=source.source_name)
+    finally:
+        db.close()
+
+
+async def _load_known_urls() -> KnownUrlFilter | None:
+    """Build the known-URL filter once per run; on failure every posting is normalized."""
+    try:
+        return await asyncio.to_thread(load_known_urls, SessionLocal)
+    except Exception:
+        logger.exception("collection.known_urls_error")
+        return None
+
+
+async def _prune_html_memo(max_age_days: int) -> None:
+    """Expire old ``clean_html`` memo entries once per run, before any worker uses them."""
+    memo = get_html_memo()
+    if memo is None:
+        return
+    try:
+        deleted = await asyncio.to_thread(memo.prune, max_age_days)
+    except Exception:
+        logger.exception("collection.html_memo_prune_error")
+        return
+    if deleted:
+        logger.info("collection.html_memo_pruned", deleted=deleted)
+
+
+async def _load_breaker_states(sources: list[BaseSource]) -> dict[str, str]:
+    """Circuit state per source; on failure every source runs."""
+    try:
+        return await asyncio.to_thread(
+            load_breaker_states, SessionLocal, [s.source_name for s in sources]
+        )
+    except Exception:
+        logger.exception("collection.circuit_error")
+        return {}
+
+
+async def _run_source(
+    source: BaseSource,
+    gate: asyncio.Semaphore,
+    save: bool,
+    spans: dict[str, list[datetime]],
+) -> dict:
+    """Collect (and optionally save) a single source, recording when it ran in ``spans``."""
+    async with gate:
+        span = spans[source.source_name] = [datetime.now(timezone.utc)]
+        try:
+            if save and source.incremental and source.replay is None:
+                await asyncio.to_thread(_load_watermark, source)
+            if not save:
+                jobs = await source.collect()
+                return {"fetched": len(jobs), "inserted": 0}
+
+            fetched, inserted = await source.collect_stream(SessionLocal)
+            source.commit_http_cache()
+            return {"fetched": fetched, "inserted": inserted}
+        finally:
+            span.append(datetime.now(timezone.utc))
+
+
+def _run_record(source: BaseSource, status: str, error: str | None, span: list[datetime]) -> dict:
+    """Build the ``collection_runs`` fields for one source."""
+    stats = source.stats or SourceRunStats()
+    if status == "ok" and stats.error_count and not stats.normalized_count:
+        status = "error"  # every request failed; the fetch error was logged and swallowed
+    now = datetime.now(timezone.utc)
+    return {
+        "source": source.source_name,
+        "status": status,
+        "error": error,
+        "started_at": span[0] if span else now,
+        "finished_at": span[1] if len(span) > 1 else now,
+        **stats.as_dict(),
+    }
+
+
+async def collect_sources(
+    sources: list[BaseSource],
+    save: bool = True,
+    deadline: float | None = None,
+    max_sources: int | None = None,
+    use_cache: bool = True,
+    run_id: str | None = None,
+    replay: str | None = None,
+) -> dict[str, dict]:
+    """Collect from all sources at once.
+
+    Args:
+        sources: Source instances to run.
+        save: Persist normalized jobs to the database.
+        deadline: Seconds before unfinished sources are cancelled
+            (defaults to ``settings.collection_deadline_seconds``).
+        max_sources: Maximum sources running at the same time
+            (defaults to ``settings.collection_max_sources``; 0 means all).
+        use_cache: Answer paid-API queries from the Redis response cache
+            when a fresh copy exists.
+        run_id: Id under which responses are archived (generated if omitted).
+        replay: Id of an archived run to replay instead of using the network;
+            sources not recorded in that run are skipped.
+
+    Returns:
+        Mapping of source name to ``{"fetched", "inserted"}``, with
+        ``"error": True`` added for sources that failed or timed out and
+        ``"skipped": True`` for sources whose circuit is open. A timed-out
+        source reports the jobs it saved before it was cancelled.
+    """
+    settings = get_settings()
+    if deadline is None:
+        deadline = settings.collection_deadline_seconds
+    if max_sources is None:
+        max_sources = settings.collection_max_sources
+
+    writer = None
+    replayer = None
+    if replay:
+        replayer = ArchiveReplay(settings.archive_path, replay)
+        recorded = replayer.sources()
+        for source in sources:
+            if source.source_name not in recorded:
+                logger.info("collection.replay_skip", source=source.source_name, run_id=replay)
+        sources = [s for s in sources if s.source_name in recorded]
+        run_id = replay
+    else:
+        run_id = run_id or new_run_id()
+        if settings.archive_enabled:
+            writer = ArchiveWriter(settings.archive_path, run_id)
+
+    results = {}
+    runs = []
+    if save and not replay and settings.circuit_failure_threshold > 0:
+        states = await _load_breaker_states(sources)
+        for source in sources:
+            state = states.get(source.source_name)
+            if state == OPEN:
+                logger.warning("collection.circuit_open", source=source.source_name)
+                results[source.source_name] = {"fetched": 0, "inserted": 0, "skipped": True}
+                source.stats = None
+                runs.append(_run_record(source, SKIPPED, "circuit open", []))
+            elif state == HALF_OPEN:
+                logger.info("collection.circuit_half_open", source=source.source_name)
+        sources = [s for s in sources if states.get(s.source_name) != OPEN]
+
+    if not sources:
+        if writer is not None:
+            writer.close()
+        if runs:
+            await _record_runs(run_id, runs, bool(replay))
+        return results
+
+    await _prune_html_memo(settings.html_memo_max_age_days)
+
+    known_urls = None
+    # A replay re-processes postings that are already stored; filtering them
+    # out would leave it nothing to normalize
+    if save and settings.known_url_filter_enabled and not replay:
+        known_urls = await _load_known_urls()
+
+    for source in sources:
+        source.use_response_cache = use_cache
+        source.archive = writer
+        source.replay = replayer
+        source.known_urls = known_urls
+
+    gate = asyncio.Semaphore(max_sources or len(sources))
+    spans: dict[str, list[datetime]] = {}
+    tasks = [asyncio.create_task(_run_source(s, gate, save, spans)) for s in sources]
+
+    logger.info(
+        "collection.start",
+        sources=len(sources),
+        deadline=deadline,
+        run_id=run_id,
+        replay=bool(replay),
+    )
+    try:
+        _, pending = await asyncio.wait(tasks, timeout=deadline)
+        for task in pending:
+            task.cancel()
+        if pending:
+            # Cancelled sources flush what they already normalized; bound that too
+            await asyncio.wait(pending, timeout=settings.collection_cancel_grace_seconds)
+    finally:
+        await get_client_registry().aclose()
+        await get_response_cache().aclose()
+        shutdown_normalize_pool()
+        if writer is not None:
+            writer.close()
+
+    for source, task in zip(sources, tasks):
+        span = spans.get(source.source_name, [])
+        if task in pending:
+            stats = source.stats or SourceRunStats()
+            logger.warning(
+                "collection.source_timeout",
+                source=source.source_name,
+                inserted=stats.inserted_count,
+            )
+            results[source.source_name] = {
+                "fetched": stats.normalized_count,
+                "inserted": stats.inserted_count,
+                "error": True,
+            }
+            runs.append(_run_record(source, "timeout", "deadline exceeded", span))
+        elif task.exception() is not None:
+            logger.error(
+                "collection.source_error",
+                source=source.source_name,
+                exc_info=task.exception(),
+            )
+            results[source.source_name] = {"fetched": 0, "inserted": 0, "error": True}
+            runs.append(_run_record(source, "error", repr(task.exception()), span))
+        else:
+            results[source.source_name] = task.result()
+            runs.append(_run_record(source, "ok", None, span))
+
+    if save:
+        await _record_runs(run_id, runs, bool(replay))
+    if writer is not None and settings.archive_retention_days > 0:
+        await _prune_archive(settings.archive_path, settings.archive_retention_days)
+
+    logger.info(
+        "collection.done",
+        total_fetched=sum(r["fetched"] for r in results.values()),
+        total_inserted=sum(r["inserted"] for r in results.values()),
+    )
+    return results
+
+
+async def _prune_archive(root: str, max_age_days: int) -> None:
+    """Drop expired archived runs; a failure is logged and never fails the collection."""
+    try:
+        await asyncio.to_thread(prune_archive, root, max_age_days)
+    except Exception:
+        logger.exception("collection.archive_prune_error", root=root)
+
+
+async def _record_runs(run_id: str, runs: list[dict], replayed: bool) -> None:
+    """Persist run telemetry; a failure is logged and never fails the collection."""
+    try:
+        await asyncio.to_thread(record_runs, SessionLocal, run_id, runs, replayed)
+    except Exception:
+        logger.exception("collection.telemetry_error", run_id=run_id)
+
+
+def run_collection(sources: list[BaseSource], **kwargs) -> dict[str, dict]:
+    """Synchronous wrapper around ``collect_sources`` for CLI, Celery and scripts."""
+    return asyncio.run(collect_sources(sources, **kwargs))
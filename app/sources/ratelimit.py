@@ -0,0 +1,77 @@
+"""Per-host token-bucket rate limiting shared by all sources.
+
+Replaces the fixed ``asyncio.sleep`` pauses sources used between requests.
+Each host gets one bucket, configured by the first source that uses it
+(``BaseSource.rate_limit``). On a 429/503 the bucket is paused for the
+server's ``Retry-After`` and its rate is halved; successful responses
+slowly restore it to the configured rate.
+"""
+
+import asyncio
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+
+MIN_RATE_FACTOR = 0.125  # never slow a host below 1/8 of its configured rate
+RECOVERY_FACTOR = 1.1
+
+
+class TokenBucket:
+    """Async token bucket (in GCRA form, so no lock or refill task is needed).
+
+    Allows ``burst`` requests at once, then one every ``1 / rate`` seconds.
+    """
+
+    def __init__(self, rate: float, burst: int = 1):
+        self.max_rate = rate
+        self.rate = rate
+        self.burst = max(1, burst)
+        self._tat = 0.0  # theoretical arrival time of the next request
+        self._blocked_until = 0.0
+
+    async def acquire(self) -> None:
+        """Wait until a request may be sent."""
+        now = time.monotonic()
+        interval = 1.0 / self.rate
+        start = max(now, self._tat - (self.burst - 1) * interval, self._blocked_until)
+        self._tat = max(self._tat, start) + interval
+        if start > now:
+            await asyncio.sleep(start - now)
+
+    def penalize(self, retry_after: float) -> None:
+        """Back off after a rate-limit response: pause, then send at half the rate."""
+        self._blocked_until = max(self._blocked_until, time.monotonic() + retry_after)
+        self.rate = max(self.rate / 2, self.max_rate * MIN_RATE_FACTOR)
+
+    def reward(self) -> None:
+        """Move the rate back towards the configured maximum after a success."""
+        if self.rate < self.max_rate:
+            self.rate = min(self.rate * RECOVERY_FACTOR, self.max_rate)
+
+
+_buckets: dict[str, TokenBucket] = {}
+
+
+def get_bucket(host: str, rate: float, burst: int) -> TokenBucket:
+    """Return the bucket for ``host``, creating it with ``rate``/``burst`` on first use."""
+    bucket = _buckets.get(host)
+    if bucket is None:
+        bucket = TokenBucket(rate, burst)
+        _buckets[host] = bucket
+    return bucket
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """Parse a ``Retry-After`` header (delta-seconds or HTTP-date) into seconds."""
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
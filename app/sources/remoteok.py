@@ -1,5 +1,6 @@
 """RemoteOK data source — Tier 1 public JSON API."""
 
+from collections.abc import AsyncIterator
 from datetime import datetime, timezone
 
 import structlog
@@ -19,19 +20,29 @@ class RemoteOKSource(BaseSource):
     def source_name(self) -> str:
         return "remoteok"
 
-    async def fetch(self) -> list[dict]:
-        """GET https://remoteok.com/api — returns JSON array, first item is metadata."""
-        async with self._get_client() as client:
-            resp = await client.get(API_URL)
-            resp.raise_for_status()
-            data = resp.json()
+    def raw_url(self, raw_job: dict) -> str | None:
+        url = raw_job.get("url") or None
+        if url and url.startswith("/"):
+            url = f"https://remoteok.com{url}"
+        return url
 
-        # First item is metadata/legal notice — skip it
-        if data and isinstance(data, list) and isinstance(data[0], dict):
-            if "legal" in data[0] or "0" in data[0]:
-                data = data[1:]
+    async def fetch_pages(self) -> AsyncIterator[list[dict]]:
+        """GET https://remoteok.com/api — a JSON array whose first item is metadata.
 
-        return data
+        The array is parsed as it downloads and yielded in pages. Sent as a
+        conditional GET; an unchanged catalogue raises ``NotModifiedError``.
+        """
+        first = True
+        async with self._get_client() as client:
+            async for page in self._stream_items(
+                client, "GET", API_URL, "item", conditional=True
+            ):
+                # First item is metadata/legal notice — skip it
+                if first and page and isinstance(page[0], dict):
+                    if "legal" in page[0] or "0" in page[0]:
+                        page = page[1:]
+                first = False
+                yield page
 
     def normalize(self, raw_job: dict) -> dict | None:
         """Normalize a RemoteOK job entry."""
@@ -1,5 +1,6 @@
 """Remotive data source — Tier 1 public REST API (2 req/min limit)."""
 
+from collections.abc import AsyncIterator
 from datetime import datetime
 
 import structlog
@@ -19,21 +20,30 @@ class RemotiveSource(BaseSource):
     We make a single request to avoid hitting limits.
     """
 
+    rate_limit = (2 / 60, 1)
+
     @property
     def source_name(self) -> str:
         return "remotive"
 
-    async def fetch(self) -> list[dict]:
-        """Single request to Remotive API — returns up to ~300 software-dev jobs."""
+    def raw_url(self, raw_job: dict) -> str | None:
+        return raw_job.get("url") or None
+
+    async def fetch_pages(self) -> AsyncIterator[list[dict]]:
+        """Single request to Remotive API — returns up to ~300 software-dev jobs.
+
+        The ``jobs`` array is parsed as it downloads and yielded in pages.
+        """
         async with self._get_client() as client:
-            resp = await client.get(
+            async for page in self._stream_items(
+                client,
+                "GET",
                 API_URL,
+                "jobs.item",
                 params={"category": "software-dev", "limit": 300},
-            )
-            resp.raise_for_status()
-            data = resp.json()
-
-        return data.get("jobs", [])
+                conditional=True,
+            ):
+                yield page
 
     def normalize(self, raw_job: dict) -> dict | None:
         """Normalize a Remotive job entry."""
@@ -0,0 +1,158 @@
+"""Redis-backed TTL cache of API responses for paid/quota-limited sources.
+
+SerpAPI bills per search and Jooble/Adzuna have quotas, so re-running the
+same query matrix within the TTL (a retried Celery task, a manual
+``/sources/collect/{name}`` call) is answered from Redis instead. Keys hash
+(source, endpoint, params/body) with credentials removed. If Redis is
+unreachable the cache switches itself off and requests go to the network.
+Each event loop gets its own Redis client, so concurrent runs on different
+loops never share (or close) each other's connections.
+"""
+
+import asyncio
+import hashlib
+import json
+import weakref
+from collections import defaultdict
+
+import httpx
+import redis.asyncio as aioredis
+import structlog
+from redis.exceptions import RedisError
+
+from app.config import get_settings
+
+logger = structlog.get_logger(__name__)
+
+KEY_PREFIX = "jobhunter:response"
+CREDENTIAL_PARAMS = {"api_key", "app_id", "app_key", "key", "token"}
+
+
+def cache_key(
+    source: str, method: str, endpoint: str, params: dict | None, body: dict | None
+) -> str:
+    """Stable key for a request, ignoring credential parameters."""
+    payload = {
+        "method": method.upper(),
+        "endpoint": endpoint,
+        "params": {k: v for k, v in (params or {}).items() if k not in CREDENTIAL_PARAMS},
+        "body": {k: v for k, v in (body or {}).items() if k not in CREDENTIAL_PARAMS},
+    }
+    digest = hashlib.sha256(json.dumps(payload, sort_keys=True, default=str).encode()).hexdigest()
+    return f"{KEY_PREFIX}:{source}:{digest}"
+
+
+class ResponseCache:
+    """Stores successful response bodies in Redis with a per-source TTL."""
+
+    def __init__(self, url: str, default_ttl: int, ttls: dict[str, int]):
+        self.url = url
+        self.default_ttl = default_ttl
+        self.ttls = ttls
+        self.hits: dict[str, int] = defaultdict(int)
+        self.misses: dict[str, int] = defaultdict(int)
+        self._clients: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, aioredis.Redis] = (
+            weakref.WeakKeyDictionary()
+        )
+        self._unavailable: weakref.WeakSet[asyncio.AbstractEventLoop] = weakref.WeakSet()
+
+    def ttl(self, source: str) -> int:
+        return self.ttls.get(source, self.default_ttl)
+
+    def _get_client(self) -> aioredis.Redis | None:
+        """Return the client for the running loop, or None once Redis has failed."""
+        loop = asyncio.get_running_loop()
+        if loop in self._unavailable:
+            return None
+        client = self._clients.get(loop)
+        if client is None:
+            client = self._clients[loop] = aioredis.from_url(
+                self.url, socket_connect_timeout=1.0, socket_timeout=2.0
+            )
+        return client
+
+    def _disable(self) -> None:
+        loop = asyncio.get_running_loop()
+        if loop not in self._unavailable:
+            logger.warning("response_cache.unavailable", url=self.url, exc_info=True)
+        self._unavailable.add(loop)
+
+    async def get(self, source: str, key: str, request: httpx.Request) -> httpx.Response | None:
+        """Return the cached response for ``key``, counting a hit or miss."""
+        client = self._get_client()
+        if client is None:
+            return None
+        try:
+            raw = await client.get(key)
+        except (RedisError, OSError):
+            self._disable()
+            return None
+
+        if raw is None:
+            self.misses[source] += 1
+            return None
+        self.hits[source] += 1
+        meta, _, content = raw.partition(b"\n")
+        meta = json.loads(meta)
+        return httpx.Response(
+            meta["status"],
+            headers={"Content-Type": meta["content_type"]} if meta["content_type"] else None,
+            content=content,
+            request=request,
+        )
+
+    async def set(self, source: str, key: str, resp: httpx.Response) -> None:
+        """Cache a successful response for the source's TTL."""
+        client = self._get_client()
+        ttl = self.ttl(source)
+        if client is None or not resp.is_success or ttl <= 0:
+            return
+        meta = json.dumps({
+            "status": resp.status_code,
+            "content_type": resp.headers.get("Content-Type"),
+        })
+        try:
+            await client.set(key, meta.encode() + b"\n" + resp.content, ex=ttl)
+        except (RedisError, OSError):
+            self._disable()
+
+    def stats(self) -> dict[str, dict]:
+        """Per-source hits, misses and hit rate since the process started."""
+        result = {}
+        for source in set(self.hits) | set(self.misses):
+            hits, misses = self.hits[source], self.misses[source]
+            result[source] = {
+                "hits": hits,
+                "misses": misses,
+                "hit_rate": round(hits / (hits + misses), 3),
+            }
+        return result
+
+    async def aclose(self) -> None:
+        """Close the running loop's Redis connection and log the cache statistics."""
+        if self.hits or self.misses:
+            logger.info("response_cache.stats", sources=self.stats())
+        loop = asyncio.get_running_loop()
+        self._unavailable.discard(loop)
+        client = self._clients.pop(loop, None)
+        if client is not None:
+            try:
+                await client.aclose()
+            except (RedisError, OSError):
+                pass
+
+
+_cache: ResponseCache | None = None
+
+
+def get_response_cache() -> ResponseCache:
+    """Return the process-wide response cache."""
+    global _cache
+    if _cache is None:
+        settings = get_settings()
+        _cache = ResponseCache(
+            settings.redis_url,
+            settings.response_cache_ttl_seconds,
+            settings.response_cache_ttls,
+        )
+    return _cache
@@ -1,11 +1,11 @@
 """SerpAPI Google Jobs — Tier 2 paid API ($75/mo)."""
 
-import asyncio
+from collections.abc import AsyncIterator
 
 import structlog
 
 from app.config import get_settings
-from app.sources.base import BaseSource
+from app.sources.base import BaseSource, BudgetExhaustedError
 from app.utils.parsers import clean_html, extract_tags, parse_salary
 
 logger = structlog.get_logger(__name__)
@@ -23,47 +23,71 @@ QUERIES = [
 class SerpAPIGoogleSource(BaseSource):
     """Fetch jobs from Google Jobs via SerpAPI."""
 
+    rate_limit = (1.0, 2)
+
     @property
     def source_name(self) -> str:
         return "serpapi_google"
 
-    async def fetch(self) -> list[dict]:
-        """Search Google Jobs via SerpAPI for multiple queries."""
+    @property
+    def request_budget(self) -> int | None:
+        return get_settings().serpapi_request_budget or None
+
+    def raw_url(self, raw_job: dict) -> str | None:
+        return _job_url(raw_job) or None
+
+    async def fetch_pages(self) -> AsyncIterator[list[dict]]:
+        """Search Google Jobs for all queries concurrently, yielding each as it completes.
+
+        Google Jobs pages are chained by ``next_page_token``, so each query
+        follows its chain one page at a time until it ends, a page is
+        already stored in the database or ``deep_pagination_max_pages``.
+        """
         settings = get_settings()
         if not settings.serpapi_key:
             logger.warning("serpapi.no_key", msg="SERPAPI_KEY not set, skipping")
-            return []
-
-        all_jobs = []
-        seen_titles = set()
+            return
 
         async with self._get_client() as client:
-            for query in QUERIES:
-                try:
-                    resp = await client.get(
-                        API_URL,
-                        params={
-                            "engine": "google_jobs",
-                            "q": query,
-                            "api_key": settings.serpapi_key,
-                            "hl": "en",
-                        },
-                    )
-                    resp.raise_for_status()
-                    data = resp.json()
-
-                    for job in data.get("jobs_results", []):
-                        key = f"{job.get('title', '')}-{job.get('company_name', '')}"
-                        if key not in seen_titles:
-                            seen_titles.add(key)
-                            all_jobs.append(job)
-
-                except Exception:
-                    logger.exception("serpapi.search.error", query=query)
-
-                await asyncio.sleep(1)
-
-        return all_jobs
+
+            async def search(query: str) -> list[dict]:
+                results: list[dict] = []
+                token = None
+                for page in range(settings.deep_pagination_max_pages):
+                    params = {
+                        "engine": "google_jobs",
+                        "q": query,
+                        "api_key": settings.serpapi_key,
+                        "hl": "en",
+                    }
+                    if token:
+                        params["next_page_token"] = token
+                    try:
+                        resp = await self._request(
+                            client, "GET", API_URL, cached=True, params=params
+                        )
+                        resp.raise_for_status()
+                        data = resp.json()
+                    except BudgetExhaustedError:
+                        break
+                    except Exception:
+                        logger.exception("serpapi.search.error", query=query, page=page + 1)
+                        break
+
+                    jobs = data.get("jobs_results", [])
+                    if not jobs:
+                        break
+                    if await self._page_has_only_stored(jobs):
+                        logger.info("source.caught_up", source=self.source_name, page=page)
+                        break
+                    results.extend(jobs)
+                    token = (data.get("serpapi_pagination") or {}).get("next_page_token")
+                    if not token:
+                        break
+                return results
+
+            async for jobs in self._fan_out(QUERIES, search, key=_dedupe_key):
+                yield jobs
 
     def normalize(self, raw_job: dict) -> dict | None:
         """Normalize a SerpAPI Google Jobs result."""
@@ -82,22 +106,7 @@ class SerpAPIGoogleSource(BaseSource):
         salary_text = extensions.get("salary", "")
         salary_min, salary_max, currency = parse_salary(salary_text)
 
-        # Build a URL from related links or use a search-based fallback
-        related = raw_job.get("related_links", [])
-        url = ""
-        for link in related:
-            if link.get("link"):
-                url = link["link"]
-                break
-
-        if not url:
-            # Use job_id-based apply link if available
-            apply_options = raw_job.get("apply_options", [])
-            for opt in apply_options:
-                if opt.get("link"):
-                    url = opt["link"]
-                    break
-
+        url = _job_url(raw_job)
         if not url:
             return None
 
@@ -116,3 +125,20 @@ class SerpAPIGoogleSource(BaseSource):
             "posted_at": None,
             "tags": tags,
         }
+
+
+def _job_url(job: dict) -> str:
+    """First related link, falling back to the first apply option."""
+    for link in job.get("related_links", []):
+        if link.get("link"):
+            return link["link"]
+    # Use job_id-based apply link if available
+    for opt in job.get("apply_options", []):
+        if opt.get("link"):
+            return opt["link"]
+    return ""
+
+
+def _dedupe_key(job: dict) -> str:
+    """SerpAPI has no stable id per posting; title + company identifies it."""
+    return f"{job.get('title', '')}-{job.get('company_name', '')}"
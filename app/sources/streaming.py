@@ -0,0 +1,92 @@
+"""Incremental JSON parsing for large array-style API responses.
+
+``JsonItemParser`` is fed the response body chunk by chunk and hands back
+the items under an ijson-style ``prefix`` (``"item"`` for a top-level array,
+``"jobs.item"`` for ``{"jobs": [...]}``) as soon as each one is complete, so
+the raw body, its decoded text and the whole object tree never sit in memory
+together.
+"""
+
+import json
+from collections.abc import Iterator
+from typing import Any
+
+import structlog
+
+try:
+    import ijson
+except ImportError:  # pragma: no cover - ijson is a declared dependency
+    ijson = None
+
+logger = structlog.get_logger(__name__)
+
+
+class JsonItemParser:
+    """Push parser yielding the JSON values found under ``prefix``.
+
+    Without ijson installed the body is buffered and decoded in one go when
+    ``close()`` is called, which gives the same items without the memory
+    savings.
+    """
+
+    def __init__(self, prefix: str):
+        self.prefix = prefix
+        self._items: list[Any] = []
+        self._buffer: list[bytes] | None = None
+        self._coro = None
+        if ijson is not None:
+            self._items = ijson.sendable_list()
+            self._coro = ijson.items_coro(self._items, prefix, use_float=True)
+        else:
+            _warn_unavailable()
+            self._buffer = []
+
+    def feed(self, chunk: bytes) -> list[Any]:
+        """Parse one chunk of the body and return the items it completed."""
+        if self._coro is None:
+            self._buffer.append(chunk)
+            return []
+        self._coro.send(chunk)
+        return self._drain()
+
+    def close(self) -> list[Any]:
+        """Finish parsing and return the remaining items.
+
+        Raises:
+            ValueError (or ``ijson.JSONError``) if the body is not valid JSON.
+        """
+        if self._coro is None:
+            body = b"".join(self._buffer)
+            self._buffer = []
+            return list(_walk(json.loads(body), self.prefix.split(".")))
+        self._coro.close()
+        return self._drain()
+
+    def _drain(self) -> list[Any]:
+        items = list(self._items)
+        del self._items[:]
+        return items
+
+
+_warned = False
+
+
+def _warn_unavailable() -> None:
+    global _warned
+    if not _warned:
+        logger.warning("source.stream.ijson_unavailable", msg="buffering JSON bodies")
+        _warned = True
+
+
+def _walk(node: Any, parts: list[str]) -> Iterator[Any]:
+    """Values of a decoded document under an ijson prefix."""
+    if not parts:
+        yield node
+        return
+    head, rest = parts[0], parts[1:]
+    if head == "item":
+        if isinstance(node, list):
+            for child in node:
+                yield from _walk(child, rest)
+    elif isinstance(node, dict) and head in node:
+        yield from _walk(node[head], rest)
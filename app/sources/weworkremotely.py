@@ -1,6 +1,6 @@
 """We Work Remotely data source — Tier 1 RSS feeds."""
 
-import asyncio
+from collections.abc import AsyncIterator
 from datetime import datetime, timezone
 
 import feedparser
@@ -8,6 +8,7 @@ import httpx
 import structlog
 
 from app.sources.base import BaseSource, USER_AGENT
+from app.sources.http_cache import NotModifiedError
 from app.utils.parsers import clean_html, extract_tags
 
 logger = structlog.get_logger(__name__)
@@ -23,21 +24,32 @@ RSS_FEEDS = [
 class WeWorkRemotelySource(BaseSource):
     """Fetch jobs from We Work Remotely RSS feeds."""
 
+    rate_limit = (1.0, len(RSS_FEEDS))
+
     @property
     def source_name(self) -> str:
         return "weworkremotely"
 
-    async def fetch(self) -> list[dict]:
-        """Fetch and parse all RSS feeds."""
-        all_entries = []
+    def raw_url(self, raw_job: dict) -> str | None:
+        return raw_job.get("link") or None
+
+    async def fetch_pages(self) -> AsyncIterator[list[dict]]:
+        """Fetch and parse each RSS feed, yielding one page per feed.
+
+        Feeds unchanged since the last run are skipped.
+        """
         seen_links = set()
 
         async with self._get_client() as client:
             for feed_url in RSS_FEEDS:
+                entries = []
                 try:
-                    resp = await client.get(
+                    resp = await self._request(
+                        client,
+                        "GET",
                         feed_url,
                         headers={"User-Agent": USER_AGENT, "Accept": "application/rss+xml"},
+                        conditional=True,
                     )
                     resp.raise_for_status()
 
@@ -46,14 +58,15 @@ class WeWorkRemotelySource(BaseSource):
                         link = entry.get("link", "")
                         if link and link not in seen_links:
                             seen_links.add(link)
-                            all_entries.append(entry)
+                            entries.append(entry)
 
+                except NotModifiedError:
+                    logger.info("wwr.feed.not_modified", feed_url=feed_url)
                 except Exception:
                     logger.exception("wwr.feed.error", feed_url=feed_url)
 
-                await asyncio.sleep(1)
-
-        return all_entries
+                if entries:
+                    yield entries
 
     def normalize(self, raw_job: dict) -> dict | None:
         """Normalize an RSS feed entry.
@@ -1,11 +1,12 @@
 """Celery tasks for job collection."""
 
-import asyncio
-
 import structlog
+from celery.signals import worker_process_shutdown
 
-from app.database import SessionLocal
 from app.sources import get_all_sources
+from app.sources.base import shutdown_normalize_pool
+from app.sources.http import get_client_registry
+from app.sources.orchestrator import run_collection
 from app.tasks.celery_app import celery_app
 
 logger = structlog.get_logger(__name__)
@@ -16,27 +17,7 @@ def daily_collect() -> dict:
     """Collect jobs from all configured sources."""
     logger.info("task.daily_collect.start")
 
-    sources = get_all_sources()
-    results = {}
-
-    for source in sources:
-        try:
-            jobs = asyncio.run(source.collect())
-            inserted = 0
-            if jobs:
-                db = SessionLocal()
-                try:
-                    inserted = source.save(jobs, db)
-                finally:
-                    db.close()
-
-            results[source.source_name] = {
-                "fetched": len(jobs),
-                "inserted": inserted,
-            }
-        except Exception:
-            logger.exception("task.daily_collect.source_error", source=source.source_name)
-            results[source.source_name] = {"fetched": 0, "inserted": 0, "error": True}
+    results = run_collection(get_all_sources())
 
     total_fetched = sum(r["fetched"] for r in results.values())
     total_inserted = sum(r["inserted"] for r in results.values())
@@ -47,3 +28,10 @@ def daily_collect() -> dict:
         total_inserted=total_inserted,
     )
     return results
+
+
+@worker_process_shutdown.connect
+def close_http_clients(**kwargs) -> None:
+    """Release pooled source connections and normalize workers when a worker process exits."""
+    get_client_registry().close()
+    shutdown_normalize_pool()
@@ -0,0 +1,62 @@
+"""Compact Bloom filter for set-membership pre-checks (e.g. known job URLs)."""
+
+import hashlib
+import math
+
+
+class BloomFilter:
+    """Fixed-size Bloom filter using double hashing over one blake2b digest.
+
+    ``item in bloom`` is never a false negative; false positives occur at
+    roughly ``error_rate`` once ``capacity`` items have been added, so a
+    positive must be confirmed against the source of truth.
+    """
+
+    def __init__(self, capacity: int, error_rate: float = 0.001):
+        capacity = max(1, capacity)
+        self.capacity = capacity
+        self.size = max(8, int(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.hashes = max(1, round(self.size / capacity * math.log(2)))
+        self.bits = bytearray((self.size + 7) // 8)
+        self.count = 0
+
+    def _positions(self, item: str | bytes) -> list[int]:
+        if isinstance(item, str):
+            item = item.encode("utf-8")
+        digest = hashlib.blake2b(item, digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        return [(h1 + i * h2) % self.size for i in range(self.hashes)]
+
+    def add(self, item: str | bytes) -> None:
+        for pos in self._positions(item):
+            self.bits[pos >> 3] |= 1 << (pos & 7)
+        self.count += 1
+
+    def update(self, items) -> None:
+        for item in items:
+            self.add(item)
+
+    def __contains__(self, item: str | bytes) -> bool:
+        return all(self.bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(item))
+
+    @property
+    def full(self) -> bool:
+        """True once more items were added than the filter was sized for."""
+        return self.count > self.capacity
+
+    def to_bytes(self) -> bytes:
+        """Serialize as a ``capacity:size:hashes:count:`` header followed by the bits."""
+        header = f"{self.capacity}:{self.size}:{self.hashes}:{self.count}:"
+        return header.encode() + bytes(self.bits)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "BloomFilter":
+        capacity, size, hashes, count, bits = data.split(b":", 4)
+        bloom = cls.__new__(cls)
+        bloom.capacity = int(capacity)
+        bloom.size = int(size)
+        bloom.hashes = int(hashes)
+        bloom.count = int(count)
+        bloom.bits = bytearray(bits)
+        return bloom
@@ -0,0 +1,186 @@
+"""Content-hash memo for ``clean_html``.
+
+Feeds return the same HTML descriptions day after day. Cleaned text is
+cached under a 16-byte BLAKE2b digest of the raw HTML: first in a bounded
+in-process LRU, then (optionally) in a SQLite file shared by every process
+and every run, so an unchanged description is never parsed twice. Expired
+disk entries are removed by ``prune()``, which the collection orchestrator
+calls once per run; pool workers only read and write.
+"""
+
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from pathlib import Path
+
+import structlog
+
+from app.config import get_settings
+
+logger = structlog.get_logger(__name__)
+
+KEY_BYTES = 16
+KEY_PERSON = b"clean_html/v1"  # bump when clean_html's output changes
+
+
+class HtmlMemo:
+    """Bounded LRU of cleaned HTML over an optional SQLite store.
+
+    ``hits``, ``misses``, ``bytes_saved`` (UTF-8 bytes of HTML that did
+    not need parsing) and ``disk_errors`` only ever grow; callers diff
+    ``counters()`` to attribute them. Disk writes are buffered until
+    ``flush()``. A disk error disables the store for the rest of the
+    process; the LRU keeps working.
+    """
+
+    def __init__(self, max_entries: int, path: str | Path | None = None):
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self.bytes_saved = 0
+        self.disk_errors = 0
+        self._entries: OrderedDict[bytes, str] = OrderedDict()
+        self._pending: dict[bytes, str] = {}
+        self._lock = threading.Lock()
+        self._write_lock = threading.Lock()
+        self._db: sqlite3.Connection | None = None
+        if path:
+            self._open(Path(path))
+
+    def _open(self, path: Path) -> None:
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            db = sqlite3.connect(path, timeout=5.0, check_same_thread=False)
+            db.execute("PRAGMA journal_mode=WAL")
+            db.execute("PRAGMA synchronous=NORMAL")
+            db.execute(
+                "CREATE TABLE IF NOT EXISTS cleaned "
+                "(key BLOB PRIMARY KEY, text TEXT NOT NULL, created_at REAL NOT NULL)"
+            )
+            db.commit()
+            self._db = db
+        except (sqlite3.Error, OSError):
+            self.disk_errors += 1
+            logger.error("html_memo.disk_unavailable", path=str(path), exc_info=True)
+
+    def prune(self, max_age_days: int) -> int:
+        """Delete disk entries older than ``max_age_days``; returns how many.
+
+        A failed prune is logged and leaves the store enabled.
+        """
+        with self._lock:
+            db = self._db
+        if db is None:
+            return 0
+        with self._write_lock:
+            try:
+                deleted = db.execute(
+                    "DELETE FROM cleaned WHERE created_at < ?",
+                    (time.time() - max_age_days * 86400,),
+                ).rowcount
+                db.commit()
+            except sqlite3.Error:
+                logger.warning("html_memo.prune_error", exc_info=True)
+                return 0
+        return deleted
+
+    def clean(self, html: str, cleaner: Callable[[str], str]) -> str:
+        """Cleaned text for ``html``, calling ``cleaner`` only on a miss."""
+        data = html.encode("utf-8", "surrogatepass")
+        key = hashlib.blake2b(data, digest_size=KEY_BYTES, person=KEY_PERSON).digest()
+        with self._lock:
+            text = self._entries.get(key)
+            if text is not None:
+                self._entries.move_to_end(key)
+            else:
+                text = self._pending.get(key)
+                if text is None:
+                    text = self._load(key)
+                if text is not None:
+                    self._remember(key, text)
+            if text is not None:
+                self.hits += 1
+                self.bytes_saved += len(data)
+                return text
+
+        text = cleaner(html)
+        with self._lock:
+            self.misses += 1
+            self._remember(key, text)
+            if self._db is not None:
+                self._pending[key] = text
+        return text
+
+    def _load(self, key: bytes) -> str | None:
+        if self._db is None:
+            return None
+        try:
+            row = self._db.execute("SELECT text FROM cleaned WHERE key = ?", (key,)).fetchone()
+        except sqlite3.Error:
+            self._disable()
+            return None
+        return row[0] if row else None
+
+    def _remember(self, key: bytes, text: str) -> None:
+        self._entries[key] = text
+        if len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def flush(self) -> None:
+        """Write buffered entries to the disk store.
+
+        Lookups are not blocked while the write runs, so this can be called
+        from a worker thread while the event loop keeps cleaning.
+        """
+        with self._lock:
+            db = self._db
+            if db is None or not self._pending:
+                return
+            rows = [(key, text, time.time()) for key, text in self._pending.items()]
+            self._pending = {}
+        with self._write_lock:
+            try:
+                db.executemany("INSERT OR IGNORE INTO cleaned VALUES (?, ?, ?)", rows)
+                db.commit()
+            except sqlite3.Error:
+                with self._lock:
+                    if self._db is db:
+                        self._disable()
+
+    def _disable(self) -> None:
+        self.disk_errors += 1
+        logger.error("html_memo.disk_disabled", exc_info=True)
+        try:
+            self._db.close()
+        except sqlite3.Error:
+            pass
+        self._db = None
+        self._pending = {}
+
+    def counters(self) -> tuple[int, int, int, int]:
+        """Current ``(hits, misses, bytes_saved, disk_errors)``."""
+        return self.hits, self.misses, self.bytes_saved, self.disk_errors
+
+
+_memo: HtmlMemo | None = None
+_memo_pid: int | None = None
+
+
+def get_html_memo() -> HtmlMemo | None:
+    """Return this process's memo (``None`` when disabled), creating it on first use.
+
+    Each process, including normalize pool workers, opens its own SQLite
+    connection; the file itself is shared.
+    """
+    global _memo, _memo_pid
+    if _memo_pid != os.getpid():
+        settings = get_settings()
+        _memo = None
+        if settings.html_memo_size > 0:
+            _memo = HtmlMemo(settings.html_memo_size, settings.html_memo_path or None)
+        _memo_pid = os.getpid()
+    return _memo
@@ -1,26 +1,18 @@
 """Salary parsing, tag extraction, and HTML cleaning utilities."""
 
 import re
+from collections.abc import Callable, Iterable
+from concurrent.futures import Executor, ProcessPoolExecutor
+from functools import lru_cache
 
 from selectolax.parser import HTMLParser
 
-# Common tech skills for tag extraction
-KNOWN_SKILLS = {
-    "python", "javascript", "typescript", "ruby", "go", "golang", "rust", "java",
-    "c#", "c++", "php", "swift", "kotlin", "scala", "elixir", "clojure", "haskell",
-    "smalltalk", "perl", "r", "sql", "nosql", "graphql",
-    "react", "angular", "vue", "svelte", "next.js", "nextjs", "nuxt", "remix",
-    "node.js", "nodejs", "express", "fastapi", "django", "flask",
-    "ruby on rails", "rails", "spring", "laravel", ".net", "asp.net",
-    "aws", "gcp", "azure", "docker", "kubernetes", "k8s", "terraform",
-    "postgresql", "postgres", "mysql", "mongodb", "redis", "elasticsearch",
-    "kafka", "rabbitmq", "celery",
-    "git", "ci/cd", "jenkins", "github actions",
-    "linux", "devops", "sre", "mlops",
-    "machine learning", "deep learning", "ai", "llm", "nlp",
-    "rest", "api", "microservices", "grpc",
-    "agile", "scrum",
-}
+from app.utils.html_memo import get_html_memo
+from app.utils.skills import get_skill_taxonomy
+
+BATCH_CHUNK_SIZE = 1000  # max texts per worker task in the batch functions
+BATCH_MIN_CHUNK = 100  # smaller inputs are not worth shipping to a worker
+SALARY_CACHE_SIZE = 4096  # distinct salary strings remembered by parse_salary
 
 # Currency symbols and codes
 CURRENCY_MAP = {
@@ -36,11 +28,40 @@ PERIOD_MULTIPLIERS = {
     "hour": 2080, "hr": 2080, "hourly": 2080,
 }
 
+_CURRENCIES = list(CURRENCY_MAP.items())
+_PERIODS = list(PERIOD_MULTIPLIERS.items())
+_CURRENCY_RANK = {term: i for i, (term, _) in enumerate(_CURRENCIES)}
+_PERIOD_RANK = {term: i for i, (term, _) in enumerate(_PERIODS)}
+
+
+def _alternation(terms: Iterable[str]) -> str:
+    return "|".join(re.escape(t) for t in sorted(terms, key=len, reverse=True))
+
+
+# A number with its optional "k", or (zero-width, so overlapping terms such
+# as "gbpa" still yield both) a currency or period term.
+_SALARY_TOKEN_RE = re.compile(
+    r"(?P<num>\d[\d,\.]*)\s*(?P<k>k)?"
+    rf"|(?=(?P<currency>{_alternation(CURRENCY_MAP)})"
+    rf"|(?P<period>{_alternation(PERIOD_MULTIPLIERS)}))"
+)
+
 
 def clean_html(html: str) -> str:
-    """Strip HTML tags and return clean text using selectolax."""
+    """Strip HTML tags and return clean text using selectolax.
+
+    Results are memoized by content hash (see ``app.utils.html_memo``), so a
+    description seen before is not parsed again.
+    """
     if not html:
         return ""
+    memo = get_html_memo()
+    if memo is None:
+        return _clean_html(html)
+    return memo.clean(html, _clean_html)
+
+
+def _clean_html(html: str) -> str:
     tree = HTMLParser(html)
     text = tree.text(separator="\n", strip=True)
     # Collapse multiple newlines
@@ -51,53 +72,52 @@ def clean_html(html: str) -> str:
 def parse_salary(text: str | None) -> tuple[int | None, int | None, str]:
     """Parse salary information from text.
 
+    Results are cached per string (the same few salary strings recur across
+    feeds and runs), so callers must not rely on getting a fresh tuple.
+
     Returns:
         Tuple of (min_salary, max_salary, currency) as annual USD equivalents.
         Returns (None, None, 'USD') if unparseable.
     """
     if not text:
         return None, None, "USD"
+    return _parse_salary(text)
 
-    text = text.lower().strip()
 
-    # Detect currency
-    currency = "USD"
-    for symbol, code in CURRENCY_MAP.items():
-        if symbol in text:
-            currency = code
-            break
-
-    # Find numbers (handle formats like "50,000", "50k", "50.000")
+@lru_cache(maxsize=SALARY_CACHE_SIZE)
+def _parse_salary(text: str) -> tuple[int | None, int | None, str]:
+    # One pass over the text collects numbers, currencies and periods.
+    # Currency and period terms match as substrings, like "pa" in "company",
+    # and the first one in dict order wins.
+    currency_rank, period_rank = len(_CURRENCIES), len(_PERIODS)  # "none seen"
     numbers = []
-    for match in re.finditer(r"(\d[\d,\.]*)\s*k?", text):
-        raw = match.group(1).replace(",", "")
-        # Handle European decimal notation (50.000 = 50000)
-        if "." in raw and len(raw.split(".")[-1]) == 3:
+    for raw, k, currency_term, period_term in _SALARY_TOKEN_RE.findall(text.lower().strip()):
+        if not raw:
+            if currency_term:
+                currency_rank = min(currency_rank, _CURRENCY_RANK[currency_term])
+            else:
+                period_rank = min(period_rank, _PERIOD_RANK[period_term])
+            continue
+
+        # Handle formats like "50,000", "50k", "50.000" (European notation)
+        raw = raw.replace(",", "")
+        if "." in raw and len(raw.rsplit(".", 1)[-1]) == 3:
             raw = raw.replace(".", "")
         try:
             val = float(raw)
         except ValueError:
             continue
-        # Handle "k" suffix (50k = 50000)
-        if match.group(0).rstrip().endswith("k"):
+        if k:
             val *= 1000
         numbers.append(int(val))
 
+    currency = _CURRENCIES[currency_rank][1] if currency_rank < len(_CURRENCIES) else "USD"
     if not numbers:
         return None, None, currency
 
-    # Detect period and convert to annual
-    multiplier = 1
-    for period, mult in PERIOD_MULTIPLIERS.items():
-        if period in text:
-            multiplier = mult
-            break
-
-    numbers = [n * multiplier for n in numbers]
-
-    # Filter out unreasonable values (likely not salaries)
-    numbers = [n for n in numbers if 10000 <= n <= 1000000]
-
+    # Convert to annual and drop values that are unlikely to be salaries
+    multiplier = _PERIODS[period_rank][1] if period_rank < len(_PERIODS) else 1
+    numbers = [n * multiplier for n in numbers if 10000 <= n * multiplier <= 1000000]
     if not numbers:
         return None, None, currency
 
@@ -110,22 +130,87 @@ def parse_salary(text: str | None) -> tuple[int | None, int | None, str]:
 def extract_tags(text: str) -> list[str]:
     """Extract known tech skills/tags from text.
 
+    Matches names and aliases from the skill taxonomy (``app.utils.skills``)
+    in a single scan and reports each as its canonical skill, so
+    ``"Golang"`` and ``"Go"`` both give ``"go"``.
+
     Returns:
-        Sorted list of unique matched skill tags.
+        Sorted list of unique canonical skill tags.
     """
     if not text:
         return []
+    return sorted(get_skill_taxonomy().find(text))
+
+
+def extract_tags_batch(
+    texts: Iterable[str | None],
+    workers: int = 0,
+    chunk_size: int = BATCH_CHUNK_SIZE,
+    executor: Executor | None = None,
+) -> list[list[str]]:
+    """``extract_tags`` over many texts, results in input order.
+
+    Identical texts are only scanned once. With ``workers`` > 1 the texts
+    are split into one chunk per worker (at most ``chunk_size`` texts each)
+    and scanned in a process pool: ``executor`` if given, so callers making
+    many calls can reuse one pool, otherwise a pool created for this call.
+    """
+    return _map_batch(_extract_tags_chunk, texts, workers, chunk_size, executor)
 
-    text_lower = text.lower()
-    found = set()
 
-    for skill in KNOWN_SKILLS:
-        # Use word boundary matching for short skills to avoid false positives
-        if len(skill) <= 2:
-            pattern = rf"\b{re.escape(skill)}\b"
-            if re.search(pattern, text_lower):
-                found.add(skill)
-        elif skill in text_lower:
-            found.add(skill)
+def parse_salary_batch(
+    texts: Iterable[str | None],
+    workers: int = 0,
+    chunk_size: int = BATCH_CHUNK_SIZE,
+    executor: Executor | None = None,
+) -> list[tuple[int | None, int | None, str]]:
+    """``parse_salary`` over many texts, results in input order.
 
-    return sorted(found)
+    Salary strings repeat a lot, so each distinct string is parsed once.
+    ``workers``, ``chunk_size`` and ``executor`` work as in
+    ``extract_tags_batch``.
+    """
+    return _map_batch(_parse_salary_chunk, texts, workers, chunk_size, executor)
+
+
+def _extract_tags_chunk(texts: list[str | None]) -> list[list[str]]:
+    seen: dict[str | None, list[str]] = {}
+    results = []
+    for text in texts:
+        tags = seen.get(text)
+        if tags is None:
+            tags = seen[text] = extract_tags(text)
+        results.append(list(tags))
+    return results
+
+
+def _parse_salary_chunk(texts: list[str | None]) -> list[tuple[int | None, int | None, str]]:
+    seen: dict[str | None, tuple[int | None, int | None, str]] = {}
+    results = []
+    for text in texts:
+        salary = seen.get(text)
+        if salary is None:
+            salary = seen[text] = parse_salary(text)
+        results.append(salary)
+    return results
+
+
+def _map_batch[T, R](
+    fn: Callable[[list[T]], list[R]],
+    items: Iterable[T],
+    workers: int,
+    chunk_size: int,
+    executor: Executor | None = None,
+) -> list[R]:
+    """Apply a chunk function to ``items``, across processes when worthwhile."""
+    items = list(items)
+    if workers <= 1:
+        return fn(items)
+    size = min(chunk_size, max(BATCH_MIN_CHUNK, -(-len(items) // workers)))
+    if len(items) <= size:
+        return fn(items)
+    chunks = [items[i : i + size] for i in range(0, len(items), size)]
+    if executor is not None:
+        return [result for chunk in executor.map(fn, chunks) for result in chunk]
+    with ProcessPoolExecutor(max_workers=min(workers, len(chunks))) as pool:
+        return [result for chunk in pool.map(fn, chunks) for result in chunk]
@@ -0,0 +1,60 @@
+"""64-bit SimHash fingerprints for near-duplicate job detection.
+
+Similar texts get fingerprints that differ in only a few bits. Splitting a
+fingerprint into four 16-bit bands makes candidate lookup an index probe:
+two fingerprints within Hamming distance 3 must agree on at least one band.
+"""
+
+import hashlib
+import re
+
+BITS = 64
+BANDS = 4
+BAND_BITS = BITS // BANDS
+MAX_TEXT = 5000  # characters of description considered
+SHINGLE = 2
+
+_WORD_RE = re.compile(r"\w+")
+
+
+def _feature_hash(feature: str) -> str:
+    digest = hashlib.blake2b(feature.encode("utf-8"), digest_size=8).digest()
+    return f"{int.from_bytes(digest, 'big'):064b}"
+
+
+def simhash(text: str) -> int:
+    """Unsigned 64-bit SimHash over word 2-shingles of ``text``."""
+    words = _WORD_RE.findall(text.lower())
+    if len(words) >= SHINGLE:
+        features = {" ".join(words[i : i + SHINGLE]) for i in range(len(words) - SHINGLE + 1)}
+    else:
+        features = set(words)
+    if not features:
+        return 0
+
+    # Column-wise bit counts: bit i is set if most feature hashes set it
+    counts = [column.count("1") for column in zip(*map(_feature_hash, features))]
+    half = len(features) / 2
+    return int("".join("1" if c > half else "0" for c in counts), 2)
+
+
+def job_simhash(title: str, company: str, description: str) -> int:
+    """Fingerprint of a normalized job, ignoring case and punctuation."""
+    return simhash(f"{title} {company} {description[:MAX_TEXT]}")
+
+
+def to_signed(value: int) -> int:
+    """Map an unsigned 64-bit fingerprint onto PostgreSQL's signed BIGINT."""
+    return value - (1 << BITS) if value >= 1 << (BITS - 1) else value
+
+
+def bands(value: int) -> list[int]:
+    """Band keys ``band_index << 16 | band_bits`` for an (un)signed fingerprint."""
+    value &= (1 << BITS) - 1
+    mask = (1 << BAND_BITS) - 1
+    return [(i << BAND_BITS) | ((value >> (i * BAND_BITS)) & mask) for i in range(BANDS)]
+
+
+def hamming(a: int, b: int) -> int:
+    """Number of differing bits between two (un)signed fingerprints."""
+    return ((a ^ b) & ((1 << BITS) - 1)).bit_count()
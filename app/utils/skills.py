@@ -0,0 +1,164 @@
+"""Skill taxonomy: canonical skills, their aliases and categories.
+
+The vocabulary lives in ``app/data/skills.json`` (override with
+``SKILL_TAXONOMY_PATH``), one entry per canonical skill::
+
+    "postgresql": {"category": "database", "aliases": ["postgres", "psql"]},
+    "rails": {"category": "backend", "aliases": ["ruby on rails"], "word_aliases": ["ror"]},
+    "c#": {"category": "language", "aliases": ["csharp"], "related": [".net"]},
+
+Every name and alias is a *term*. Terms match case-insensitively anywhere
+in the text (``"sql"`` inside ``"postgresql"``), except terms of one or two
+characters and ``word_aliases``, which only match as whole words. All terms
+are compiled into one trie regex, so a text is scanned once and each match
+resolves straight to its canonical skill. ``related`` skills are not
+aliases (a ``.net`` mention is still tagged ``.net``); the matcher gives
+them partial credit.
+"""
+
+import json
+import re
+from collections.abc import Iterable
+from pathlib import Path
+
+from app.config import get_settings
+
+DEFAULT_TAXONOMY_PATH = Path(__file__).resolve().parent.parent / "data" / "skills.json"
+
+
+class SkillTaxonomy:
+    """Compiled skill vocabulary shared by tag extraction and job matching."""
+
+    def __init__(self, entries: dict[str, dict]):
+        self.categories: dict[str, str | None] = {}
+        self._related: dict[str, frozenset[str]] = {}
+        self._canonical: dict[str, str] = {}
+        bounded: set[str] = set()
+        for name, entry in entries.items():
+            skill_id = name.lower().strip()
+            self.categories[skill_id] = entry.get("category")
+            self._related[skill_id] = frozenset(r.lower().strip() for r in entry.get("related", []))
+            words = [w.lower().strip() for w in entry.get("word_aliases", [])]
+            bounded.update(words)
+            for term in [skill_id, *(a.lower().strip() for a in entry.get("aliases", [])), *words]:
+                owner = self._canonical.setdefault(term, skill_id)
+                if owner != skill_id:
+                    raise ValueError(
+                        f"Skill term {term!r} belongs to both {owner!r} and {skill_id!r}"
+                    )
+        bounded.update(term for term in self._canonical if len(term) <= 2)
+
+        self._pattern = re.compile(_trie_pattern(self._canonical, bounded), re.DOTALL)
+        self._prefixes = _term_prefixes(self._canonical, bounded)
+
+    @classmethod
+    def load(cls, path: str | Path) -> "SkillTaxonomy":
+        """Read and compile a taxonomy JSON file."""
+        return cls(json.loads(Path(path).read_text(encoding="utf-8")))
+
+    @property
+    def terms(self) -> frozenset[str]:
+        """Every name and alias in the vocabulary."""
+        return frozenset(self._canonical)
+
+    def canonical(self, term: str) -> str | None:
+        """Canonical skill for a name or alias (``None`` if unknown)."""
+        return self._canonical.get(term.lower().strip())
+
+    def category(self, skill_id: str) -> str | None:
+        return self.categories.get(skill_id)
+
+    def related(self, skill_id: str) -> frozenset[str]:
+        """Canonical skills listed as related to ``skill_id``."""
+        return self._related.get(skill_id, frozenset())
+
+    def find_terms(self, text: str) -> set[str]:
+        """Terms (names and aliases, lowercased) that occur in ``text``.
+
+        Each search returns the longest term starting at the next candidate
+        position; every term that is a prefix of it is included too, so
+        overlapping terms are all found.
+        """
+        if not text:
+            return set()
+        text_lower = text.lower()
+        found = set()
+        search = self._pattern.search
+        pos = 0
+        while match := search(text_lower, pos):
+            start = match.start()
+            for term, bounded in self._prefixes[match.group()]:
+                if bounded is None or bounded.match(text_lower, start):
+                    found.add(term)
+            pos = start + 1
+        return found
+
+    def find(self, text: str) -> set[str]:
+        """Canonical skills mentioned in ``text``."""
+        canonical = self._canonical
+        return {canonical[term] for term in self.find_terms(text)}
+
+
+def _trie_pattern(terms: Iterable[str], bounded: set[str]) -> str:
+    """One regex over a character trie of ``terms`` matching the longest term at a position.
+
+    Bounded terms end in lookbehind and ``\\b`` assertions equivalent to
+    ``\\b{term}\\b``, so the pattern still begins with a literal character
+    and ``re`` can skip ahead cheaply.
+    """
+    trie: dict = {}
+    for term in terms:
+        node = trie
+        for char in term:
+            node = node.setdefault(char, {})
+        node[""] = term
+
+    def build(node: dict) -> str:
+        branches = [re.escape(char) + build(child) for char, child in sorted(node.items()) if char]
+        term = node.get("")
+        optional = False
+        if term is not None:
+            if term in bounded:
+                # \b before the first character, checked once the term is consumed
+                look = "(?<!\\w" if re.match(r"\w", term[0]) else "(?<=\\w"
+                branches.append(f"{look}.{{{len(term)}}})\\b")
+            else:
+                optional = True
+        if not branches:
+            return ""
+        body = branches[0] if len(branches) == 1 else f"(?:{'|'.join(branches)})"
+        return f"(?:{body})?" if optional else body
+
+    return build(trie)
+
+
+def _term_prefixes(
+    terms: Iterable[str], bounded: set[str]
+) -> dict[str, tuple[tuple[str, re.Pattern | None], ...]]:
+    """For each term, every term that is a prefix of it (itself included).
+
+    Bounded prefixes carry the ``\\b{term}\\b`` pattern they must still
+    satisfy at the match position; the matched term itself never needs it.
+    """
+    terms = sorted(set(terms))
+    patterns = {t: re.compile(rf"\b{re.escape(t)}\b") for t in terms if t in bounded}
+    return {
+        longest: tuple(
+            (t, patterns.get(t) if t != longest else None)
+            for t in terms
+            if longest.startswith(t)
+        )
+        for longest in terms
+    }
+
+
+_taxonomy: SkillTaxonomy | None = None
+
+
+def get_skill_taxonomy() -> SkillTaxonomy:
+    """Return the process-wide taxonomy, compiling it on first use."""
+    global _taxonomy
+    if _taxonomy is None:
+        path = get_settings().skill_taxonomy_path or DEFAULT_TAXONOMY_PATH
+        _taxonomy = SkillTaxonomy.load(path)
+    return _taxonomy
@@ -0,0 +1,55 @@
+"""URL canonicalization and fixed-width URL hashes for job deduplication."""
+
+import hashlib
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+URL_HASH_BYTES = 16
+
+TRACKING_PARAMS = {
+    "fbclid", "gclid", "msclkid", "dclid", "yclid", "mc_cid", "mc_eid",
+    "_hsenc", "_hsmi", "referrer", "ref_src",
+}
+DEFAULT_PORTS = {"http": 80, "https": 443}
+ROUTE_FRAGMENT_PREFIXES = ("/", "!")
+
+
+def canonicalize_url(url: str) -> str:
+    """Normalize a posting URL so trivially different variants compare equal.
+
+    Upgrades http to https, lowercases the host, drops default ports,
+    ``utm_*`` and other tracking parameters and a trailing slash, and sorts
+    the remaining query parameters. Fragments are dropped unless they look
+    like a client-side route (``#/jobs/123``, ``#!/jobs/123``), which
+    single-page career sites use to tell postings apart.
+
+    Used for ``url_hash`` and other comparisons; the stored ``Job.url``
+    keeps the link exactly as the source gave it.
+    """
+    url = url.strip()
+    try:
+        parts = urlsplit(url)
+        port = parts.port
+    except ValueError:
+        return url
+    if parts.scheme.lower() not in DEFAULT_PORTS or not parts.hostname:
+        return url
+
+    host = parts.hostname.lower()
+    if port and port != DEFAULT_PORTS[parts.scheme.lower()]:
+        host = f"{host}:{port}"
+
+    query = sorted(
+        (key, value)
+        for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if not key.lower().startswith("utm_") and key.lower() not in TRACKING_PARAMS
+    )
+    path = parts.path.rstrip("/")
+    fragment = parts.fragment if parts.fragment.startswith(ROUTE_FRAGMENT_PREFIXES) else ""
+    return urlunsplit(("https", host, path, urlencode(query), fragment))
+
+
+def url_hash(url: str) -> bytes:
+    """16-byte BLAKE2b digest of the canonical form of ``url``."""
+    return hashlib.blake2b(
+        canonicalize_url(url).encode("utf-8"), digest_size=URL_HASH_BYTES
+    ).digest()
@@ -1,11 +1,13 @@
 """JobHunter Pro CLI — daily workflow commands."""
 
-import asyncio
 import csv
 import json
+import math
 import os
+import re
 import sys
-from datetime import datetime, timezone
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timedelta, timezone
 from io import StringIO
 from pathlib import Path
 
@@ -16,15 +18,18 @@ if sys.platform == "win32":
     sys.stderr.reconfigure(encoding="utf-8", errors="replace")
 
 import click
-from sqlalchemy import func, text
+from sqlalchemy import func, select, text, update
 
 # Add project root to path for direct invocation
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 
 from app.database import SessionLocal
-from app.models import Job, JobStatus, UserProfile
+from app.models import CollectionRun, Job, JobStatus, UserProfile
 from app.sources import SOURCE_REGISTRY, get_all_sources, get_source
+from app.sources.archive import new_run_id
+from app.sources.orchestrator import run_collection
 from app.utils.logger import setup_logging
+from app.utils.skills import SkillTaxonomy, get_skill_taxonomy
 
 
 @click.group()
@@ -41,34 +46,45 @@ def cli(verbose: bool) -> None:
 @click.option("--source", "-s", type=click.Choice(list(SOURCE_REGISTRY.keys())), help="Specific source")
 @click.option("--all", "all_sources", is_flag=True, help="Collect from all sources")
 @click.option("--dry-run", is_flag=True, help="Fetch but don't save")
-def collect(source: str | None, all_sources: bool, dry_run: bool) -> None:
+@click.option("--no-cache", is_flag=True, help="Bypass the cached paid-API responses")
+@click.option("--replay", "replay_run", metavar="RUN_ID", help="Replay an archived run offline")
+def collect(
+    source: str | None, all_sources: bool, dry_run: bool, no_cache: bool, replay_run: str | None
+) -> None:
     """Collect jobs from data sources."""
     if not source and not all_sources:
         click.echo("Specify --source NAME or --all")
         return
 
     sources = get_all_sources() if all_sources else [get_source(source)]
+    run_id = replay_run or new_run_id()
+    try:
+        results = run_collection(
+            sources,
+            save=not dry_run,
+            use_cache=not no_cache,
+            run_id=run_id,
+            replay=replay_run,
+        )
+    except FileNotFoundError as e:
+        click.echo(str(e))
+        return
 
     total_fetched = 0
     total_inserted = 0
 
-    for src in sources:
-        click.echo(f"\n--- {src.source_name} ---")
-        jobs = asyncio.run(src.collect())
-        inserted = 0
-
-        if jobs and not dry_run:
-            db = SessionLocal()
-            try:
-                inserted = src.save(jobs, db)
-            finally:
-                db.close()
-
-        total_fetched += len(jobs)
-        total_inserted += inserted
-        click.echo(f"  Fetched: {len(jobs)}, New: {inserted}")
+    for name, result in results.items():
+        click.echo(f"\n--- {name} ---")
+        if result.get("skipped"):
+            click.echo("  Skipped: circuit open after repeated failures")
+        if result.get("error"):
+            click.echo("  Failed or timed out (see logs)")
+        total_fetched += result["fetched"]
+        total_inserted += result["inserted"]
+        click.echo(f"  Fetched: {result['fetched']}, New: {result['inserted']}")
 
     click.echo(f"\nTotal: {total_fetched} fetched, {total_inserted} new jobs")
+    click.echo(f"Run: {run_id}" + (" (replayed from archive)" if replay_run else ""))
     if dry_run:
         click.echo("(Dry run — nothing saved)")
 
@@ -344,6 +360,112 @@ def score(embed: bool, limit: int) -> None:
         db.close()
 
 
+# --- retag ---
+
+
+SALARY_LINE_RE = re.compile(r"salary|compensation|\bpay\b|[$€£]", re.IGNORECASE)
+
+
+def _canonical_tags(tags: list[str], taxonomy: SkillTaxonomy) -> set[str]:
+    """Stored tags with known skill names and aliases renamed to the canonical skill.
+
+    Tags saved before the taxonomy (``golang``, ``postgres``...) would
+    otherwise sit next to their canonical form; unknown tags are kept as is.
+    """
+    return {taxonomy.canonical(tag) or tag for tag in tags}
+
+
+def _salary_text(description: str) -> str:
+    """Lines of a description that look like they state a salary."""
+    return "\n".join(line for line in description.splitlines() if SALARY_LINE_RE.search(line))
+
+
+@cli.command()
+@click.option(
+    "--source", "-s", type=click.Choice(list(SOURCE_REGISTRY.keys())), help="Specific source"
+)
+@click.option("--salary", is_flag=True, help="Also fill missing salaries from the description")
+@click.option(
+    "--batch-size", default=1000, show_default=True, help="Rows read and updated per batch"
+)
+@click.option("--workers", type=int, help="Extraction processes (default: NORMALIZE_POOL_WORKERS)")
+@click.option("--dry-run", is_flag=True, help="Count changes but don't save")
+def retag(
+    source: str | None, salary: bool, batch_size: int, workers: int | None, dry_run: bool
+) -> None:
+    """Re-run tag (and optionally salary) extraction over stored jobs.
+
+    Jobs are streamed with a server-side cursor and updated in bulk, one
+    batch per transaction. New tags are merged with the stored ones, so
+    tags that came from a source's API are kept; stored legacy spellings
+    are renamed to their canonical skill.
+    """
+    from app.config import get_settings
+    from app.utils.parsers import extract_tags_batch, parse_salary_batch
+
+    taxonomy = get_skill_taxonomy()
+
+    if workers is None:
+        workers = get_settings().normalize_pool_workers
+
+    query = select(
+        Job.id, Job.title, Job.description, Job.tags, Job.salary_min, Job.salary_max
+    ).order_by(Job.id)
+    if source:
+        query = query.where(Job.source == source)
+
+    # One pool for the whole command; each batch is split across its workers
+    pool = ProcessPoolExecutor(max_workers=workers) if workers > 1 else None
+    reader = SessionLocal()
+    writer = SessionLocal()
+    scanned = retagged = salaried = 0
+    try:
+        result = reader.execute(query.execution_options(yield_per=batch_size))
+        for rows in result.partitions():
+            tags_batch = extract_tags_batch(
+                (f"{row.title} {row.description}" for row in rows), workers=workers, executor=pool
+            )
+            missing = [row for row in rows if salary and row.salary_min is None]
+            salaries = dict(zip(
+                (row.id for row in missing),
+                parse_salary_batch(
+                    (_salary_text(row.description) for row in missing),
+                    workers=workers,
+                    executor=pool,
+                ),
+            ))
+
+            changes = []
+            for row, extracted in zip(rows, tags_batch):
+                change = {}
+                tags = sorted(_canonical_tags(row.tags or [], taxonomy) | set(extracted))
+                if tags != sorted(row.tags or []):
+                    change["tags"] = tags
+                    retagged += 1
+                sal_min, sal_max, currency = salaries.get(row.id, (None, None, None))
+                if sal_min is not None:
+                    change.update(salary_min=sal_min, salary_max=sal_max, salary_currency=currency)
+                    salaried += 1
+                if change:
+                    changes.append({"id": row.id, **change})
+            scanned += len(rows)
+
+            if changes and not dry_run:
+                writer.execute(update(Job), changes)
+                writer.commit()
+            click.echo(f"  {scanned} scanned, {retagged} retagged, {salaried} salaries filled")
+    finally:
+        reader.close()
+        writer.close()
+        if pool is not None:
+            pool.shutdown()
+
+    filled = f", filled {salaried} salaries" if salary else ""
+    click.echo(f"\nRetagged {retagged} of {scanned} jobs{filled}")
+    if dry_run:
+        click.echo("(Dry run — nothing saved)")
+
+
 # --- apply ---
 
 
@@ -400,5 +522,95 @@ def apply(job_id: str, dry_run: bool) -> None:
         db.close()
 
 
+# --- sources ---
+
+
+def _percentile(values: list[float], q: float) -> float:
+    """Nearest-rank percentile of ``values`` (0 for an empty list)."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[max(0, math.ceil(q * len(ordered)) - 1)]
+
+
+@cli.group()
+def sources() -> None:
+    """Inspect data sources and their collection history."""
+
+
+@sources.command()
+@click.option("--days", "-d", default=30, help="Days of history to include")
+@click.option(
+    "--source", "-s", type=click.Choice(list(SOURCE_REGISTRY.keys())), help="Specific source"
+)
+def report(days: int, source: str | None) -> None:
+    """Per-source timing percentiles and trends from collection_runs."""
+    db = SessionLocal()
+    try:
+        since = datetime.now(timezone.utc) - timedelta(days=days)
+        query = db.query(CollectionRun).filter(
+            CollectionRun.started_at >= since, CollectionRun.replayed.is_(False)
+        )
+        if source:
+            query = query.filter(CollectionRun.source == source)
+        runs = query.order_by(CollectionRun.started_at).all()
+    finally:
+        db.close()
+
+    if not runs:
+        click.echo(f"No collection runs in the last {days} days.")
+        return
+
+    by_source: dict[str, list[CollectionRun]] = {}
+    for run in runs:
+        by_source.setdefault(run.source, []).append(run)
+
+    click.echo(
+        f"\nCollection runs, last {days} days (seconds; trend = p50 of newer vs older half)\n"
+    )
+    click.echo(
+        f"  {'Source':<16} {'Runs':>5} {'Err':>4} {'p50':>7} {'p95':>7} {'Fetch':>7} "
+        f"{'Norm':>6} {'Save':>6} {'Req':>5} {'MB':>7} {'Memo':>5} {'New/run':>8} {'Trend':>7}"
+    )
+    ordered = sorted(
+        by_source.items(),
+        key=lambda item: _percentile([r.duration_seconds for r in item[1]], 0.5),
+        reverse=True,
+    )
+    for name, rows in ordered:
+        durations = [r.duration_seconds for r in rows]
+        half = len(rows) // 2
+        trend = ""
+        if half:
+            older = _percentile(durations[:half], 0.5)
+            newer = _percentile(durations[half:], 0.5)
+            trend = f"{(newer - older) / older:+.0%}" if older else ""
+        errors = sum(r.status != "ok" for r in rows)
+        lookups = sum(r.html_memo_hits + r.html_memo_misses for r in rows)
+        memo = f"{sum(r.html_memo_hits for r in rows) / lookups:.0%}" if lookups else "-"
+        click.echo(
+            f"  {name:<16} {len(rows):>5} {errors:>4} "
+            f"{_percentile(durations, 0.5):>7.1f} {_percentile(durations, 0.95):>7.1f} "
+            f"{_percentile([r.fetch_seconds for r in rows], 0.5):>7.1f} "
+            f"{_percentile([r.normalize_seconds for r in rows], 0.5):>6.1f} "
+            f"{_percentile([r.save_seconds for r in rows], 0.5):>6.1f} "
+            f"{_percentile([r.requests for r in rows], 0.5):>5.0f} "
+            f"{sum(r.bytes_downloaded for r in rows) / 1e6:>7.1f} {memo:>5} "
+            f"{sum(r.inserted_count for r in rows) / len(rows):>8.1f} {trend:>7}"
+        )
+
+    saved = sum(r.html_memo_bytes_saved for r in runs)
+    if saved:
+        click.echo(f"\nclean_html memo skipped parsing {saved / 1e6:.1f} MB of HTML")
+    lost = sum(r.html_memo_disk_errors for r in runs)
+    if lost:
+        click.echo(f"clean_html memo lost its disk store {lost} times (see html_memo.* logs)")
+
+    total = sum(r.duration_seconds for r in runs) or 1.0
+    click.echo("\nShare of source time:")
+    for name, rows in ordered:
+        click.echo(f"  {name:<16} {sum(r.duration_seconds for r in rows) / total:>6.1%}")
+
+
 if __name__ == "__main__":
     cli()
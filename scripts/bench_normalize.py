@@ -0,0 +1,97 @@
+"""Benchmark in-process vs process-pool normalization throughput.
+
+Builds synthetic RemoteOK-style raw jobs (HTML descriptions of realistic
+length) and normalizes them both ways.
+
+Usage:
+    python scripts/bench_normalize.py
+    python scripts/bench_normalize.py --sizes 1000 10000 --workers 8
+"""
+
+import argparse
+import asyncio
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from app.config import get_settings
+from app.sources.base import shutdown_normalize_pool
+from app.sources.remoteok import RemoteOKSource
+
+PARAGRAPHS = [
+    "We are looking for a Senior Backend Engineer to join our distributed team.",
+    "You will design REST and GraphQL APIs in Python and Go, deployed on AWS with Docker "
+    "and Kubernetes.",
+    "Experience with PostgreSQL, Redis and Kafka is a strong plus; we run CI/CD on GitHub "
+    "Actions.",
+    "Our frontend is React with TypeScript and Next.js, and we care about accessibility.",
+    "Benefits include a home-office budget, flexible hours and a yearly team retreat.",
+    "Salary range is $90,000 - $130,000 depending on experience.",
+]
+
+
+def make_raw_jobs(n: int, seed: int = 42) -> list[dict]:
+    """Generate ``n`` RemoteOK-shaped raw jobs with ~2-4 KB HTML descriptions."""
+    rng = random.Random(seed)
+    jobs = []
+    for i in range(n):
+        body = "".join(
+            f"<p>{rng.choice(PARAGRAPHS)}</p><ul><li>{rng.choice(PARAGRAPHS)}</li></ul>"
+            for _ in range(rng.randint(6, 12))
+        )
+        jobs.append({
+            "position": f"Backend Engineer {i}",
+            "company": f"Company {i % 300}",
+            "description": body,
+            "url": f"/remote-jobs/{i}",
+            "tags": ["python", "backend"],
+            "date": "2026-01-15T10:00:00+00:00",
+            "salary_min": 90000,
+            "salary_max": 130000,
+        })
+    return jobs
+
+
+def bench(size: int, workers: int) -> tuple[float, float]:
+    """Return (in-process jobs/s, pooled jobs/s) for ``size`` raw jobs."""
+    source = RemoteOKSource()
+    raw = make_raw_jobs(size)
+
+    start = time.perf_counter()
+    source._normalize_page(raw)
+    inline = size / (time.perf_counter() - start)
+
+    settings = get_settings()
+    settings.normalize_pool_workers = workers
+    settings.normalize_pool_threshold = 1
+
+    async def pooled_run() -> float:
+        # Warm the pool so process start-up isn't counted
+        await source._normalize_page_pooled(raw[: workers * settings.normalize_pool_chunk_size])
+        start = time.perf_counter()
+        await source._normalize_page_pooled(raw)
+        return size / (time.perf_counter() - start)
+
+    pooled = asyncio.run(pooled_run())
+    shutdown_normalize_pool()
+    return inline, pooled
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark normalization throughput")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000])
+    parser.add_argument("--workers", type=int, default=4)
+    args = parser.parse_args()
+
+    print(f"{'Raw jobs':>10} {'In-process/s':>14} {'Pool/s':>10} {'Speedup':>9}")
+    print("-" * 46)
+    for size in args.sizes:
+        inline, pooled = bench(size, args.workers)
+        print(f"{size:>10} {inline:>14,.0f} {pooled:>10,.0f} {pooled / inline:>8.2f}x")
+
+
+if __name__ == "__main__":
+    main()
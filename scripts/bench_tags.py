@@ -0,0 +1,142 @@
+"""Benchmark the compiled skill extractor against the original per-term scan.
+
+Builds a synthetic corpus of cleaned job descriptions (mixed prose, skill
+mentions and near-misses such as "interest" or "golang"), checks the new
+extractor agrees with the original ``KNOWN_SKILLS`` scan on every
+description and reports µs per description. Agreement allows for the
+intended differences: legacy spellings are reported under their canonical
+skill and the new ``js`` alias also fires on ``node.js`` and ``next.js``.
+
+Usage:
+    python scripts/bench_tags.py
+    python scripts/bench_tags.py --jobs 5000 --repeat 5
+"""
+
+import argparse
+import random
+import re
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from app.utils.parsers import extract_tags
+
+# ``KNOWN_SKILLS`` as it was before the skill taxonomy.
+BASELINE_KNOWN_SKILLS = {
+    "python", "javascript", "typescript", "ruby", "go", "golang", "rust", "java",
+    "c#", "c++", "php", "swift", "kotlin", "scala", "elixir", "clojure", "haskell",
+    "smalltalk", "perl", "r", "sql", "nosql", "graphql",
+    "react", "angular", "vue", "svelte", "next.js", "nextjs", "nuxt", "remix",
+    "node.js", "nodejs", "express", "fastapi", "django", "flask",
+    "ruby on rails", "rails", "spring", "laravel", ".net", "asp.net",
+    "aws", "gcp", "azure", "docker", "kubernetes", "k8s", "terraform",
+    "postgresql", "postgres", "mysql", "mongodb", "redis", "elasticsearch",
+    "kafka", "rabbitmq", "celery",
+    "git", "ci/cd", "jenkins", "github actions",
+    "linux", "devops", "sre", "mlops",
+    "machine learning", "deep learning", "ai", "llm", "nlp",
+    "rest", "api", "microservices", "grpc",
+    "agile", "scrum",
+}
+LEGACY_TO_CANONICAL = {
+    "golang": "go",
+    "postgres": "postgresql",
+    "nodejs": "node.js",
+    "nextjs": "next.js",
+    "k8s": "kubernetes",
+    "ruby on rails": "rails",
+}
+
+SENTENCES = [
+    "We are looking for a Senior Backend Engineer to join our distributed team.",
+    "You will design REST and GraphQL APIs in Python and Go, deployed on AWS with Docker "
+    "and Kubernetes.",
+    "Experience with PostgreSQL, Redis and Kafka is a strong plus; we run CI/CD on GitHub "
+    "Actions.",
+    "Our frontend is React with TypeScript and Next.js, and we care about accessibility.",
+    "Benefits include a home-office budget, flexible hours and a yearly team retreat.",
+    "You have shipped Ruby on Rails or Django applications used by thousands of customers.",
+    "Familiarity with Terraform, GCP or Azure, and observability tooling is appreciated.",
+    "We value written communication, ownership and a genuine interest in our customers.",
+    "Some exposure to machine learning, LLM tooling or NLP pipelines is a bonus.",
+    "The team works in two-week scrum sprints with a lightweight agile process.",
+    "Salary range is $90,000 - $130,000 depending on experience and location.",
+    "You will mentor engineers, review pull requests and improve our golang services.",
+    "We process millions of events per day with Elasticsearch, RabbitMQ and Celery.",
+    "Our data science group uses R and Python; the mobile apps are Swift and Kotlin.",
+]
+FILLER = (
+    "team product customers growth remote async culture collaborate impact quality "
+    "reliable scale platform design review roadmap ownership mission career learning"
+).split()
+
+
+def reference_extract_tags(text: str) -> list[str]:
+    """The original ``extract_tags``: one scan per known skill."""
+    if not text:
+        return []
+    text_lower = text.lower()
+    found = set()
+    for skill in BASELINE_KNOWN_SKILLS:
+        if len(skill) <= 2:
+            if re.search(rf"\b{re.escape(skill)}\b", text_lower):
+                found.add(skill)
+        elif skill in text_lower:
+            found.add(skill)
+    return sorted(found)
+
+
+def expected_tags(text: str) -> list[str]:
+    """``reference_extract_tags`` with the intended differences applied."""
+    tags = {LEGACY_TO_CANONICAL.get(tag, tag) for tag in reference_extract_tags(text)}
+    if re.search(r"\bjs\b", text.lower()):
+        tags.add("javascript")
+    return sorted(tags)
+
+
+def make_corpus(n: int, seed: int = 42) -> list[str]:
+    """``n`` descriptions of roughly 1-4 KB, like cleaned postings."""
+    rng = random.Random(seed)
+    corpus = []
+    for i in range(n):
+        parts = []
+        for _ in range(rng.randint(8, 24)):
+            parts.append(rng.choice(SENTENCES))
+            parts.append(" ".join(rng.choices(FILLER, k=rng.randint(5, 20))).capitalize() + ".")
+        corpus.append(f"Backend Engineer {i}\n" + "\n".join(parts))
+    return corpus
+
+
+def per_description(fn, corpus: list[str], repeat: int) -> float:
+    """Best-of-``repeat`` microseconds per description."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for text in corpus:
+            fn(text)
+        best = min(best, time.perf_counter() - start)
+    return best / len(corpus) * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark skill tag extraction")
+    parser.add_argument("--jobs", type=int, default=2000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    corpus = make_corpus(args.jobs)
+    mismatches = sum(expected_tags(t) != extract_tags(t) for t in corpus)
+    avg_kb = sum(len(t) for t in corpus) / len(corpus) / 1024
+
+    old = per_description(reference_extract_tags, corpus, args.repeat)
+    new = per_description(extract_tags, corpus, args.repeat)
+    print(f"{args.jobs} descriptions, {avg_kb:.1f} KB average, {mismatches} mismatches")
+    print(f"{'Per-skill scan':>16}: {old:8.1f} µs/description")
+    print(f"{'Compiled trie':>16}: {new:8.1f} µs/description")
+    print(f"{'Speedup':>16}: {old / new:8.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -12,47 +12,29 @@ from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 
-from app.database import SessionLocal
 from app.sources import get_all_sources
+from app.sources.orchestrator import collect_sources
 from app.utils.logger import setup_logging
 
 
-async def collect_from_source(source) -> list[dict]:
-    """Collect jobs from a single source."""
-    return await source.collect()
-
-
 async def run_all(dry_run: bool = False) -> None:
     setup_logging("INFO")
 
     sources = get_all_sources()
     print(f"Collecting from {len(sources)} sources...\n")
 
+    outcome = await collect_sources(sources, save=not dry_run)
+
     total_fetched = 0
     total_inserted = 0
     results = []
 
-    for source in sources:
-        print(f"--- {source.source_name} ---")
-        try:
-            jobs = await source.collect()
-            inserted = 0
-
-            if jobs and not dry_run:
-                db = SessionLocal()
-                try:
-                    inserted = source.save(jobs, db)
-                finally:
-                    db.close()
-
-            total_fetched += len(jobs)
-            total_inserted += inserted
-            results.append((source.source_name, len(jobs), inserted))
-            print(f"  Fetched: {len(jobs)}, Inserted: {inserted}\n")
-
-        except Exception as e:
-            print(f"  ERROR: {e}\n")
-            results.append((source.source_name, 0, 0))
+    for name, result in outcome.items():
+        if result.get("error"):
+            print(f"--- {name} ---\n  ERROR: failed or timed out (see logs)\n")
+        total_fetched += result["fetched"]
+        total_inserted += result["inserted"]
+        results.append((name, result["fetched"], result["inserted"]))
 
     # Summary
     print("\n" + "=" * 50)
@@ -4,6 +4,7 @@ Usage:
     python scripts/test_source.py remoteok          # fetch + display, don't save
     python scripts/test_source.py remoteok --save    # fetch + save to DB
     python scripts/test_source.py --list             # list available sources
+    python scripts/test_source.py remoteok --replay 20260301T060000Z-1a2b3c   # offline
 """
 
 import argparse
@@ -13,16 +14,30 @@ from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 
+from app.config import get_settings
 from app.database import SessionLocal
 from app.sources import SOURCE_REGISTRY, get_source
+from app.sources.archive import ArchiveReplay, ArchiveWriter, new_run_id
+from app.sources.http import get_client_registry
 from app.utils.logger import setup_logging
 
 
+async def collect_once(source) -> list[dict]:
+    """Collect from one source, then release the pooled HTTP client."""
+    try:
+        return await source.collect()
+    finally:
+        await get_client_registry().aclose()
+
+
 def main() -> None:
     parser = argparse.ArgumentParser(description="Test a job data source")
     parser.add_argument("source", nargs="?", help="Source name to test")
     parser.add_argument("--save", action="store_true", help="Save fetched jobs to DB")
     parser.add_argument("--list", action="store_true", help="List available sources")
+    parser.add_argument(
+        "--replay", metavar="RUN_ID", help="Use an archived run instead of the network"
+    )
     args = parser.parse_args()
 
     setup_logging("INFO")
@@ -38,10 +53,18 @@ def main() -> None:
         return
 
     source = get_source(args.source)
-    print(f"\n--- Testing source: {source.source_name} ---\n")
+    settings = get_settings()
+    if args.replay:
+        source.replay = ArchiveReplay(settings.archive_path, args.replay)
+        print(f"\n--- Replaying source: {source.source_name} (run {args.replay}) ---\n")
+    else:
+        if settings.archive_enabled:
+            source.archive = ArchiveWriter(settings.archive_path, new_run_id())
+            print(f"\nArchiving responses as run {source.archive.run_id}")
+        print(f"\n--- Testing source: {source.source_name} ---\n")
 
     # Fetch and normalize
-    jobs = asyncio.run(source.collect())
+    jobs = asyncio.run(collect_once(source))
 
     print(f"\nNormalized jobs: {len(jobs)}\n")
 
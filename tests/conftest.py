@@ -2,7 +2,7 @@
 
 import pytest
 from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.orm import Session, sessionmaker
 
 from app.config import get_settings
 from app.models import Base
@@ -25,3 +25,15 @@ def db(engine):
     yield session
     session.rollback()
     session.close()
+
+
+@pytest.fixture
+def committing_db(engine):
+    """Session for code that commits; everything is rolled back after the test."""
+    conn = engine.connect()
+    outer = conn.begin()
+    session = Session(bind=conn, join_transaction_mode="create_savepoint")
+    yield session
+    session.close()
+    outer.rollback()
+    conn.close()
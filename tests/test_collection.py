@@ -0,0 +1,741 @@
+"""Tests for the concurrent collection orchestrator."""
+
+import asyncio
+import threading
+import time
+
+import httpx
+import pytest
+
+from app.sources.base import BaseSource, BudgetExhaustedError
+from app.sources.orchestrator import collect_sources
+
+
+class FakeSource(BaseSource):
+    """Source that sleeps instead of hitting the network."""
+
+    def __init__(self, name: str, delay: float, count: int = 2, fail: bool = False):
+        self._name = name
+        self._delay = delay
+        self._count = count
+        self._fail = fail
+
+    @property
+    def source_name(self) -> str:
+        return self._name
+
+    async def fetch(self) -> list[dict]:
+        await asyncio.sleep(self._delay)
+        if self._fail:
+            raise RuntimeError("boom")
+        return [{"i": i} for i in range(self._count)]
+
+    def normalize(self, raw_job: dict) -> dict | None:
+        return {"title": f"Job {raw_job['i']}", "url": f"https://example.com/{self._name}/{raw_job['i']}"}
+
+
+async def test_collect_sources_runs_concurrently():
+    """Wall time tracks the slowest source, not the sum."""
+    sources = [FakeSource(f"s{i}", 0.2) for i in range(5)]
+    start = time.perf_counter()
+    results = await collect_sources(sources, save=False, deadline=5)
+    elapsed = time.perf_counter() - start
+
+    assert elapsed < 0.6
+    assert list(results) == ["s0", "s1", "s2", "s3", "s4"]
+    assert all(r == {"fetched": 2, "inserted": 0} for r in results.values())
+
+
+async def test_collect_sources_deadline_cancels_stragglers():
+    """Sources still running at the deadline are reported as errors."""
+    sources = [FakeSource("fast", 0.01), FakeSource("slow", 10)]
+    results = await collect_sources(sources, save=False, deadline=0.2)
+
+    assert results["fast"] == {"fetched": 2, "inserted": 0}
+    assert results["slow"]["error"] is True
+
+
+def test_validator_cache_round_trip(tmp_path):
+    """Stored validators become conditional headers; 304s count as hits."""
+    from app.sources.http_cache import ValidatorCache
+
+    path = tmp_path / "validators.json"
+    cache = ValidatorCache(path, max_entries=2)
+    url = "https://remoteok.com/api"
+
+    ok = httpx.Response(200, headers={"ETag": '"v1"', "Last-Modified": "Mon, 01 Jan 2026 00:00:00 GMT"})
+    cache.update({url: cache.record(url, ok)})
+
+    reloaded = ValidatorCache(path, max_entries=2)
+    assert reloaded.request_headers(url) == {
+        "If-None-Match": '"v1"',
+        "If-Modified-Since": "Mon, 01 Jan 2026 00:00:00 GMT",
+    }
+    assert reloaded.record(url, httpx.Response(304)) is None
+    assert reloaded.stats()["hits"] == 1
+
+    reloaded.update({"https://a": {"etag": "a"}, "https://b": {"etag": "b"}})
+    assert reloaded.request_headers(url) == {}
+    assert reloaded.record(url, httpx.Response(304)) is None  # evicted meanwhile
+
+
+def test_validator_cache_merges_concurrent_writers(tmp_path):
+    """Two processes sharing the file keep each other's validators."""
+    from app.sources.http_cache import ValidatorCache
+
+    path = tmp_path / "validators.json"
+    first, second = ValidatorCache(path, max_entries=10), ValidatorCache(path, max_entries=10)
+    assert first.request_headers("https://a") == second.request_headers("https://b") == {}
+
+    first.update({"https://a": {"etag": "a"}})
+    second.update({"https://b": {"etag": "b"}})
+    reloaded = ValidatorCache(path, max_entries=10)
+    assert reloaded.request_headers("https://a") == {"If-None-Match": "a"}
+    assert reloaded.request_headers("https://b") == {"If-None-Match": "b"}
+    assert list(tmp_path.iterdir()) == [path]  # no temp files left behind
+
+
+class PagedSource(FakeSource):
+    """Yields several pages and records every flush instead of touching the DB."""
+
+    def __init__(self, pages: int, per_page: int):
+        super().__init__("paged", 0.01)
+        self._pages = pages
+        self._per_page = per_page
+        self.events: list[str] = []
+        self.copied: list[bool] = []
+
+    async def fetch_pages(self):
+        for p in range(self._pages):
+            await asyncio.sleep(0.01)
+            self.events.append(f"page{p}")
+            yield [{"i": p * self._per_page + i} for i in range(self._per_page)]
+
+    def _flush(self, jobs, session_factory, copy=False):
+        self.events.append(f"flush{len(jobs)}")
+        self.copied.append(copy)
+        return len(jobs)
+
+
+async def test_collect_stream_saves_while_fetching():
+    """Batches reach the writer before the last page has been downloaded."""
+    source = PagedSource(pages=5, per_page=3)
+    fetched, inserted = await source.collect_stream(lambda: None, batch_size=4, queue_pages=1)
+
+    assert (fetched, inserted) == (15, 15)
+    assert source.events.index("flush4") < source.events.index("page4")
+    assert sum(int(e[5:]) for e in source.events if e.startswith("flush")) == 15
+
+
+async def test_collect_stream_copies_batches_of_large_runs(monkeypatch):
+    """Past the COPY threshold batches keep their size but are loaded with COPY."""
+    from app.config import get_settings
+
+    monkeypatch.setattr(get_settings(), "copy_ingest_threshold", 6)
+    source = PagedSource(pages=6, per_page=3)
+    fetched, inserted = await source.collect_stream(lambda: None, batch_size=2, queue_pages=1)
+
+    flushes = [int(e[5:]) for e in source.events if e.startswith("flush")]
+    assert (fetched, inserted) == (18, 18)
+    assert flushes == [2] * 9
+    assert source.copied[0] is False and source.copied[-1] is True
+
+
+async def test_collect_stream_raises_writer_errors_unwrapped():
+    """A failing flush surfaces as itself, not as an ExceptionGroup."""
+
+    class BrokenWriterSource(PagedSource):
+        def _flush(self, jobs, session_factory, copy=False):
+            raise RuntimeError("database down")
+
+    with pytest.raises(RuntimeError, match="database down"):
+        await BrokenWriterSource(pages=2, per_page=3).collect_stream(lambda: None, batch_size=2)
+
+
+def test_source_must_implement_fetch_or_fetch_pages():
+    """A source overriding neither fetch method fails at class definition."""
+    with pytest.raises(TypeError, match="fetch"):
+        class NoFetchSource(BaseSource):
+            source_name = "nofetch"
+
+            def normalize(self, raw_job: dict) -> dict | None:
+                return None
+
+
+async def test_pooled_normalize_falls_back_in_process(monkeypatch):
+    """A page the pool cannot handle is normalized in-process instead of ending the fetch."""
+    from app.config import get_settings
+    from app.sources.base import shutdown_normalize_pool
+
+    settings = get_settings()
+    monkeypatch.setattr(settings, "normalize_pool_workers", 1)
+    monkeypatch.setattr(settings, "normalize_pool_threshold", 1)
+    # FakeSource needs constructor arguments, so workers cannot rebuild it
+    source = PagedSource(pages=3, per_page=2)
+    try:
+        jobs = await source.collect()
+    finally:
+        shutdown_normalize_pool()
+    assert len(jobs) == 6
+    assert source.stats.error_count == 0
+
+
+async def test_token_bucket_burst_then_paced():
+    """A bucket lets ``burst`` requests through at once, then paces the rest."""
+    from app.sources.ratelimit import TokenBucket
+
+    bucket = TokenBucket(rate=20.0, burst=3)
+    start = time.perf_counter()
+    for _ in range(3):
+        await bucket.acquire()
+    assert time.perf_counter() - start < 0.03
+    for _ in range(2):
+        await bucket.acquire()
+    assert time.perf_counter() - start >= 0.09
+
+
+def test_parse_retry_after():
+    """Retry-After accepts delta-seconds and HTTP-dates."""
+    from app.sources.ratelimit import parse_retry_after
+
+    assert parse_retry_after("7") == 7.0
+    assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+    assert parse_retry_after("soon") is None
+    assert parse_retry_after(None) is None
+
+
+class FlakyClient:
+    """Answers 429 with Retry-After a few times before succeeding."""
+
+    def __init__(self, failures: int):
+        self.failures = failures
+        self.calls = 0
+
+    async def request(self, method, url, **kwargs):
+        self.calls += 1
+        if self.calls <= self.failures:
+            return httpx.Response(429, headers={"Retry-After": "0"})
+        return httpx.Response(200, json={"ok": True})
+
+
+async def test_request_retries_after_rate_limit():
+    """429 responses are retried instead of ending the fetch."""
+    source = FakeSource("flaky", 0)
+    client = FlakyClient(failures=2)
+    resp = await source._request(client, "GET", "https://flaky.example/api")
+
+    assert resp.status_code == 200
+    assert client.calls == 3
+
+
+async def test_request_budget_stops_sending():
+    """Once the per-run budget is spent no further requests go out."""
+    source = FakeSource("budgeted", 0)
+    source._budget_left = 2
+    client = FlakyClient(failures=0)
+    await source._request(client, "GET", "https://budget.example/api")
+    await source._request(client, "GET", "https://budget.example/api")
+
+    with pytest.raises(BudgetExhaustedError):
+        await source._request(client, "GET", "https://budget.example/api")
+    assert client.calls == 2
+
+
+async def test_paginate_window_orders_dedupes_and_stops():
+    """Windowed pages come back in order, without repeats, ending at the short page."""
+    source = FakeSource("paged", 0)
+    source.raw_url = lambda raw: raw["url"]
+    source.page_window = 4
+    requested = []
+
+    async def fetch_page(number: int):
+        requested.append(number)
+        await asyncio.sleep(0.05 * (4 - number % 4))  # later pages finish first
+        if number == 5:
+            return [{"url": "u9"}], False
+        return [{"url": f"u{number}"}, {"url": f"u{number + 1}"}], True
+
+    start = time.perf_counter()
+    pages = [page async for page in source._paginate_window(fetch_page, max_pages=10)]
+
+    assert [[j["url"] for j in p] for p in pages] == [
+        ["u0", "u1"], ["u2"], ["u3"], ["u4"], ["u5"], ["u9"],
+    ]
+    assert sorted(requested) == list(range(8))
+    assert time.perf_counter() - start < 0.5
+
+
+async def test_paginate_window_keeps_pages_before_a_failure():
+    """A failing page ends pagination after the pages before it; the window is cancelled."""
+    source = FakeSource("paged", 0)
+    source.page_window = 4
+    cancelled = []
+
+    async def fetch_page(number: int):
+        try:
+            await asyncio.sleep({0: 0.02, 1: 0.04, 2: 0.01}.get(number, 1))
+        except asyncio.CancelledError:
+            cancelled.append(number)
+            raise
+        if number == 2:
+            raise httpx.ReadError("connection reset")
+        return [{"url": f"u{number}"}], True
+
+    pages = []
+    with pytest.raises(httpx.ReadError):
+        async for page in source._paginate_window(fetch_page, max_pages=10):
+            pages.append(page)
+    await asyncio.sleep(0)
+
+    assert pages == [[{"url": "u0"}], [{"url": "u1"}]]
+    assert cancelled == [3]
+
+
+async def test_paginate_window_probes_one_page_before_spending_quota():
+    """With stop_when_stored a fully stored first page costs one request; the window then ramps."""
+    source = FakeSource("paid", 0)
+    source.raw_url = lambda raw: raw["url"]
+    source.page_window = 4
+    requested = []
+    stored = {"u0"}
+
+    async def fetch_page(number: int):
+        requested.append(number)
+        return [{"url": f"u{number}"}], True
+
+    async def only_stored(jobs):
+        return all(job["url"] in stored for job in jobs)
+
+    source._page_has_only_stored = only_stored
+    pages = [p async for p in source._paginate_window(fetch_page, 10, stop_when_stored=True)]
+    assert pages == [] and requested == [0]
+
+    requested.clear()
+    stored = {"u3"}
+    pages = [p async for p in source._paginate_window(fetch_page, 10, stop_when_stored=True)]
+    assert len(pages) == 3
+    assert requested == [0, 1, 2, 3, 4, 5, 6]  # windows of 1, 2 and 4 pages
+
+
+async def test_fan_out_merges_as_completed():
+    """Queries run concurrently; results arrive fastest-first and deduplicated."""
+    source = FakeSource("matrix", 0)
+
+    async def search(query: tuple[str, float]):
+        name, delay = query
+        await asyncio.sleep(delay)
+        return [{"id": name}, {"id": "shared"}, {"id": None}]
+
+    queries = [("slow", 0.2), ("fast", 0.05), ("mid", 0.1)]
+    start = time.perf_counter()
+    pages = [p async for p in source._fan_out(queries, search, key=lambda j: j["id"])]
+
+    assert [[j["id"] for j in p] for p in pages] == [["fast", "shared"], ["mid"], ["slow"]]
+    assert time.perf_counter() - start < 0.35
+
+
+def test_response_cache_key_ignores_credentials():
+    """Keys differ by query but not by API key."""
+    from app.sources.response_cache import cache_key
+
+    url = "https://serpapi.com/search"
+    a = cache_key("serpapi_google", "GET", url, {"q": "go", "api_key": "1"}, None)
+    b = cache_key("serpapi_google", "GET", url, {"q": "go", "api_key": "2"}, None)
+    c = cache_key("serpapi_google", "GET", url, {"q": "ruby", "api_key": "1"}, None)
+    assert a == b != c
+
+
+async def test_response_cache_degrades_without_redis():
+    """An unreachable Redis turns the cache off instead of failing the request."""
+    from app.sources.response_cache import ResponseCache
+
+    cache = ResponseCache("redis://127.0.0.1:1/0", default_ttl=60, ttls={})
+    request = httpx.Request("GET", "https://serpapi.com/search")
+    assert await cache.get("serpapi_google", "k", request) is None
+    await cache.set("serpapi_google", "k", httpx.Response(200, content=b"{}", request=request))
+    assert cache.stats() == {}
+    await cache.aclose()
+
+
+def test_client_registry_keeps_one_pool_per_loop():
+    """Runs on different loops get their own client; closing one leaves the other open."""
+    from app.sources.http import ClientRegistry
+
+    registry = ClientRegistry()
+
+    async def client():
+        return registry._get_pool().client
+
+    loop_a, loop_b = asyncio.new_event_loop(), asyncio.new_event_loop()
+    try:
+        a = loop_a.run_until_complete(client())
+        b = loop_b.run_until_complete(client())
+        assert a is not b
+        assert loop_a.run_until_complete(client()) is a
+
+        loop_b.run_until_complete(registry.aclose())
+        assert b.is_closed and not a.is_closed
+        loop_a.run_until_complete(registry.aclose())
+        assert a.is_closed
+    finally:
+        loop_a.close()
+        loop_b.close()
+
+
+async def test_client_registry_holds_host_slot_until_stream_closes(monkeypatch):
+    """A streamed body keeps its per-host slot; counters cover the current run only."""
+    from app.config import get_settings
+    from app.sources.http import ClientRegistry, _LoopPool
+
+    monkeypatch.setattr(get_settings(), "http_max_connections_per_host", 1)
+    registry = ClientRegistry()
+
+    async def body():
+        yield b"[]"
+
+    transport = httpx.MockTransport(lambda request: httpx.Response(200, content=body()))
+    registry._pools[asyncio.get_running_loop()] = _LoopPool(httpx.AsyncClient(transport=transport))
+
+    streamed = await registry.request("GET", "https://a.example/feed", stream=True)
+    second = asyncio.create_task(registry.request("GET", "https://a.example/api"))
+    await asyncio.sleep(0.05)
+    assert not second.done()  # waiting for the streamed body's slot
+    await streamed.aclose()
+    assert (await asyncio.wait_for(second, 1)).status_code == 200
+    assert registry.stats()["a.example"]["requests"] == 2
+
+    await registry.aclose()
+    assert registry.stats() == {}
+
+
+def test_client_registry_close_uses_each_clients_loop():
+    """``close()`` inside a running loop still closes clients of another (idle) loop."""
+    from app.sources.http import ClientRegistry
+
+    registry = ClientRegistry()
+
+    async def client():
+        return registry._get_pool().client
+
+    idle = asyncio.new_event_loop()
+    try:
+        a = idle.run_until_complete(client())
+
+        async def shutdown_hook():
+            registry.close()
+
+        asyncio.run(shutdown_hook())
+        assert a.is_closed
+    finally:
+        idle.close()
+
+
+async def test_archive_replays_recorded_responses(tmp_path):
+    """Responses recorded in one run are served back without a network client."""
+    from app.sources.archive import ArchiveReplay, ArchiveWriter, ReplayMissError
+
+    source = FakeSource("archived", 0)
+    source.archive = ArchiveWriter(tmp_path, "run1")
+    for _ in range(2):
+        await source._request(
+            FlakyClient(failures=0), "GET", "https://a.example/api", params={"page": 1}
+        )
+
+    replayed = FakeSource("archived", 0)
+    replayed.replay = ArchiveReplay(tmp_path, "run1")
+    resp = await replayed._request(None, "GET", "https://a.example/api", params={"page": 1})
+    assert resp.json() == {"ok": True}
+    assert len(list(tmp_path.glob("blobs/*/*.gz"))) == 1  # identical bodies stored once
+
+    with pytest.raises(ReplayMissError):
+        await replayed._request(None, "GET", "https://a.example/api", params={"page": 2})
+
+
+def test_prune_archive_keeps_blobs_of_recent_runs(tmp_path):
+    """Expired runs are deleted with the blobs that no remaining run shares."""
+    import os
+
+    from app.sources.archive import ArchiveWriter, list_runs, prune_archive
+
+    def record(run_id: str, *bodies: bytes) -> None:
+        writer = ArchiveWriter(tmp_path, run_id)
+        for body in bodies:
+            resp = httpx.Response(200, content=body)
+            writer.record("archived", body.decode(), "https://a.example/api", resp)
+        writer.close()
+
+    record("old", b"shared", b"expired")
+    record("new", b"shared", b"fresh")
+    month_ago = time.time() - 30 * 86400
+    (tmp_path / "blobs" / "stale.tmp").write_bytes(b"")
+    (tmp_path / "runs" / "crashed.running").write_bytes(b"")
+    for path in [
+        tmp_path / "runs" / "old.jsonl",
+        tmp_path / "runs" / "crashed.running",
+        tmp_path / "blobs" / "stale.tmp",
+        *tmp_path.glob("blobs/*/*.gz"),
+    ]:
+        os.utime(path, (month_ago, month_ago))
+
+    live = ArchiveWriter(tmp_path, "live")  # may be reusing an old blob right now
+    assert prune_archive(tmp_path, max_age_days=14) == (1, 0)
+    live.close()
+    assert prune_archive(tmp_path, max_age_days=14) == (0, 2)  # expired blob + stale tmp
+    assert not (tmp_path / "runs" / "crashed.running").exists()
+    assert list_runs(tmp_path) == ["new"]
+    assert len(list(tmp_path.glob("blobs/*/*.gz"))) == 2  # shared (still used) + fresh
+    assert prune_archive(tmp_path, max_age_days=14) == (0, 0)
+
+
+def test_bloom_filter_has_no_false_negatives():
+    """Every added URL is reported; the false-positive rate stays near the target."""
+    from app.utils.bloom import BloomFilter
+
+    bloom = BloomFilter(5000, error_rate=0.01)
+    bloom.update(f"https://example.com/job/{i}" for i in range(5000))
+    restored = BloomFilter.from_bytes(bloom.to_bytes())
+
+    assert all(f"https://example.com/job/{i}" in restored for i in range(5000))
+    false_positives = sum(f"https://example.com/other/{i}" in restored for i in range(5000))
+    assert false_positives < 150
+
+
+class FakeSession:
+    """Answers the confirmation query with a fixed set of stored URL hashes."""
+
+    def __init__(self, stored: set[str]):
+        self.stored = stored
+
+    def scalars(self, query):
+        urls = query.whereclause.right.value
+        return [u for u in urls if u in self.stored]
+
+    def close(self):
+        pass
+
+
+async def test_known_urls_dropped_before_normalize():
+    """Stored postings are skipped; a Bloom false positive still gets normalized."""
+    from app.sources.known_urls import KnownUrlFilter
+    from app.utils.bloom import BloomFilter
+    from app.utils.urls import url_hash
+
+    bloom = BloomFilter(100)
+    bloom.update([url_hash("https://example.com/known/0"), url_hash("https://example.com/known/1")])
+    source = FakeSource("known", 0, count=3)
+    source.raw_url = lambda raw: f"http://example.com/known/{raw['i']}?utm_source=feed"
+    # Job 1 is a Bloom hit the database does not confirm
+    stored = {url_hash("https://example.com/known/0")}
+    source.known_urls = KnownUrlFilter(bloom, lambda: FakeSession(stored))
+
+    jobs = await source.collect()
+    assert [j["title"] for j in jobs] == ["Job 1", "Job 2"]
+
+
+async def test_run_stats_and_failure_status():
+    """Counters fill during a collect; a source whose fetch failed is recorded as an error."""
+    from app.sources.orchestrator import _run_record
+
+    ok = FakeSource("ok", 0.05, count=3)
+    await ok.collect()
+    assert (ok.stats.raw_count, ok.stats.normalized_count) == (3, 3)
+    assert ok.stats.fetch_seconds >= 0.05
+
+    broken = FakeSource("broken", 0, fail=True)
+    assert await broken.collect() == []
+    record = _run_record(broken, "ok", None, [])
+    assert record["status"] == "error"
+    assert record["error_count"] == 1
+
+
+def test_circuit_breaker_opens_and_half_opens():
+    """N straight failures open the circuit; after the cooldown the source is probed."""
+    from datetime import datetime, timedelta, timezone
+
+    from app.sources.circuit import CLOSED, HALF_OPEN, OPEN, breaker_state
+
+    now = datetime.now(timezone.utc)
+    failures = [("error", now - timedelta(minutes=m)) for m in (10, 70, 130)]
+    assert breaker_state(failures, 3, 3600, now) == OPEN
+    assert breaker_state(failures, 3, 300, now) == HALF_OPEN
+    assert breaker_state([("ok", now)] + failures[:2], 3, 3600, now) == CLOSED
+    assert breaker_state(failures[:2], 3, 3600, now) == CLOSED
+    assert breaker_state(failures, 0, 3600, now) == CLOSED
+
+
+class HangingSource(FakeSource):
+    """Yields two pages, then hangs like a stalled provider."""
+
+    async def fetch_pages(self):
+        for page in range(2):
+            yield [{"i": page * 10 + i} for i in range(self._count)]
+        await asyncio.sleep(3600)
+
+
+async def test_collect_stream_saves_gathered_jobs_when_cancelled():
+    """A cancelled stream still writes the jobs it had normalized."""
+    source = HangingSource("hang", 0, count=3)
+    saved = []
+    source._flush = lambda jobs, session_factory, copy=False: saved.extend(jobs) or len(jobs)
+
+    task = asyncio.create_task(source.collect_stream(lambda: None, batch_size=100))
+    await asyncio.sleep(0.1)
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+    assert sorted(j["title"] for j in saved) == [f"Job {i}" for i in (0, 1, 10, 11, 12, 2)]
+
+
+class ChunkedClient:
+    """Serves a fixed body in small chunks as a streamed response."""
+
+    def __init__(self, body: bytes, chunk: int = 7, fail_after: int | None = None):
+        self.body = body
+        self.chunk = chunk
+        self.fail_after = fail_after
+
+    async def request(self, method, url, stream=False, **kwargs):
+        async def chunks():
+            for i in range(0, len(self.body), self.chunk):
+                if self.fail_after is not None and i >= self.fail_after:
+                    raise httpx.ReadError("connection reset")
+                yield self.body[i : i + self.chunk]
+
+        return httpx.Response(200, content=chunks(), request=httpx.Request(method, url))
+
+
+async def test_stream_items_pages_and_archives(tmp_path):
+    """Array items arrive in pages while streaming; the whole body is archived."""
+    import json
+
+    from app.sources.archive import ArchiveReplay, ArchiveWriter
+    from app.sources.streaming import JsonItemParser
+
+    body = json.dumps({"jobs": [{"i": i, "pay": 1.5} for i in range(5)]}).encode()
+    parser = JsonItemParser("jobs.item")
+    items = [item for i in range(0, len(body), 3) for item in parser.feed(body[i : i + 3])]
+    assert items + parser.close() == [{"i": i, "pay": 1.5} for i in range(5)]
+
+    source = FakeSource("streamed", 0)
+    source.stream_page_size = 2
+    source.archive = ArchiveWriter(tmp_path, "run1")
+    pages = [
+        page
+        async for page in source._stream_items(
+            ChunkedClient(body), "GET", "https://stream.example/api", "jobs.item"
+        )
+    ]
+    assert [len(p) for p in pages] == [2, 2, 1]
+
+    replay = ArchiveReplay(tmp_path, "run1")
+    key = source._response_key("GET", "https://stream.example/api", {})
+    assert replay.response("streamed", key, httpx.Request("GET", "https://x")).content == body
+    assert not list(tmp_path.glob("blobs/*.tmp"))
+
+    # A body that fails part-way leaves no blob or manifest entry behind
+    source.archive = ArchiveWriter(tmp_path, "run2")
+    with pytest.raises(httpx.ReadError):
+        async for _ in source._stream_items(
+            ChunkedClient(body, fail_after=20), "GET", "https://stream.example/api", "jobs.item"
+        ):
+            pass
+    assert not list(tmp_path.glob("blobs/*.tmp"))
+    assert not (tmp_path / "runs" / "run2.jsonl").exists()
+
+
+async def test_html_memo_reuses_cleaned_text(tmp_path, monkeypatch):
+    """Repeated HTML is served from the memo (and from disk in a new process)."""
+    import os
+
+    from app.utils import html_memo
+    from app.utils.html_memo import HtmlMemo
+
+    calls = []
+
+    def cleaner(html):
+        calls.append(html)
+        return html.upper()
+
+    memo = HtmlMemo(2, tmp_path / "memo.sqlite")
+    assert memo.clean("<p>a</p>", cleaner) == memo.clean("<p>a</p>", cleaner) == "<P>A</P>"
+    memo.flush()
+    assert memo.counters() == (1, 1, 8, 0)
+
+    reopened = HtmlMemo(2, tmp_path / "memo.sqlite")
+    assert reopened.clean("<p>a</p>", cleaner) == "<P>A</P>"
+    assert len(calls) == 1
+
+    class HtmlSource(FakeSource):
+        def normalize(self, raw_job):
+            from app.utils.parsers import clean_html
+
+            job = super().normalize(raw_job)
+            job["description"] = clean_html("<p>Same description</p>")
+            return job
+
+    shared = HtmlMemo(10, tmp_path / "shared.sqlite")
+    flushed_on = []
+    real_flush = shared.flush
+
+    def flush():
+        flushed_on.append(threading.get_ident())
+        real_flush()
+
+    monkeypatch.setattr(shared, "flush", flush)
+    monkeypatch.setattr(html_memo, "_memo", shared)
+    monkeypatch.setattr(html_memo, "_memo_pid", os.getpid())
+    source = HtmlSource("memo", 0, count=3)
+    assert len(await source.collect()) == 3
+    assert (source.stats.html_memo_hits, source.stats.html_memo_misses) == (2, 1)
+    assert flushed_on and threading.get_ident() not in flushed_on  # never on the event loop
+
+
+async def test_html_memo_prunes_once_and_counts_disk_errors(tmp_path, monkeypatch):
+    """Opening the memo never prunes; losing the disk store is counted in stats."""
+    import os
+    import sqlite3
+    import time
+
+    from app.utils import html_memo
+    from app.utils.html_memo import HtmlMemo
+
+    path = tmp_path / "memo.sqlite"
+    memo = HtmlMemo(10, path)
+    memo.clean("<p>old</p>", str.upper)
+    memo.clean("<p>new</p>", str.upper)
+    memo.flush()
+    db = sqlite3.connect(path)
+    expired = time.time() - 86400 * 40
+    db.execute("UPDATE cleaned SET created_at = ? WHERE text = '<P>OLD</P>'", (expired,))
+    db.commit()
+
+    HtmlMemo(10, path)  # a pool worker opening the store leaves it alone
+    assert db.execute("SELECT count(*) FROM cleaned").fetchone() == (2,)
+    assert memo.prune(30) == 1
+    assert db.execute("SELECT text FROM cleaned").fetchall() == [("<P>NEW</P>",)]
+    db.close()
+
+    class BrokenDb:
+        def execute(self, *args):
+            raise sqlite3.OperationalError("disk I/O error")
+
+        def close(self):
+            pass
+
+    class HtmlSource(FakeSource):
+        def normalize(self, raw_job):
+            from app.utils.parsers import clean_html
+
+            job = super().normalize(raw_job)
+            job["description"] = clean_html(f"<p>{raw_job['i']}</p>")
+            return job
+
+    shared = HtmlMemo(10, tmp_path / "shared.sqlite")
+    shared._db = BrokenDb()
+    monkeypatch.setattr(html_memo, "_memo", shared)
+    monkeypatch.setattr(html_memo, "_memo_pid", os.getpid())
+    source = HtmlSource("memo", 0, count=3)
+    assert len(await source.collect()) == 3
+    assert source.stats.html_memo_disk_errors == 1
+    assert source.stats.as_dict()["html_memo_disk_errors"] == 1
+    assert shared.prune(30) == 0  # the store stays off for the rest of the process
@@ -5,6 +5,49 @@ from app.sources.arbeitnow import ArbeitnowSource
 from app.sources.remotive import RemotiveSource
 from app.utils.parsers import clean_html, extract_tags, parse_salary
 
+# ``KNOWN_SKILLS`` and ``extract_tags`` as they were before the skill taxonomy,
+# kept as the oracle for the taxonomy matcher.
+BASELINE_KNOWN_SKILLS = {
+    "python", "javascript", "typescript", "ruby", "go", "golang", "rust", "java",
+    "c#", "c++", "php", "swift", "kotlin", "scala", "elixir", "clojure", "haskell",
+    "smalltalk", "perl", "r", "sql", "nosql", "graphql",
+    "react", "angular", "vue", "svelte", "next.js", "nextjs", "nuxt", "remix",
+    "node.js", "nodejs", "express", "fastapi", "django", "flask",
+    "ruby on rails", "rails", "spring", "laravel", ".net", "asp.net",
+    "aws", "gcp", "azure", "docker", "kubernetes", "k8s", "terraform",
+    "postgresql", "postgres", "mysql", "mongodb", "redis", "elasticsearch",
+    "kafka", "rabbitmq", "celery",
+    "git", "ci/cd", "jenkins", "github actions",
+    "linux", "devops", "sre", "mlops",
+    "machine learning", "deep learning", "ai", "llm", "nlp",
+    "rest", "api", "microservices", "grpc",
+    "agile", "scrum",
+}
+
+# Baseline tags that the taxonomy reports under their canonical skill.
+LEGACY_TO_CANONICAL = {
+    "golang": "go",
+    "postgres": "postgresql",
+    "nodejs": "node.js",
+    "nextjs": "next.js",
+    "k8s": "kubernetes",
+    "ruby on rails": "rails",
+}
+
+
+def _baseline_tags(text):
+    import re
+
+    text_lower = text.lower()
+    found = set()
+    for skill in BASELINE_KNOWN_SKILLS:
+        if len(skill) <= 2:
+            if re.search(rf"\b{re.escape(skill)}\b", text_lower):
+                found.add(skill)
+        elif skill in text_lower:
+            found.add(skill)
+    return sorted(found)
+
 
 def test_clean_html():
     """Test HTML cleaning."""
@@ -37,6 +80,14 @@ def test_parse_salary_k_notation():
     assert sal_max == 80000
 
 
+def test_parse_salary_periods():
+    """Hourly and monthly salaries are annualized; repeated strings hit the cache."""
+    assert parse_salary("$40 - $55 / hour") == (83200, 114400, "USD")
+    assert parse_salary("£4.000 per month") == (48000, 48000, "GBP")
+    assert parse_salary("CAD 90k-110k annually, paid monthly") == (90000, 110000, "CAD")
+    assert parse_salary("£4.000 per month") is parse_salary("£4.000 per month")
+
+
 def test_parse_salary_empty():
     """Test empty salary."""
     sal_min, sal_max, currency = parse_salary("")
@@ -52,6 +103,99 @@ def test_extract_tags():
     assert "postgresql" in tags
 
 
+def test_extract_tags_matches_baseline_scan():
+    """The taxonomy matcher agrees with the original per-term scan.
+
+    The oracle is the pre-taxonomy ``KNOWN_SKILLS`` scan, frozen here, with
+    its tags renamed to their canonical skills. The only other difference
+    is the new ``js`` alias, which also fires on ``node.js`` and ``next.js``.
+    """
+    import random
+    import re
+
+    def expected(text):
+        tags = {LEGACY_TO_CANONICAL.get(tag, tag) for tag in _baseline_tags(text)}
+        if re.search(r"\bjs\b", text.lower()):
+            tags.add("javascript")
+        return sorted(tags)
+
+    rng = random.Random(7)
+    vocab = sorted(BASELINE_KNOWN_SKILLS) + ["interest", "error", "c#x", "r&d", "_go", "ai2", "é"]
+    texts = [
+        "PostgreSQL/MySQL, nosql; Go, golang, C#, c#x, R&D, AI-first, ruby on rails",
+        "restapi kafkaws pythonlp .net asp.net node.js nodejs mirror",
+    ] + [
+        rng.choice(["", " ", "-"]).join(
+            rng.choice(vocab) + rng.choice(["", " ", "#", "x", ".", "_"])
+            for _ in range(rng.randint(1, 8))
+        )
+        for _ in range(3000)
+    ]
+    for text in texts:
+        assert extract_tags(text) == expected(text), text
+
+
+def test_extract_tags_intended_differences_from_baseline():
+    """Legacy spellings are renamed and the new aliases add tags."""
+    cases = {
+        "Golang, Postgres, NodeJS, NextJS, k8s, Ruby on Rails": [
+            "go", "kubernetes", "next.js", "node.js", "postgresql", "rails", "ruby",
+        ],
+        "py, JS, TS, psql, csharp, dotnet, ReactJS, RoR": [
+            ".net", "c#", "javascript", "postgresql", "python", "rails", "react", "sql",
+            "typescript",
+        ],
+        "Node.js and Next.js": ["javascript", "next.js", "node.js"],
+        "error mirror": [],
+    }
+    for text, tags in cases.items():
+        assert extract_tags(text) == tags, text
+
+    assert _baseline_tags("Golang, Postgres, NodeJS, NextJS, k8s, Ruby on Rails") == [
+        "golang", "k8s", "nextjs", "nodejs", "postgres", "rails", "ruby", "ruby on rails",
+    ]
+    assert _baseline_tags("py, JS, TS, psql, csharp, dotnet, ReactJS, RoR") == ["react", "sql"]
+
+
+def test_retag_renames_legacy_tags():
+    """Stored pre-taxonomy spellings merge into the canonical skill; unknown tags stay."""
+    from app.utils.skills import get_skill_taxonomy
+    from cli.commands import _canonical_tags
+
+    stored = ["golang", "postgres", "NodeJS", "go", "Remote-first"]
+    assert _canonical_tags(stored, get_skill_taxonomy()) == {
+        "go", "postgresql", "node.js", "Remote-first",
+    }
+
+
+def test_skill_taxonomy_resolves_aliases():
+    """Aliases resolve to one canonical skill; conflicting terms are rejected."""
+    import pytest
+
+    from app.utils.skills import SkillTaxonomy
+
+    assert extract_tags("Golang and Postgres on K8s") == ["go", "kubernetes", "postgresql"]
+    taxonomy = SkillTaxonomy({"rails": {"aliases": ["ruby on rails"], "word_aliases": ["ror"]}})
+    assert taxonomy.find("RoR, not an error") == {"rails"}
+    assert taxonomy.find("mirror") == set()
+    with pytest.raises(ValueError):
+        SkillTaxonomy({"go": {"aliases": ["golang"]}, "golang": {}})
+
+
+def test_skills_score_honors_aliases_and_related():
+    """Aliases and related skills score 0.7 against a profile skill."""
+    import pytest
+
+    pytest.importorskip("sentence_transformers")
+    from app.ai.matcher import JobMatcher
+    from app.models import Job, UserProfile
+
+    matcher = JobMatcher(UserProfile(primary_skills=["JavaScript", "TypeScript", "C#"]))
+    job = Job(title="Engineer", description="JS and TS on .NET", requirements=None, tags=[])
+    assert matcher._skills_score(job) == pytest.approx(0.7 * 30)
+    assert extract_tags("JS/TS, dotnet, jsx") == [".net", "javascript", "typescript"]
+
+
 def test_remoteok_normalize():
     """Test RemoteOK job normalization."""
     source = RemoteOKSource()
@@ -75,3 +219,83 @@ def test_remoteok_normalize_skip_empty():
     source = RemoteOKSource()
     assert source.normalize({}) is None
     assert source.normalize({"position": "", "company": "", "url": ""}) is None
+
+
+def test_page_is_known_uses_watermark():
+    """A page is known only when every posting is seen or older than the watermark."""
+    from datetime import datetime, timezone
+
+    source = ArbeitnowSource()
+    source._watermark = {
+        "newest_posted_at": datetime(2026, 1, 10, tzinfo=timezone.utc),
+        "seen_urls": {"https://a"},
+    }
+    old = int(datetime(2026, 1, 1, tzinfo=timezone.utc).timestamp())
+    new = int(datetime(2026, 2, 1, tzinfo=timezone.utc).timestamp())
+
+    assert source._page_is_known([{"url": "https://a", "created_at": new}, {"url": "https://b", "created_at": old}])
+    assert not source._page_is_known([{"url": "https://a"}, {"url": "https://c", "created_at": new}])
+    assert not ArbeitnowSource()._page_is_known([{"url": "https://a"}])
+
+
+def test_simhash_near_duplicates_share_a_band():
+    """Reposted text stays within a few bits; unrelated text does not."""
+    from app.utils.simhash import bands, hamming, job_simhash, to_signed
+
+    description = (
+        "We are hiring a senior backend engineer to build APIs in Python and Go, "
+        "working with PostgreSQL, Redis and Kubernetes across a distributed team. "
+        "You will own services end to end, mentor engineers and improve reliability. "
+        "Our stack runs on AWS with Terraform, GitHub Actions and Datadog for observability. "
+        "We value clear writing, small pull requests and thoughtful code review. "
+        "Benefits include a home-office budget, flexible hours, a yearly team retreat "
+        "and a learning allowance. Salary range is $120,000 - $150,000 depending on experience."
+    )
+    a = to_signed(job_simhash("Senior Backend Engineer", "Acme", description))
+    b = to_signed(job_simhash("Senior Backend Engineer", "ACME", description + " Apply now!"))
+    other = "Design delightful mobile apps in Figma."
+    c = to_signed(job_simhash("Product Designer", "Other Co", other))
+
+    assert hamming(a, b) <= 3
+    assert set(bands(a)) & set(bands(b))
+    assert hamming(a, c) > 10
+
+
+def test_canonicalize_url():
+    """Scheme, host case, tracking params and trailing slashes don't create new URLs."""
+    from app.utils.urls import canonicalize_url, url_hash
+
+    assert canonicalize_url("HTTP://RemoteOK.com:80/jobs/123/?utm_source=x&b=2&a=1#apply") == (
+        "https://remoteok.com/jobs/123?a=1&b=2"
+    )
+    assert canonicalize_url("https://example.com/") == "https://example.com"
+    assert canonicalize_url("mailto:jobs@example.com") == "mailto:jobs@example.com"
+    assert url_hash("http://example.com/job?ref_src=rss") == url_hash("https://example.com/job")
+    assert url_hash("https://careers.example.com/#/jobs/123") != url_hash(
+        "https://careers.example.com/#/jobs/456"
+    )
+    assert canonicalize_url("https://example.com/#!/jobs/7?utm_source=x") == (
+        "https://example.com#!/jobs/7?utm_source=x"
+    )
+    assert len(url_hash("https://example.com/job")) == 16
+
+
+def test_batch_extraction_matches_single_calls():
+    """Batch helpers return per-text results in order, in-process or pooled."""
+    from concurrent.futures import ProcessPoolExecutor
+
+    from app.utils.parsers import extract_tags_batch, parse_salary_batch
+
+    texts = ["Python and React", None, "Go with PostgreSQL", "Python and React", ""]
+    assert extract_tags_batch(texts) == [extract_tags(t) for t in texts]
+    repeated = texts * 3
+    expected = [extract_tags(t) for t in repeated]
+    assert extract_tags_batch(repeated, workers=2, chunk_size=4) == expected
+    with ProcessPoolExecutor(max_workers=2) as pool:
+        for n in (1, 3, 40):  # one chunk per worker, each call reusing the pool
+            assert extract_tags_batch(texts * n, workers=2, chunk_size=4, executor=pool) == [
+                extract_tags(t) for t in texts * n
+            ]
+
+    salaries = ["$50,000 - $80,000", "€60k", None, "$50,000 - $80,000"]
+    assert parse_salary_batch(salaries) == [parse_salary(s) for s in salaries]
@@ -0,0 +1,125 @@
+"""Database-backed tests for saving jobs and linking near-duplicates."""
+
+import uuid
+
+from sqlalchemy import select
+
+from app.models import Job
+from app.sources.base import BaseSource
+from app.sources.dedupe import link_near_duplicates, normalize_company, normalize_name
+from app.utils.simhash import bands, job_simhash, to_signed
+from app.utils.urls import url_hash
+
+DESCRIPTION = (
+    "Acme builds logistics software for independent retailers across Europe and the "
+    "Americas. We are a remote-first company of sixty people with a strong writing "
+    "culture, generous parental leave, a learning budget and a yearly offsite. You will "
+    "join a small product team, own services end to end, review code, mentor peers and "
+    "talk to customers every week. We use Python, PostgreSQL, Redis and Kubernetes."
+)
+
+
+def make_job(title: str, company: str, source: str, description: str = DESCRIPTION) -> Job:
+    """A Job row as ``BaseSource`` would store it, with a unique URL."""
+    url = f"https://{source}.example.com/jobs/{uuid.uuid4()}"
+    fingerprint = to_signed(job_simhash(title, company, description))
+    return Job(
+        title=title,
+        company=company,
+        description=description,
+        url=url,
+        url_hash=url_hash(url),
+        source=source,
+        simhash=fingerprint,
+        simhash_bands=bands(fingerprint),
+    )
+
+
+class StoredSource(BaseSource):
+    """Normalizes ``{"path": ...}`` into a job, without any network access."""
+
+    source_name = "storage_test"
+
+    async def fetch(self) -> list[dict]:
+        return []
+
+    def normalize(self, raw_job: dict) -> dict | None:
+        return {
+            "title": f"Engineer {raw_job['path']}",
+            "company": "Acme",
+            "description": f"Posting {raw_job['path']} at Acme.",
+            "url": f"https://storage.example.com/{raw_job['path']}?utm_source=feed",
+            "tags": ["python", "go"],
+        }
+
+
+def stored_jobs(source: StoredSource, *paths: str) -> list[dict]:
+    """Rows as ``collect`` produces them (url_hash, simhash bands, ...)."""
+    run = uuid.uuid4().hex
+    return source._normalize_page([{"path": f"{run}/{p}"} for p in paths])
+
+
+def test_save_counts_across_chunks_and_in_chunk_duplicates(committing_db):
+    """Chunked INSERT ... RETURNING counts only rows that were actually new."""
+    source = StoredSource()
+    existing, *_ = jobs = stored_jobs(source, "a", "b", "b", "c", "d", "d", "e")
+    assert source.save([existing], committing_db) == 1
+
+    # chunks of 2: [a, b] [b, c] [d, d] [e]
+    assert source.save(jobs, committing_db, chunk_size=2) == 4
+    urls = {job["url"] for job in jobs}
+    stored = committing_db.scalars(select(Job).where(Job.url.in_(urls))).all()
+    assert len(stored) == 5
+    assert all(job.url.endswith("?utm_source=feed") for job in stored)  # stored as given
+    assert source.save(jobs, committing_db, chunk_size=3) == 0
+
+
+def test_save_copy_merges_staging_rows(committing_db):
+    """COPY + merge skips stored and repeated URLs and round-trips array/bytes columns."""
+    source = StoredSource()
+    existing, *_ = jobs = stored_jobs(source, "a", "b", "b", "c")
+    jobs[2] = {**jobs[2], "tags": ["repeat"]}  # same URL as jobs[1] within the staging batch
+    assert source.save([existing], committing_db) == 1
+
+    assert source.save_copy(jobs, committing_db) == 2
+    stored = {
+        job.url: job
+        for job in committing_db.scalars(select(Job).where(Job.url.in_({j["url"] for j in jobs})))
+    }
+    assert len(stored) == 3
+    for job in (jobs[1], jobs[3]):
+        row = stored[job["url"]]
+        assert row.url_hash == job["url_hash"]
+        assert row.simhash_bands == job["simhash_bands"]
+        assert row.simhash == job["simhash"]
+    assert stored[jobs[3]["url"]].tags == ["python", "go"]
+    assert stored[jobs[3]["url"]].salary_currency == "USD"  # model default, not in the row
+    assert stored[jobs[1]["url"]].tags in (["python", "go"], ["repeat"])
+
+
+def test_normalize_company_drops_legal_suffixes():
+    """Titles and companies compare without case, punctuation or legal suffixes."""
+    assert normalize_company("Acme, Inc.") == normalize_company("ACME") == "acme"
+    assert normalize_name("Sr. Backend-Engineer (Remote)") == "sr backend engineer remote"
+
+
+def test_link_near_duplicates_requires_title_company_and_other_source(db):
+    """Only a cross-source posting of the same role at the same company is linked."""
+    original = make_job("Senior Backend Engineer", "Acme", "remoteok")
+    db.add(original)
+    db.flush()
+
+    same_role = make_job("Senior Backend Engineer", "ACME", "remotive", DESCRIPTION + " Apply now!")
+    # Shared boilerplate keeps this within the SimHash distance (2 bits)
+    other_role = make_job("Senior Frontend Engineer", "Acme", "remotive")
+    same_source = make_job("Senior Backend Engineer", "Acme", "remoteok")
+    new_jobs = [same_role, other_role, same_source]
+    db.add_all(new_jobs)
+    db.flush()
+
+    assert link_near_duplicates(db, [job.id for job in new_jobs]) == 1
+    db.expire_all()
+    assert same_role.canonical_job_id == original.id
+    assert other_role.canonical_job_id is None
+    assert same_source.canonical_job_id is None
+    assert original.canonical_job_id is None